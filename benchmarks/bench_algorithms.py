@@ -0,0 +1,188 @@
+"""
+Benchmark algoritma exact matching
+Tujuan: Bandingkan KMP, BM, Horspool, Sunday, Two-Way, Aho-Corasick, dan
+        baseline str.find per panjang keyword dan jumlah keyword, lalu
+        keluarkan aturan AUTO_ALGORITHM_RULES / AUTO_AC_MIN_KEYWORDS untuk config.py
+
+Jalankan dari root repo:
+    python benchmarks/bench_algorithms.py
+    python benchmarks/bench_algorithms.py --cached 300 --repeat 5
+"""
+
+import sys
+import time
+import random
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.algorithm.CompiledQuery import CompiledQuery, ENGINES, autoAlgorithm
+from src.algorithm.FoldedText import foldCorpus
+
+# baseline, gak ikut dipilih untuk AUTO (yang diukur algoritma buatan sendiri)
+BASELINE = 'FIND'
+
+# (label, panjang minimal, panjang maksimal)
+LENGTH_BUCKETS = (
+    ("1-3", 1, 3),
+    ("4-5", 4, 5),
+    ("6-8", 6, 8),
+    ("9-12", 9, 12),
+    ("13+", 13, 40),
+)
+KEYWORD_COUNTS = (1, 2, 4, 6, 8, 12, 16)
+
+
+# ===== Data =====
+
+VOCAB = (
+    "python sql java react node javascript typescript docker kubernetes aws azure "
+    "excel powerpoint accounting finance budget forecasting payroll audit tax "
+    "managed led developed designed implemented supervised coordinated trained "
+    "customer service sales marketing retail hospitality chef kitchen menu "
+    "engineer analyst manager assistant director consultant specialist teacher "
+    "university bachelor master degree certificate diploma school college "
+    "communication leadership teamwork problem solving project management agile "
+    "jakarta bandung indonesia new york california texas florida 2015 2018 2020 present"
+).split()
+PUNCT = ["", "", "", ",", ".", ";", ":"]
+
+
+def syntheticCV(rng, words=1200):
+    parts = []
+    for _ in range(words):
+        word = rng.choice(VOCAB)
+        if rng.random() < 0.15:
+            word = word.capitalize()
+        parts.append(word + rng.choice(PUNCT))
+    return " ".join(parts)
+
+
+def cachedTexts(limit):
+    """Teks asli (varian matching) dari TextCache kalau ada"""
+    try:
+        from src.pdfprocessor.textCache import TextCache
+        cache = TextCache()
+        rows = cache.conn.execute("SELECT text FROM cv_text LIMIT ?", (limit,)).fetchall()
+        cache.close()
+        return [row[0] for row in rows if row[0]]
+    except Exception as e:
+        print(f"[INFO] Text cache tidak dipakai: {e}")
+        return []
+
+
+def sampleKeywords(rng, texts, low, high, count):
+    """Ambil potongan teks asli sepanjang low..high (sebagian pasti ketemu), plus satu yang gak ada"""
+    keywords = []
+    while len(keywords) < count - 1:
+        text = rng.choice(texts)
+        length = rng.randint(low, high)
+        if len(text) <= length:
+            continue
+        start = rng.randrange(len(text) - length)
+        keyword = text[start:start + length]
+        if keyword.strip() == keyword and keyword:
+            keywords.append(keyword)
+    keywords.append("zq" * ((low + 1) // 2 + 1))  # gak ada di corpus
+    return keywords
+
+
+# ===== Pengukuran =====
+
+def bench(algorithm, keywords, docs, repeat):
+    """Waktu terbaik (ms) compile + search semua dokumen, plus hasilnya buat dicek"""
+    best = float("inf")
+    results = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        query = CompiledQuery(keywords, algorithm, caseSensitive=False)
+        results = [query.searchMultiple(doc, folded=True) for doc in docs]
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, results
+
+
+def benchLengths(rng, texts, docs, repeat, perBucket):
+    """Satu keyword per query, dikelompokkan per panjang keyword"""
+    names = list(ENGINES) + ['AC']
+    print(f"{'panjang':<9}" + "".join(f"{name:>10}" for name in names) + "   terbaik")
+    rules = []
+    for label, low, high in LENGTH_BUCKETS:
+        keywords = sampleKeywords(rng, texts, low, high, perBucket)
+        totals = dict.fromkeys(names, 0.0)
+        for keyword in keywords:
+            expected = None
+            for name in names:
+                ms, results = bench(name, [keyword], docs, repeat)
+                totals[name] += ms
+                if expected is None:
+                    expected = results
+                elif results != expected:
+                    raise AssertionError(f"{name} beda hasil untuk keyword {keyword!r}")
+        candidates = {name: ms for name, ms in totals.items() if name != BASELINE}
+        winner = min(candidates, key=candidates.get)
+        print(f"{label:<9}" + "".join(f"{totals[name]:>10.1f}" for name in names) + f"   {winner}")
+        rules.append((high, winner))
+
+    # gabungkan bucket berurutan yang pemenangnya sama, bucket terakhir = sisanya
+    merged = []
+    for high, winner in rules:
+        if merged and merged[-1][1] == winner:
+            merged[-1] = (high, winner)
+        else:
+            merged.append((high, winner))
+    merged[-1] = (None, merged[-1][1])
+    return tuple(merged)
+
+
+def benchCounts(rng, texts, docs, repeat, rules):
+    """Banyak keyword sekaligus: engine per keyword (aturan panjang) vs satu scan Aho-Corasick"""
+    print(f"\n{'keyword':<9}{'per-kw':>10}{'AC':>10}   terbaik")
+    acMin = 0
+    for count in KEYWORD_COUNTS:
+        keywords = []
+        for _ in range(count):
+            _, low, high = rng.choice(LENGTH_BUCKETS)
+            keywords += sampleKeywords(rng, texts, low, high, 2)[:1]
+        perKeyword = sum(
+            bench(autoAlgorithm(k, 1, rules, 0), [k], docs, repeat)[0] for k in keywords
+        )
+        ac, _ = bench('AC', keywords, docs, repeat)
+        winner = 'AC' if ac < perKeyword else 'per-kw'
+        print(f"{count:<9}{perKeyword:>10.1f}{ac:>10.1f}   {winner}")
+        if winner == 'AC' and not acMin:
+            acMin = count
+        elif winner != 'AC':
+            acMin = 0  # AC harus menang terus mulai dari titik ini
+    return acMin
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark algoritma exact matching untuk mode AUTO")
+    parser.add_argument("--docs", type=int, default=100, help="jumlah CV sintetis")
+    parser.add_argument("--cached", type=int, default=0, help="pakai N teks dari text cache juga")
+    parser.add_argument("--keywords", type=int, default=6, help="keyword per bucket panjang")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    texts = [syntheticCV(rng) for _ in range(args.docs)]
+    if args.cached:
+        texts += cachedTexts(args.cached)
+    # mode default GUI: case-insensitive di atas companion fold
+    docs = [folded.folded for folded in foldCorpus(dict(enumerate(texts))).values()]
+    total_mb = sum(len(t) for t in docs) / 1e6
+    print(f"{len(docs)} dokumen, {total_mb:.2f} M karakter, best of {args.repeat} (ms, case-insensitive)\n")
+
+    rules = benchLengths(rng, docs, docs, args.repeat, args.keywords)
+    acMin = benchCounts(rng, docs, docs, args.repeat, rules)
+
+    print("\nSaran untuk config.py:")
+    print(f"AUTO_ALGORITHM_RULES = {rules!r}")
+    print(f"AUTO_AC_MIN_KEYWORDS = {acMin}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+"""
+Benchmark normalisasi teks CV
+Tujuan: Bandingkan rantai re.sub lama (cleanseText, cleanseTextN,
+        seperatePunctuations) dengan pipeline yang polanya sudah dikompilasi
+
+Jalankan dari root repo:
+    python benchmarks/bench_normalize.py
+    python benchmarks/bench_normalize.py --cached 200 --repeat 5
+"""
+
+import re
+import sys
+import time
+import random
+import argparse
+import unicodedata
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.pdfprocessor.regexExtractor import RegexExtractor
+
+
+# ===== Implementasi lama (rantai re.sub), disalin apa adanya untuk pembanding =====
+
+def legacyCleanseText(text):
+    cleaned_text = unicodedata.normalize('NFKC', text)
+    cleaned_text = re.sub(r'[\x00-\x1F\x7F]', '', cleaned_text)
+    cleaned_text = re.sub(r'[•▪●◦\uf0b7\u2022\u25cf]', '', cleaned_text)
+    cleaned_text = re.sub(r'\s+', ' ', cleaned_text)
+    cleaned_text = cleaned_text.strip()
+    cleaned_text = re.sub(r'\s+([,.;:!?])', r'\1', cleaned_text)
+    return cleaned_text
+
+
+def legacyCleanseTextN(text):
+    cleaned_text = unicodedata.normalize('NFKC', text)
+    cleaned_text = re.sub(r'[\x00-\x09\x0B-\x1F\x7F]', '', cleaned_text)
+    cleaned_text = re.sub(r'[•▪●◦\uf0b7\u2022\u25cf]', '', cleaned_text)
+    cleaned_text = re.sub(r'[ \t]+', ' ', cleaned_text)
+    cleaned_text = re.sub(r'\n{3,}', '\n\n', cleaned_text)
+    cleaned_text = cleaned_text.strip()
+    cleaned_text = re.sub(r'\s+([,.;:!?])', r'\1', cleaned_text)
+    return cleaned_text
+
+
+def legacySeperatePunctuations(text):
+    if not text:
+        return ""
+    text = re.sub(r'(\S)([^\w\s])', r'\1 \2', text)
+    text = re.sub(r'([^\w\s])(\S)', r'\1 \2', text)
+    text = re.sub(r'\s+', ' ', text).strip()
+    return text
+
+
+# ===== Data =====
+
+WORDS = (
+    "Managed team of engineers Python SQL Java React data analysis budget "
+    "customer service 2015 - 2020 Jakarta, Indonesia. Skills: Excel; C++ node.js"
+).split()
+NOISE = ["\n", "\n\n\n", "\t", "  ", " • ", "", "\x0c", "\xa0", " ,", " .", "!", " ", "  :"]
+
+
+def syntheticCV(rng, words=1500):
+    parts = []
+    for _ in range(words):
+        parts.append(rng.choice(WORDS))
+        parts.append(rng.choice(NOISE) if rng.random() < 0.25 else " ")
+    return "".join(parts)
+
+
+def cachedTexts(limit):
+    """Teks asli dari TextCache kalau ada (varian newline, paling mirip output pypdf)"""
+    try:
+        from src.pdfprocessor.textCache import TextCache
+        cache = TextCache()
+        rows = cache.conn.execute("SELECT text_n FROM cv_text LIMIT ?", (limit,)).fetchall()
+        cache.close()
+        return [row[0] for row in rows if row[0]]
+    except Exception as e:
+        print(f"[INFO] Text cache tidak dipakai: {e}")
+        return []
+
+
+def bench(func, texts, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in texts:
+            func(text)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark normalisasi teks CV")
+    parser.add_argument("--docs", type=int, default=200, help="jumlah CV sintetis")
+    parser.add_argument("--cached", type=int, default=0, help="pakai N teks dari text cache juga")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    texts = [syntheticCV(rng) for _ in range(args.docs)]
+    if args.cached:
+        texts += cachedTexts(args.cached)
+    total_mb = sum(len(t) for t in texts) / 1e6
+    print(f"{len(texts)} dokumen, {total_mb:.2f} M karakter, best of {args.repeat}\n")
+
+    regex = RegexExtractor()
+    cases = [
+        ("cleanseText", legacyCleanseText, regex.cleanseText, True),
+        ("cleanseTextN", legacyCleanseTextN, regex.cleanseTextN, True),
+        # versi baru memisahkan setiap tanda baca (versi lama kadang menyisakan pasangan seperti "!1")
+        ("seperatePunctuations", legacySeperatePunctuations, regex.seperatePunctuations, False),
+    ]
+    print(f"{'fungsi':<22}{'lama (ms)':>12}{'baru (ms)':>12}{'speedup':>10}  output")
+    for name, old, new, mustEqual in cases:
+        same = sum(old(t) == new(t) for t in texts)
+        if mustEqual and same != len(texts):
+            print(f"[ERROR] {name}: {len(texts) - same} dokumen beda output")
+            return 1
+        old_ms = bench(old, texts, args.repeat)
+        new_ms = bench(new, texts, args.repeat)
+        print(f"{name:<22}{old_ms:>12.1f}{new_ms:>12.1f}{old_ms / new_ms:>9.2f}x  {same}/{len(texts)} sama")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
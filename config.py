@@ -7,17 +7,38 @@ DATABASE_CONFIG = {
     'user': 'root',
     'password': '',
     'database': 'ats_database',
-    'port': 3306
+    'port': 3306,
+    'pool_size': 5,           # jumlah koneksi di connection pool
+    'pool_timeout': 30        # detik menunggu koneksi kosong dari pool
 }
 
 # File Paths
 BASE_DIR = Path(__file__).parent
 DATA_DIR = BASE_DIR / 'src' / 'archive' / 'data' / 'data'
 RESUME_CSV_PATH = BASE_DIR / 'src' / 'archive' / 'Resume' / 'Resume.csv'
+INDEX_PATH = DATA_DIR.parent / 'cv_index.pkl'  # inverted index hasil ekstraksi CV
+CACHE_DIR = BASE_DIR / 'cache'
+TEXT_CACHE_PATH = CACHE_DIR / 'cv_text.sqlite3'  # cache teks hasil ekstraksi PDF
+CORPUS_DIR = CACHE_DIR / 'corpus'  # corpus CV yang di-mmap (engine 'buffer')
 
 # Algorithm Settings
 FUZZY_MATCH_THRESHOLD = 0.7  # buat fuzzy matching, minimum similarity
 MAX_RESULTS_DISPLAY = 50     # maximal yang diperlihatkan resultny
+COMPILED_QUERY_CACHE_SIZE = 32  # jumlah query terkompilasi yang disimpan (LRU)
+# Algoritma 'AUTO': engine per keyword, angka dari python benchmarks/bench_algorithms.py
+AUTO_ALGORITHM_RULES = ((3, 'SUNDAY'), (None, 'HORSPOOL'))  # (panjang keyword maksimal, engine), None = sisanya
+AUTO_AC_MIN_KEYWORDS = 6   # mulai jumlah keyword segini pakai Aho-Corasick (satu scan untuk semua)
+SEARCH_ENGINE = 'index'  # 'index' (inverted + fuzzy index), 'buffer' (satu buffer bytes semua CV + fuzzy index), atau 'parallel' (scan CV di semua core)
+SEARCH_WORKERS = None    # jumlah proses untuk engine 'parallel', None = jumlah core
+
+# PDF Extraction
+EXTRACT_MODE = 'process'   # 'process' (default, pypdf CPU-bound) atau 'thread'
+EXTRACT_WORKERS = None     # None = jumlah core
+EXTRACT_CHUNK_SIZE = 0     # PDF per task ke worker, 0 = otomatis
+
+# Database Seeding
+SEED_COUNT = 30            # jumlah applicant default yang di-generate seeder
+SEED_BATCH_SIZE = 1000     # baris per executemany / transaksi di mode bulk
 
 # GUI Settings
 WINDOW_TITLE = "ATS CV Digital - Pattern Matching System"
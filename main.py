@@ -2,7 +2,6 @@ import sys
 import time
 import webbrowser
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from tkinter import (
     Tk, Frame, Label, Entry, Button, Scale, Spinbox,
@@ -14,15 +13,46 @@ from tkinter.ttk import Combobox
 # ensure src folder is importable
 sys.path.append(str(Path(__file__).parent / "src"))
 
-from config import DATABASE_CONFIG, DATA_DIR
-from src.database.connection import DatabaseConnection
-from src.database.queries import get_all_cv_paths, get_summary_data_by_cv_path
+from config import DATABASE_CONFIG, DATA_DIR, INDEX_PATH, SEARCH_ENGINE, SEARCH_WORKERS
+from src.database.connection import DatabaseConnection, getPool
+from src.database.queries import (
+    get_all_cv_paths, get_summary_data_by_cv_path, get_result_cards_by_cv_paths,
+    load_profile_cache
+)
 from src.models.ResultCard import ResultCard
 from src.algorithm.PatternMatcher import PatternMatcher
-from src.pdfprocessor.pdfExtractor import PDFExtractor
+from src.algorithm.InvertedIndex import InvertedIndex
+from src.algorithm.FuzzyIndex import FuzzyIndex
+from src.algorithm.FoldedText import foldCorpus
+from src.algorithm.CorpusBuffer import CorpusBuffer
+from src.algorithm.ParallelSearch import ParallelSearchExecutor
+from src.pdfprocessor.pdfExtractor import sharedPDFExtractor
+from src.pdfprocessor.textCache import TextCache
+from src.pdfprocessor.corpusStore import CorpusStore
+from src.pdfprocessor.batchExtractor import extractMany, backfillSections
+from src.utils.JobRunner import JobRunner
 
 DEFAULT_MAX_CV_LOAD = 100
 
+# label di combobox -> kode algoritma (PatternMatcher / CompiledQuery)
+ALGORITHM_CHOICES = {
+    "Knuth-Morris-Pratt (KMP)": "KMP",
+    "Boyer-Moore": "BM",
+    "Aho-Corasick (AC)": "AC",
+    "Auto (per keyword)": "AUTO",
+    "Horspool": "HORSPOOL",
+    "Sunday (Quick Search)": "SUNDAY",
+    "Two-Way": "TWOWAY",
+    "str.find (baseline)": "FIND",
+}
+
+# keterangan di sebelah combobox: kapan algoritma terpilih benar-benar dipakai
+ALGORITHM_SCOPE = {
+    'index': "single words use the index; algorithm verifies phrases",
+    'parallel': "algorithm scans every CV",
+    'buffer': "buffer engine always uses bytes.find",
+}
+
 
 class RetroStyle:
     # Windows 98/Vista colors
@@ -340,9 +370,21 @@ class ATSApp:
     def __init__(self, root, db_conn):
         self.root = root
         self.db = db_conn
+        # query metadata lewat pool, jadi thread job gak rebutan satu koneksi
+        self.pool = getPool()
         self.matcher = PatternMatcher()
-        self.extractor = PDFExtractor()
+        self.extractor = sharedPDFExtractor
+        self.text_cache = TextCache()
+        self.corpus_store = CorpusStore()  # corpus di-mmap untuk engine 'buffer'
         self.cache = {}
+        self.folded = {}  # cv_path -> FoldedText, companion case-insensitive dari preload
+        self.index = None
+        self.corpus_buffers = {}  # case_sensitive -> CorpusBuffer (engine 'buffer')
+        self.fuzzy_index = FuzzyIndex()
+        self.search_executor = None
+        self.ready = False  # True setelah preload + search engine siap
+        self._shown_top = None  # top-N yang lagi tampil (path, total)
+        self.jobs = JobRunner(root)
         self.max_cv_load = DEFAULT_MAX_CV_LOAD  # Will be set by user
 
         self._setup_retro_window()
@@ -357,7 +399,7 @@ class ATSApp:
     def _ask_cv_load_count(self):
         """Ask user how many CVs to load"""
         # Get total CV count first
-        all_paths = get_all_cv_paths(self.db.connection)
+        all_paths = get_all_cv_paths(self.pool)
         total_cvs = len(all_paths)
         
         if total_cvs == 0:
@@ -379,7 +421,7 @@ class ATSApp:
 
     def _preload_cvs_with_progress(self):
         """Load CVs with progress indication"""
-        all_paths = get_all_cv_paths(self.db.connection)
+        all_paths = get_all_cv_paths(self.pool)
         paths = all_paths[:self.max_cv_load]
         
         # Show loading dialog
@@ -436,37 +478,64 @@ class ATSApp:
             self.root.after(500, self._animate_loading_dots)
 
     def _do_preload(self, paths):
-        """Actually preload the CVs"""
+        """Preload CV di background, progress dikirim ke loading dialog"""
+        self.ready = False
         self.loading_status.set(f"Loading {len(paths)} CVs from database...")
+        self.jobs.submit(
+            'preload', lambda job: self._preload_job(job, paths),
+            onProgress=self._on_preload_progress,
+            onDone=self._on_preload_done,
+            onError=self._on_preload_error,
+        )
+
+    def _preload_job(self, job, paths):
+        """Jalan di thread job: load teks CV lalu siapkan search engine"""
         start = time.time()
-        
-        loaded_count = 0
-        with ThreadPoolExecutor(max_workers=4) as pool:
-            futures = {
-                pool.submit(
-                    self.extractor.PDFExtractForMatch,
-                    str((Path(DATA_DIR)/Path(p).relative_to("data")).resolve())
-                ): p
-                for p in paths
-            }
-            
-            for fut in as_completed(futures):
-                p = futures[fut]
-                try:
-                    self.cache[p] = fut.result()
-                    loaded_count += 1
-                    
-                    # Update progress
-                    if hasattr(self, 'loading_status'):
-                        self.loading_status.set(f"Loaded {loaded_count}/{len(paths)} CVs...")
-                        self.root.update()
-                        
-                except Exception as e:
-                    self.cache[p] = ""
-                    print(f"Error loading {p}: {e}")
-        
+        progress = lambda loaded_count, total: job.progress(f"Loaded {loaded_count}/{total} CVs...")
+        if SEARCH_ENGINE == 'buffer':
+            texts = self._load_corpus_store(paths, progress)
+        else:
+            texts = self._load_cv_texts(paths, progress)
+        job.checkCancelled()
+
+        # semua profil pelamar diambil sekali di awal, card/summary tinggal baca cache
+        job.progress("Loading applicant profiles...")
+        load_profile_cache(self.pool)
+
+        job.progress("Preparing search engine...")
+        index = executor = None
+        folded = {}
+        buffers = {}
+        fuzzy_index = FuzzyIndex()
+        if SEARCH_ENGINE == 'parallel':
+            # worker bikin companion fold sendiri untuk shard-nya
+            executor = self._load_search_executor(texts)
+        else:
+            if SEARCH_ENGINE == 'buffer':
+                # blob teks asli dan teks fold langsung dicari dari mmap
+                # (kalau store gak kebuka, buffer dibangun di memori waktu search)
+                if self.corpus_store.isOpen():
+                    buffers = {cs: self.corpus_store.buffer(cs) for cs in (False, True)}
+            else:
+                index = self._sync_index(texts)
+                # teks casefold dihitung sekali, search case-insensitive tinggal pakai
+                folded = foldCorpus(texts)
+            job.checkCancelled()
+            # default UI case-insensitive, jadi mode itu yang dibangun duluan
+            self._build_fuzzy_index(fuzzy_index, texts, case_sensitive=False)
+
         elapsed = (time.time()-start)*1000
-        
+        return texts, folded, index, buffers, fuzzy_index, executor, elapsed
+
+    def _on_preload_progress(self, message):
+        if hasattr(self, 'loading_dialog') and self.loading_dialog.winfo_exists():
+            self.loading_status.set(message)
+
+    def _on_preload_done(self, result):
+        (self.cache, self.folded, self.index, self.corpus_buffers,
+         self.fuzzy_index, self.search_executor, elapsed) = result
+        self.ready = True
+
         # Close loading dialog
         if hasattr(self, 'loading_dialog'):
             self.loading_dialog.destroy()
@@ -476,6 +545,141 @@ class ATSApp:
         
         print(f"[INFO] Loaded {len(self.cache)} CVs in {elapsed:.1f} ms")
 
+    def _on_preload_error(self, error):
+        if hasattr(self, 'loading_dialog'):
+            self.loading_dialog.destroy()
+        print(f"[ERROR] Preload gagal: {error}")
+        messagebox.showerror("Load Failed", f"Could not load CVs:\n{error}")
+        self.time_var.set("Failed to load CVs.")
+
+    def _cv_full_path(self, cv_path):
+        """Path lengkap file PDF dari cv_path di database ('data/ROLE/x.pdf')"""
+        return str((Path(DATA_DIR)/Path(cv_path).relative_to("data")).resolve())
+
+    def _load_cv_texts(self, paths, progress=None):
+        """
+        Ambil teks CV: baca dulu dari TextCache di disk, PDF yang baru/berubah
+        saja yang diekstrak ulang lalu disimpan ke cache
+
+        Mengembalikan:
+            dict: cv_path -> teks
+        """
+        full_paths = {p: self._cv_full_path(p) for p in paths}
+        cached, missing = self.text_cache.getMany(full_paths)
+        texts = dict(cached)
+        loaded_count = len(cached)
+        print(f"[INFO] {len(cached)} CVs from text cache, {len(missing)} to extract")
+        if progress:
+            progress(loaded_count, len(paths))
+
+        new_entries = []
+        timings = []
+        todo = {p: full_paths[p] for p in missing}
+        for p, text, text_n, sections, ms, error in extractMany(todo):
+            timings.append(ms)
+            if error:
+                texts[p] = ""
+                print(f"Error loading {p}: {error}")
+                continue
+            texts[p] = text
+            new_entries.append((p, full_paths[p], text, text_n, sections))
+            loaded_count += 1
+            if progress:
+                progress(loaded_count, len(paths))
+
+        if timings:
+            print(f"[INFO] Extracted {len(timings)} PDFs: "
+                  f"avg {sum(timings)/len(timings):.1f} ms/file, max {max(timings):.1f} ms")
+        self.text_cache.putMany(new_entries)
+        # CV dari cache lama belum punya sections (skills, pengalaman, dll),
+        # dihitung sekali di sini supaya Summary gak perlu parse ulang
+        backfilled = backfillSections(self.text_cache, full_paths, texts)
+        if backfilled:
+            print(f"[INFO] Computed sections for {backfilled} cached CVs")
+        # urutan sama dengan urutan dari database
+        return {p: texts[p] for p in paths if p in texts}
+
+    def _load_corpus_store(self, paths, progress=None):
+        """
+        Engine 'buffer': buka corpus yang di-mmap kalau isinya masih sama dengan
+        TextCache; kalau tidak, teks di-load seperti biasa lalu corpus ditulis ulang
+
+        Mengembalikan:
+            Mapping: cv_path -> teks, dibaca lazy dari mmap (urutan sama dengan paths)
+        """
+        full_paths = {p: self._cv_full_path(p) for p in paths}
+        if self.corpus_store.open(self._corpus_fingerprints(full_paths)):
+            print(f"[INFO] {len(paths)} CVs from corpus store (mmap)")
+            if progress:
+                progress(len(paths), len(paths))
+            return self.corpus_store.texts()
+
+        texts = self._load_cv_texts(paths, progress)
+        self.corpus_store.write(texts, self._corpus_fingerprints(full_paths))
+        if not self.corpus_store.open():
+            return texts
+        # dict str-nya dilepas, selanjutnya teks dibaca dari mmap
+        return self.corpus_store.texts()
+
+    def _corpus_fingerprints(self, full_paths):
+        """
+        Fingerprint per CV untuk corpus store: SHA-1 PDF dari TextCache
+
+        CV yang gak ada di TextCache (ekstraksi gagal, disimpan sebagai teks
+        kosong) dapat fingerprint dari ukuran + mtime file PDF-nya, jadi store
+        tetap valid sampai PDF itu berubah dan gak ditulis ulang tiap startup.
+
+        Mengembalikan:
+            dict: cv_path -> fingerprint (urutan sama dengan full_paths)
+        """
+        fingerprints, missing = self.text_cache.fingerprints(full_paths)
+        for p in missing:
+            try:
+                st = Path(full_paths[p]).stat()
+                fingerprints[p] = ('failed', st.st_size, st.st_mtime_ns)
+            except OSError:
+                fingerprints[p] = ('failed', None, None)
+        return {p: fingerprints[p] for p in full_paths}
+
+    def _sync_index(self, texts):
+        """Load inverted index dari disk, index ulang CV yang baru/berubah saja"""
+        start = time.time()
+        index = InvertedIndex.load(INDEX_PATH)
+        if index.sync(texts):
+            try:
+                index.save(INDEX_PATH)
+            except OSError as e:
+                print(f"[WARN] Gagal menyimpan index: {e}")
+        elapsed = (time.time()-start)*1000
+        print(f"[INFO] Index ready: {len(index.postings)} terms in {elapsed:.1f} ms")
+        return index
+
+    def _build_fuzzy_index(self, fuzzy_index, texts, case_sensitive):
+        """Bangun BK-tree kosakata + postings kata untuk fuzzy search"""
+        start = time.time()
+        fuzzy_index.build(texts, case_sensitive)
+        elapsed = (time.time()-start)*1000
+        vocab = len(fuzzy_index.modes[case_sensitive]['postings'])
+        print(f"[INFO] Fuzzy index ready: {vocab} words in {elapsed:.1f} ms")
+
+    def _load_search_executor(self, texts):
+        """Bagi CV ke proses worker untuk engine 'parallel'"""
+        start = time.time()
+        executor = self.search_executor or ParallelSearchExecutor(SEARCH_WORKERS)
+        executor.load(texts)
+        elapsed = (time.time()-start)*1000
+        print(f"[INFO] {len(executor.workers)} search workers ready in {elapsed:.1f} ms")
+        return executor
+
+    def shutdown(self):
+        """Bereskan resource background sebelum aplikasi keluar"""
+        self.jobs.cancel('search')
+        self.jobs.cancel('preload')
+        if self.search_executor is not None:
+            self.search_executor.shutdown()
+        self.text_cache.close()
+        self.corpus_store.close()
+
     def _create_retro_button(self, parent, text, command, width=None):
         """Create retro 3D button with classic Windows style"""
         btn = Button(parent, text=text, command=command,
@@ -559,11 +763,22 @@ class ATSApp:
               bg=RetroStyle.BG_WINDOW, fg=RetroStyle.TEXT_MAIN).grid(row=1, column=0, sticky="w", pady=2)
         
         self.algo_var = StringVar(value="Knuth-Morris-Pratt (KMP)")
-        algo_combo = Combobox(params, textvariable=self.algo_var,
-                             values=["Knuth-Morris-Pratt (KMP)", "Boyer-Moore"],
+        algo_frame = Frame(params, bg=RetroStyle.BG_WINDOW)
+        algo_frame.grid(row=1, column=1, padx=10, pady=2, sticky="w")
+
+        # engine buffer selalu pakai bytes.find di seluruh corpus, algoritma gak bisa dipilih
+        algo_combo = Combobox(algo_frame, textvariable=self.algo_var,
+                             values=list(ALGORITHM_CHOICES),
                              font=("MS Sans Serif", 8),
-                             width=25, state="readonly")
-        algo_combo.grid(row=1, column=1, padx=10, pady=2, sticky="w")
+                             width=25, state="disabled" if SEARCH_ENGINE == 'buffer' else "readonly")
+        algo_combo.pack(side=LEFT)
+
+        # engine index cuma pakai algoritma ini untuk keyword frasa/bertanda baca
+        scope = ALGORITHM_SCOPE.get(SEARCH_ENGINE)
+        if scope:
+            Label(algo_frame, text=f"({scope})",
+                  font=("MS Sans Serif", 7),
+                  bg=RetroStyle.BG_WINDOW, fg=RetroStyle.BORDER_DARK).pack(side=LEFT, padx=(5, 0))
 
         # Case Sensitive checkbox
         self.case_sensitive_var = BooleanVar(value=False)
@@ -701,7 +916,11 @@ class ATSApp:
 
     def _reload_cvs(self):
         """Reload CVs with new count"""
-        self.cache.clear()
+        self.jobs.cancel('search')
+        self.ready = False
+        self.cache = {}
+        self.folded = {}
+        self.corpus_buffers = {}
         for widget in self.results_frame.winfo_children():
             widget.destroy()
         self._show_loading_message()
@@ -746,32 +965,28 @@ class ATSApp:
         self.time_var.set("Results cleared. Ready to search...")
 
     def _preload_all_cvs(self):
-        all_paths = get_all_cv_paths(self.db.connection)
-        paths = all_paths[:MAX_CV_LOAD]
+        all_paths = get_all_cv_paths(self.pool)
+        paths = all_paths[:self.max_cv_load]
         self.time_var.set(f"Loading {len(paths)} CV files from database...")
-        print(f"[INFO] Preloading {len(paths)} CVs… (limited to {MAX_CV_LOAD})")
+        print(f"[INFO] Preloading {len(paths)} CVs… (limited to {self.max_cv_load})")
         start = time.time()
         
-        with ThreadPoolExecutor(max_workers=4) as pool:
-            futures = {
-                pool.submit(
-                    self.extractor.PDFExtractForMatch,
-                    str((Path(DATA_DIR)/Path(p).relative_to("data")).resolve())
-                ): p
-                for p in paths
-            }
-            for fut in as_completed(futures):
-                p = futures[fut]
-                try:
-                    self.cache[p] = fut.result()
-                except Exception:
-                    self.cache[p] = ""
+        self.cache = self._load_cv_texts(paths)
         
         elapsed = (time.time()-start)*1000
         self.time_var.set(f"Database loaded successfully! {len(paths)} files ready for search.")
         print(f"[INFO] Done preloading in {elapsed:.1f} ms")
 
     def on_search(self):
+        kws = [k.strip() for k in self.keyword_var.get().split(",") if k.strip()]
+        if not kws:
+            messagebox.showwarning("Invalid Input", "Please enter at least one keyword to search.")
+            self.clear_results()
+            return
+        if not self.ready:
+            self.time_var.set("CVs are still loading, please wait...")
+            return
+
         # Clear previous results
         for w in self.results_frame.winfo_children():
             w.destroy()
@@ -787,59 +1002,141 @@ class ATSApp:
         Label(searching_frame, text="Searching database...",
               font=("MS Sans Serif", 10, "bold"),
               bg=RetroStyle.BG_WINDOW, fg=RetroStyle.TEXT_MAIN).pack(pady=10)
-        
-        self.root.update()
+        self.time_var.set("Searching...")
 
-        kws = [k.strip() for k in self.keyword_var.get().split(",") if k.strip()]
-        if not kws:
-            messagebox.showwarning("Invalid Input", "Please enter at least one keyword to search.")
-            self.clear_results()
-            return
-        
-        algo = "KMP" if "KMP" in self.algo_var.get().upper() else "BM"
+        algo = ALGORITHM_CHOICES.get(self.algo_var.get(), "KMP")
         top_n = self.top_n_var.get()
         threshold = self.thresh_var.get() / 100.0
         case_sensitive = self.case_sensitive_var.get()
 
-        total_ex = total_fu = 0.0
-        hits = []
-
-        for path, txt in self.cache.items():
-            # Apply case sensitivity
-            search_text = txt if case_sensitive else txt.lower()
-            search_keywords = kws if case_sensitive else [k.lower() for k in kws]
-            
-            ex = self.matcher.exactMatch(search_text, search_keywords, algorithm=algo)
-            exact_map = {k: v["count"] for k,v in ex["matches"].items() if v["count"]>0}
-            ex_total = sum(exact_map.values())
-            total_ex += float(ex["execution_time_ms"].rstrip("ms"))
+        # search jalan di thread job; search lama yang belum selesai otomatis dibatalkan
+        self._shown_top = None
+        if SEARCH_ENGINE == 'parallel':
+            search = self._search_parallel
+        else:
+            search = self._search_index
+        self.jobs.submit(
+            'search', lambda job: search(job, self.cache, kws, algo, threshold, case_sensitive),
+            onPartial=lambda hits: self._show_hits(hits, top_n),
+            onDone=lambda result: self._on_search_done(result, top_n, case_sensitive),
+            onError=self._on_search_error,
+        )
 
-            if ex_total:
-                hits.append((path, exact_map, ex_total, ex_total*1000))
-                continue
+    def _show_hits(self, hits, top_n):
+        """Tampilkan top-N hit (dipakai untuk hasil sementara maupun akhir)"""
+        top = sorted(hits, key=lambda x: x[3], reverse=True)[:top_n]
+        key = [(path, total) for path, _, total, _ in top]
+        if key == self._shown_top:
+            return # top-N gak berubah, gak perlu gambar ulang card
+        self._shown_top = key
 
-            fu = self.matcher.fuzzyMatch(search_text, search_keywords, threshold)
-            fu_map = fu["matches"]
-            fu_total = sum(fu_map.values())
-            total_fu += float(fu["execution_time_ms"].rstrip("ms"))
+        for w in self.results_frame.winfo_children():
+            w.destroy()
+        if not top:
+            self._show_no_results()
+            return
+        # Create wrapped grid layout for results
+        self._create_results_grid(top)
 
-            if fu_total:
-                hits.append((path, fu_map, fu_total, fu_total))
+    def _on_search_done(self, result, top_n, case_sensitive):
+        hits, total_ex, total_fu = result
+        case_status = "Yes" if case_sensitive else "No"
+        exact_label = "Exact (bytes.find)" if SEARCH_ENGINE == 'buffer' else "Exact"
+        self.time_var.set(f"Search completed! Found {len(hits)} matches. {exact_label}: {total_ex:.1f}ms | Fuzzy: {total_fu:.1f}ms | Case Sensitive: {case_status}")
+        self._show_hits(hits, top_n)
 
-        # Clear searching message
+    def _on_search_error(self, error):
+        print(f"[ERROR] Search gagal: {error}")
         for w in self.results_frame.winfo_children():
             w.destroy()
+        self._show_no_results()
+        self.time_var.set(f"Search failed: {error}")
+
+    def _corpus_buffer(self, texts, case_sensitive, folded=None):
+        """CorpusBuffer untuk mode case ini (normalnya dari corpus store), dibangun ulang kalau gak cocok"""
+        buffer = self.corpus_buffers.get(case_sensitive)
+        if buffer is None or not buffer.isBuilt(texts):
+            buffer = CorpusBuffer.build(texts, case_sensitive, folded)
+            self.corpus_buffers[case_sensitive] = buffer
+        return buffer
+
+    def _search_index(self, job, texts, kws, algo, threshold, case_sensitive):
+        """
+        Pencarian exact lewat inverted index (atau corpus buffer kalau
+        SEARCH_ENGINE = 'buffer'), fuzzy index sebagai fallback
+        """
+        index = self.index
+        folded = self.folded
+        fuzzy_index = self.fuzzy_index
+        total_ex = total_fu = 0.0
 
-        case_status = "Yes" if case_sensitive else "No"
-        self.time_var.set(f"Search completed! Found {len(hits)} matches. Exact: {total_ex:.1f}ms | Fuzzy: {total_fu:.1f}ms | Case Sensitive: {case_status}")
-        hits.sort(key=lambda x: x[3], reverse=True)
+        start = time.perf_counter()
+        if SEARCH_ENGINE == 'buffer':
+            # satu scan bytes.find per keyword di seluruh corpus
+            exact_maps = self._corpus_buffer(texts, case_sensitive, folded).searchExact(kws)
+        else:
+            # Exact match lewat inverted index (frasa diverifikasi pakai algoritma terpilih)
+            exact_maps = index.searchExact(kws, texts, self.matcher, algorithm=algo,
+                                           caseSensitive=case_sensitive, folded=folded)
+        total_ex = (time.perf_counter() - start) * 1000
+        job.checkCancelled()
 
-        if not hits:
-            self._show_no_results()
-            return
+        hits = []
+        for path in texts:
+            exact_map = exact_maps.get(path)
+            if exact_map:
+                ex_total = sum(exact_map.values())
+                hits.append((path, exact_map, ex_total, ex_total*1000))
+        # exact hit selalu di atas fuzzy, jadi bisa langsung ditampilkan
+        if hits:
+            job.partial(list(hits))
+
+        # Fuzzy cuma untuk CV yang gak ada exact match, lewat index kosakata
+        missed = {p for p in texts if not exact_maps.get(p)}
+        fuzzy_maps = {}
+        if missed:
+            start = time.perf_counter()
+            if not fuzzy_index.isBuilt(case_sensitive, texts):
+                self._build_fuzzy_index(fuzzy_index, texts, case_sensitive)
+                job.checkCancelled()
+            fuzzy_maps = fuzzy_index.search(kws, threshold, case_sensitive, docs=missed)
+            total_fu = (time.perf_counter() - start) * 1000
+        job.checkCancelled()
 
-        # Create wrapped grid layout for results
-        self._create_results_grid(hits[:top_n])
+        hits = []
+        for path in texts:
+            exact_map = exact_maps.get(path)
+            if exact_map:
+                ex_total = sum(exact_map.values())
+                hits.append((path, exact_map, ex_total, ex_total*1000))
+                continue
+
+            fu_map = fuzzy_maps.get(path)
+            if fu_map:
+                fu_total = sum(fu_map.values())
+                hits.append((path, fu_map, fu_total, fu_total))
+
+        return hits, total_ex, total_fu
+
+    def _search_parallel(self, job, texts, kws, algo, threshold, case_sensitive):
+        """Pencarian scan semua CV, dibagi ke proses worker per shard"""
+        def to_hits(results):
+            hits = []
+            for path in texts:
+                if path not in results:
+                    continue
+                kind, kwmap = results[path]
+                total = sum(kwmap.values())
+                hits.append((path, kwmap, total, total*1000 if kind == 'exact' else total))
+            return hits
+
+        # hasil tiap shard yang selesai langsung di-stream ke GUI
+        results, total_ex, total_fu = self.search_executor.search(
+            kws, algo, threshold, case_sensitive,
+            onShard=lambda partial: None if job.cancelled else job.partial(to_hits(partial))
+        )
+        job.checkCancelled()
+        return to_hits(results), total_ex, total_fu
 
     def _show_no_results(self):
         no_results_frame = Frame(self.results_frame, bg=RetroStyle.BG_WINDOW)
@@ -862,21 +1159,28 @@ class ATSApp:
         cards_per_row = 2
         current_row = 0
         current_col = 0
+        # nama semua card diambil sekali query; summary (parse CV) baru pas tombol Summary diklik
+        cards = get_result_cards_by_cv_paths(self.pool, [hit[0] for hit in hits])
         
         for i, (path, kwmap, total, score) in enumerate(hits):
             if current_col == 0:
                 row_frame = Frame(self.results_frame, bg=RetroStyle.BG_WINDOW)
                 row_frame.pack(fill=X, padx=5, pady=5)
             
-            self._create_retro_result_card(row_frame, path, kwmap, total, i+1, current_col)
+            card = cards.get(path) or ResultCard(full_name=Path(path).stem, cv_path=path)
+            card.matched_keywords = kwmap
+            card.total_matches = total
+            self._create_retro_result_card(row_frame, card, i+1, current_col)
             
             current_col += 1
             if current_col >= cards_per_row:
                 current_col = 0
                 current_row += 1
 
-    def _create_retro_result_card(self, parent, path, kwmap, total, rank, column):
-        sd = get_summary_data_by_cv_path(self.db.connection, path)
+    def _create_retro_result_card(self, parent, result_card, rank, column):
+        path = result_card.cv_path
+        kwmap = result_card.matched_keywords
+        total = result_card.total_matches
         
         card = Frame(parent, bg=RetroStyle.BG_CARD, relief="raised", bd=3)
         card.pack(side=LEFT, fill=BOTH, expand=True, padx=5, pady=5)
@@ -885,7 +1189,7 @@ class ATSApp:
         header.pack(fill=X)
         header.pack_propagate(False)
         
-        Label(header, text=f"#{rank} - {sd.full_name}",
+        Label(header, text=f"#{rank} - {result_card.full_name}",
               bg=RetroStyle.BG_HIGHLIGHT, fg="white",
               font=("MS Sans Serif", 8, "bold")).pack(side=LEFT, padx=5, pady=3)
         
@@ -930,7 +1234,7 @@ class ATSApp:
         view_btn.pack(side=LEFT, padx=2)
 
     def show_summary(self, cv_path):
-        sd = get_summary_data_by_cv_path(self.db.connection, cv_path)
+        sd = get_summary_data_by_cv_path(self.pool, cv_path, self.text_cache)
         if not sd:
             return messagebox.showerror("Error", "Could not load CV summary data.")
 
@@ -1068,9 +1372,9 @@ class ATSApp:
                       padx=8, pady=5).pack(fill=X)
 
     def open_cv(self, cv_path):
-        full = Path(DATA_DIR)/Path(cv_path).relative_to("data")
+        full = Path(self._cv_full_path(cv_path))
         if full.exists():
-            webbrowser.open_new(f"file://{full.resolve()}")
+            webbrowser.open_new(f"file://{full}")
         else:
             messagebox.showerror("File Not Found", f"Could not locate CV file:\n{full}")
 
@@ -1081,11 +1385,22 @@ def main():
         print("❌ Unable to connect to database.")
         sys.exit(1)
     db.useDatabase(DATABASE_CONFIG["database"])
+    migrated = db.migrate()
+    # semua query GUI lewat pool, koneksi ini cukup untuk migrasi lalu dikembalikan
+    db.disconnect()
+    if not migrated:
+        print("[WARN] Migrasi skema database gagal, lihat log di atas.")
 
     root = Tk()
-    ATSApp(root, db)
+    if not migrated:
+        messagebox.showwarning(
+            "Database Migration",
+            "Some database migrations failed (see the console log).\n"
+            "CV lookups may fall back to full table scans until they succeed."
+        )
+    app = ATSApp(root, db)
     root.mainloop()
-    db.disconnect()
+    app.shutdown()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
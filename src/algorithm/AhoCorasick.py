@@ -4,83 +4,162 @@ Implementasi Algoritma Aho-Corasick untuk Multi-Pattern Matching
 Purpose: Pencarian multiple pattern secara efisien menggunakan algoritma Aho-Corasick
 """
 
-from collections import deque, defaultdict
+from collections import deque
+try:
+    from .FoldedText import fold
+except ImportError:
+    # kalau file ini dijalankan langsung
+    from FoldedText import fold
 
 class AhoCorasick:
     """
     Implementasi algoritma Aho-Corasick untuk pencarian multiple pattern
-    
-    TODO:
-    - Implementasi Trie structure untuk menyimpan pattern
-    - Membuat failure links untuk optimasi pencarian
-    - Implementasi fungsi pencarian utama
-    - Menangani case sensitivity
+
+    Semua tabel disimpan dalam list yang diindeks dengan nomor state:
+    - goto[state]   : dict karakter -> state berikutnya
+    - fail[state]   : state tujuan kalau transisi gagal
+    - output[state] : list index pattern yang berakhir di state ini
+    Jadi teks cukup discan sekali, berapapun jumlah keyword-nya.
     """
-    
+
     def __init__(self):
         """Inisialisasi Aho-Corasick matcher"""
-        # Struktur trie untuk menyimpan pattern
-        self.trie = {}
+        # Struktur trie untuk menyimpan pattern (state 0 = root)
+        self.goto = [{}]
         # Failure links untuk optimasi
-        self.failureLinks = {}
-        # Output untuk setiap state
-        self.output = defaultdict(list)
+        self.fail = [0]
+        # Output untuk setiap state (index pattern)
+        self.output = [[]]
         # Counter untuk state ID
-        self.stateCount = 0
-    
+        self.stateCount = 1
+        # Pattern asli dan pattern yang sudah diproses (case handling)
+        self.patterns = []
+        self.processed = []
+        self.caseSensitive = True
+
     def buildTrie(self, patterns):
         """
         Membangun trie dari daftar pattern
-        
+
         Args:
             patterns (list): Daftar pattern yang akan dicari
-            
-        TODO:
-        - Membangun trie structure
-        - Menandai akhir setiap pattern
-        - Menyimpan pattern untuk setiap state
         """
-        pass
-    
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [[]]
+        self.stateCount = 1
+
+        for idx, pattern in enumerate(patterns):
+            if not pattern: # pattern kosong gak usah dimasukin
+                continue
+            state = 0
+            for ch in pattern:
+                nxt = self.goto[state].get(ch)
+                if nxt is None: # bikin state baru
+                    nxt = self.stateCount
+                    self.goto[state][ch] = nxt
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append([])
+                    self.stateCount += 1
+                state = nxt
+            self.output[state].append(idx) # tandai akhir pattern
+
     def buildFailureLinks(self):
         """
         Membangun failure links menggunakan BFS
-        
-        TODO:
-        - Menggunakan BFS untuk membangun failure links
-        - Menghitung output function untuk setiap state
-        - Optimasi untuk pencarian yang efisien
+
+        Output tiap state digabung dengan output dari failure state-nya,
+        jadi pas search gak perlu ngikutin rantai failure buat ngumpulin match.
         """
-        pass
-    
-    def search(self, text, caseSensitive=True):
+        queue = deque()
+        # anak langsung root failure-nya ke root
+        for nxt in self.goto[0].values():
+            self.fail[nxt] = 0
+            queue.append(nxt)
+
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self.goto[state].items():
+                queue.append(nxt)
+                # cari state terpanjang yang bisa lanjut pakai karakter ch
+                f = self.fail[state]
+                while f and ch not in self.goto[f]:
+                    f = self.fail[f]
+                self.fail[nxt] = self.goto[f].get(ch, 0)
+                if self.output[self.fail[nxt]]:
+                    self.output[nxt] = self.output[nxt] + self.output[self.fail[nxt]]
+
+    def search(self, text, caseSensitive=None, folded=False):
         """
         Mencari semua pattern dalam teks menggunakan Aho-Corasick
-        
+
         Args:
             text (str): Teks yang akan dicari
             caseSensitive (bool): Apakah pencarian case sensitive
-            
+                (default ikut setting waktu preprocessPatterns; kalau beda,
+                automaton dibangun ulang untuk mode ini)
+            folded (bool): Teks sudah berupa companion fold (FoldedText.folded)
+
         Returns:
             dict: Dictionary dengan pattern sebagai key dan list posisi sebagai value
-            
-        TODO:
-        - Implementasi pencarian utama Aho-Corasick
-        - Menangani failure links
-        - Mengembalikan semua match dengan posisinya
         """
-        pass
-    
+        if caseSensitive is None:
+            caseSensitive = self.caseSensitive
+        elif caseSensitive != self.caseSensitive:
+            # automaton dari self.processed cuma valid untuk mode case waktu dibangun
+            self.preprocessPatterns(self.patterns, caseSensitive)
+        if not caseSensitive and not folded:
+            text = fold(text)
+
+        found = [[] for _ in self.processed]
+        goto = self.goto
+        fail = self.fail
+        output = self.output
+        lengths = [len(p) for p in self.processed]
+
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if output[state]:
+                for idx in output[state]:
+                    found[idx].append(i - lengths[idx] + 1)
+
+        results = {}
+        for idx, pattern in enumerate(self.patterns):
+            results.setdefault(pattern, found[idx])
+        return results
+
     def preprocessPatterns(self, patterns, caseSensitive=True):
         """
         Preprocessing untuk daftar pattern
-        
+
         Args:
             patterns (list): Daftar pattern
             caseSensitive (bool): Case sensitivity
-            
-        TODO:
-        - Memproses pattern (case handling)
-        - Membangun trie dan failure links
         """
-        pass
\ No newline at end of file
+        self.patterns = list(patterns)
+        self.caseSensitive = caseSensitive
+        self.processed = [p if caseSensitive else fold(p) for p in self.patterns]
+        self.buildTrie(self.processed)
+        self.buildFailureLinks()
+
+    def searchMultiple(self, text, patterns, caseSensitive=True, folded=False) -> dict:
+        """
+        Mencari beberapa pola dalam teks dengan satu kali scan
+
+        Argumen:
+            text (str): Teks yang akan dicari
+            patterns (list): Daftar pola yang akan dicari
+            caseSensitive (bool): Apakah pencarian sensitif terhadap huruf besar/kecil
+            folded (bool): Teks sudah berupa companion fold (FoldedText.folded)
+
+        Mengembalikan:
+            dict: Dictionary yang memetakan pola ke posisi kemunculannya
+        """
+        # automaton cuma dibangun ulang kalau keyword-nya berubah
+        if list(patterns) != self.patterns or caseSensitive != self.caseSensitive:
+            self.preprocessPatterns(patterns, caseSensitive)
+        return self.search(text, caseSensitive, folded)
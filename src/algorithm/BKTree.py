@@ -0,0 +1,77 @@
+"""
+Implementasi BK-Tree (Burkhard-Keller Tree)
+Tujuan: Mencari kata dengan jarak Levenshtein <= k tanpa membandingkan
+        dengan seluruh kosakata
+"""
+
+from .LevenshteinDistance import LevenshteinDistance
+
+
+class BKTree:
+    """
+    BK-Tree dengan metrik jarak Levenshtein
+
+    Setiap node = [kata, {jarak: anak}]. Karena jarak Levenshtein memenuhi
+    ketidaksamaan segitiga, saat query dengan radius r dari node berjarak d
+    cuma anak dengan key di [d - r, d + r] yang perlu dikunjungi.
+    """
+
+    def __init__(self, words=None):
+        """
+        Argumen:
+            words (iterable): Kata-kata awal (opsional)
+        """
+        self.levenshtein = LevenshteinDistance()
+        self.root = None
+        self.size = 0
+        if words:
+            for word in words:
+                self.add(word)
+
+    def add(self, word):
+        """Menambahkan satu kata ke tree (kata duplikat diabaikan)"""
+        if self.root is None:
+            self.root = [word, {}]
+            self.size = 1
+            return
+        node = self.root
+        while True:
+            d = self.levenshtein.calculate(word, node[0])
+            if d == 0:
+                return # sudah ada
+            child = node[1].get(d)
+            if child is None:
+                node[1][d] = [word, {}]
+                self.size += 1
+                return
+            node = child
+
+    def query(self, word, radius):
+        """
+        Mencari semua kata dengan jarak <= radius
+
+        Argumen:
+            word (str): Kata yang dicari
+            radius (int): Jarak maksimum
+
+        Mengembalikan:
+            list: Daftar tuple (kata, jarak)
+        """
+        if self.root is None or radius < 0:
+            return []
+        results = []
+        stack = [self.root]
+        while stack:
+            node_word, children = stack.pop()
+            d = self.levenshtein.calculate(word, node_word)
+            if d <= radius:
+                results.append((node_word, d))
+            lo = d - radius
+            hi = d + radius
+            for dist, child in children.items():
+                if lo <= dist <= hi:
+                    stack.append(child)
+        return results
+
+    def __len__(self):
+        return self.size
@@ -1,3 +1,12 @@
+from array import array
+
+try:
+    from .FoldedText import fold
+except ImportError:
+    # kalau file ini dijalankan langsung
+    from FoldedText import fold
+
+
 class BoyerMoore:
     def __init__(self):
         self.bad_char = {}
@@ -10,6 +19,13 @@ class BoyerMoore:
             bad[pattern[i]] = i  # simpan posisi terakhir kemunculan
         return bad
 
+    # versi ringkas buat pola bytes: array 256 entri, diindex langsung pakai nilai byte
+    def preprocessBadCharacterBytes(self, pattern):
+        bad = array('i', [-1]) * 256
+        for i, byte in enumerate(pattern):
+            bad[byte] = i
+        return bad
+
     def preprocessGoodSuffix(self, pattern):
         m = len(pattern)
         good = [0] * (m + 1)
@@ -35,19 +51,25 @@ class BoyerMoore:
                 good[i] = j
             if i == j:
                 j = border[j]
-        return good
+        return array('i', good)
 
-    def search(self, text, pattern, caseSensitive=True):
+    # folded=True: text sudah companion fold dari preload, cukup pattern yang di-fold
+    def search(self, text, pattern, caseSensitive=True, folded=False):
         if not caseSensitive:
-            text = text.lower()
-            pattern = pattern.lower()
+            if not folded:
+                text = fold(text)
+            pattern = fold(pattern)
+        if len(pattern) == 0:
+            return []
+        # pra pemrosesan
+        return self.searchWithTable(text, pattern, self.preprocess(pattern))
+
+    # pencarian pakai tabel yang udah dihitung (biar bisa dipakai ulang antar CV)
+    def searchWithTables(self, text, pattern, bad, good):
         n = len(text)
         m = len(pattern)
         if m == 0:
             return []
-        # pra pemrosesan
-        bad = self.preprocessBadCharacter(pattern)
-        good = self.preprocessGoodSuffix(pattern)
         # pencarian utama
         occurrences = []
         s = 0
@@ -64,14 +86,64 @@ class BoyerMoore:
                 s += max(char_shift, suffix_shift)
         return occurrences
 
-    def countOccurrences(self, text, pattern, caseSensitive=True):
-        return len(self.search(text, pattern, caseSensitive))
+    # pencarian di atas bytes / memoryview: text[i] langsung int, jadi loop
+    # dalamnya gak bikin objek str per karakter dan bad-character cukup index array
+    def searchBytes(self, data, pattern, bad, good):
+        n = len(data)
+        m = len(pattern)
+        if m == 0:
+            return []
+        occurrences = []
+        last = m - 1
+        s = 0
+        while s <= n - m:
+            j = last
+            while j >= 0 and pattern[j] == data[s+j]:
+                j -= 1
+            if j < 0:
+                occurrences.append(s)
+                s += good[0]
+            else:
+                char_shift = j - bad[data[s+j]]
+                suffix_shift = good[j+1]
+                s += char_shift if char_shift > suffix_shift else suffix_shift
+        return occurrences
+
+    # antarmuka seragam dengan engine lain (dipakai CompiledQuery)
+    # tabel = (tabel str: dict + good, tabel bytes UTF-8: array + good, pola UTF-8)
+    def preprocess(self, pattern):
+        encoded = pattern.encode('utf-8')
+        good = self.preprocessGoodSuffix(pattern)
+        goodBytes = good if pattern.isascii() else self.preprocessGoodSuffix(encoded)
+        return (
+            (self.preprocessBadCharacter(pattern), good),
+            (self.preprocessBadCharacterBytes(encoded), goodBytes),
+            encoded,
+        )
+
+    # teks ASCII (kasus paling umum di CV) dan bytes/memoryview lewat searchBytes,
+    # teks str non-ASCII fallback ke tabel dict; posisi untuk input bytes = offset byte
+    def searchWithTable(self, text, pattern, table):
+        strTable, bytesTable, encoded = table
+        if isinstance(text, str):
+            if not text.isascii():
+                return self.searchWithTables(text, pattern, *strTable)
+            if not pattern.isascii():
+                return []  # pola non-ASCII gak mungkin ada di teks ASCII
+            text = text.encode('ascii')
+        return self.searchBytes(text, encoded, *bytesTable)
+
+    def countOccurrences(self, text, pattern, caseSensitive=True, folded=False):
+        return len(self.search(text, pattern, caseSensitive, folded))
     
     # tambahan lukas, untuk mencari beberapa keyword sekaligus
-    def searchMultiple(self, text, patterns, caseSensitive=True) -> dict:
+    def searchMultiple(self, text, patterns, caseSensitive=True, folded=False) -> dict:
+        if not caseSensitive and not folded:
+            text = fold(text) # cukup sekali untuk semua pola
+            folded = True
         results = {}
         for pattern in patterns:
-            results[pattern] = self.search(text, pattern, caseSensitive)
+            results[pattern] = self.search(text, pattern, caseSensitive, folded)
         return results
 
 # coba
@@ -0,0 +1,171 @@
+"""
+Compiled Query - Hasil preprocessing keyword yang bisa dipakai ulang
+Tujuan: Tabel LPS / bad-character / good-suffix / automaton Aho-Corasick
+        cukup dihitung sekali per query, bukan sekali per CV
+"""
+
+from .BoyerMoore import BoyerMoore
+from .KnuthMorrisPratt import KnuthMorrisPratt
+from .AhoCorasick import AhoCorasick
+from .Horspool import Horspool
+from .Sunday import Sunday
+from .TwoWay import TwoWay
+from .StringFind import StringFind
+from .FoldedText import fold
+from config import AUTO_ALGORITHM_RULES, AUTO_AC_MIN_KEYWORDS
+
+# engine satu-pola: semuanya punya preprocess(pattern) dan searchWithTable(text, pattern, table)
+ENGINES = {
+    'KMP': KnuthMorrisPratt,
+    'BM': BoyerMoore,
+    'HORSPOOL': Horspool,
+    'SUNDAY': Sunday,
+    'TWOWAY': TwoWay,
+    'FIND': StringFind,
+}
+ALGORITHMS = tuple(ENGINES) + ('AC', 'AUTO')
+
+# engine-nya stateless, jadi satu instance dipakai bareng semua query
+_engines = {name: cls() for name, cls in ENGINES.items()}
+
+
+def autoAlgorithm(pattern, keywordCount, rules=None, acMinKeywords=None):
+    """
+    Pilih engine untuk satu keyword di mode AUTO
+
+    Aturannya diambil dari config (hasil benchmarks/bench_algorithms.py):
+    kalau keyword-nya banyak pakai Aho-Corasick (satu scan untuk semua),
+    selain itu engine dipilih dari panjang keyword.
+
+    Argumen:
+        pattern (str): Keyword (sudah di-fold kalau case-insensitive)
+        keywordCount (int): Jumlah keyword dalam query
+        rules (tuple): (panjang maksimal, engine), None = semua panjang
+        acMinKeywords (int): Jumlah keyword minimal untuk Aho-Corasick
+
+    Mengembalikan:
+        str: Nama engine ('AC' atau salah satu key ENGINES)
+    """
+    rules = AUTO_ALGORITHM_RULES if rules is None else rules
+    acMinKeywords = AUTO_AC_MIN_KEYWORDS if acMinKeywords is None else acMinKeywords
+    if acMinKeywords and keywordCount >= acMinKeywords:
+        return 'AC'
+    for maxLength, name in rules:
+        if maxLength is None or len(pattern) <= maxLength:
+            return name
+    return 'KMP'
+
+
+class CompiledQuery:
+    """
+    Query yang sudah dikompilasi untuk satu algoritma
+
+    Dibuat lewat PatternMatcher.compileQuery supaya ikut ke-cache (LRU),
+    lalu searchMultiple dipanggil berulang kali untuk setiap CV.
+
+    Di mode 'AUTO' engine dipilih per keyword (lihat autoAlgorithm),
+    pilihan akhirnya ada di self.choices.
+    """
+
+    def __init__(self, keywords, algorithm='KMP', caseSensitive=True):
+        """
+        Argumen:
+            keywords (list): Daftar kata kunci
+            algorithm (str): 'KMP', 'BM', 'HORSPOOL', 'SUNDAY', 'TWOWAY',
+                             'FIND', 'AC', atau 'AUTO'
+            caseSensitive (bool): Apakah pencarian sensitif terhadap huruf besar/kecil
+        """
+        self.keywords = list(keywords)
+        self.algorithm = algorithm.upper()
+        self.caseSensitive = caseSensitive
+        self.patterns = [k if caseSensitive else fold(k) for k in self.keywords]
+
+        if self.algorithm not in ALGORITHMS:
+            raise ValueError(
+                f"Algoritma tidak dikenali. Pilih salah satu dari: {', '.join(ALGORITHMS)}."
+            )
+        if self.algorithm == 'AUTO':
+            self.choices = [autoAlgorithm(p, len(self.patterns)) for p in self.patterns]
+        else:
+            self.choices = [self.algorithm] * len(self.patterns)
+
+        if self.choices and all(choice == 'AC' for choice in self.choices):
+            self.engine = AhoCorasick()
+            self.engine.preprocessPatterns(self.keywords, caseSensitive)
+            self.plans = None
+        else:
+            self.engine = None
+            # (keyword, pattern, engine, tabel) -- tabel dihitung sekali di sini
+            self.plans = []
+            for keyword, pattern, choice in zip(self.keywords, self.patterns, self.choices):
+                engine = _engines[choice]
+                self.plans.append((keyword, pattern, engine, engine.preprocess(pattern)))
+        # Boyer-Moore nyari di bytes, teksnya di-encode sekali per CV di searchMultiple
+        self.usesBytes = bool(self.plans) and any(
+            isinstance(engine, BoyerMoore) for _, _, engine, _ in self.plans
+        )
+
+    def searchMultiple(self, text, folded=False) -> dict:
+        """
+        Mencari semua keyword dalam teks memakai tabel yang sudah dikompilasi
+
+        Argumen:
+            text (str): Teks yang akan dicari
+            folded (bool): Teks sudah berupa companion fold (FoldedText.folded),
+                           jadi di mode case-insensitive gak ada salinan teks baru
+
+        Mengembalikan:
+            dict: Dictionary yang memetakan keyword ke posisi kemunculannya
+                  (posisi di teks fold kalau folded=True)
+        """
+        if self.plans is None:
+            return self.engine.search(text, folded=folded)
+
+        if not self.caseSensitive and not folded:
+            text = fold(text) # cukup sekali untuk semua keyword
+
+        data = None
+        if self.usesBytes and isinstance(text, str) and text.isascii():
+            data = text.encode('ascii') # posisi byte = posisi karakter untuk ASCII
+
+        results = {}
+        for keyword, pattern, engine, table in self.plans:
+            if data is not None and isinstance(engine, BoyerMoore):
+                results[keyword] = engine.searchWithTable(data, pattern, table)
+            else:
+                results[keyword] = engine.searchWithTable(text, pattern, table)
+        return results
+
+    def searchPages(self, pages, needed=None) -> dict:
+        """
+        Menghitung kemunculan keyword dari aliran halaman (generator), halaman
+        dibaca satu per satu dan bisa berhenti lebih awal
+
+        Ujung halaman sebelumnya (panjang keyword terpanjang - 1) disambung ke
+        halaman berikutnya, jadi keyword yang terpotong di batas halaman tetap
+        ketemu dan gak ada yang terhitung dua kali.
+
+        Argumen:
+            pages (iterable): Teks per halaman, urut
+            needed (int): Berhenti begitu setiap keyword sudah muncul minimal
+                          sebanyak ini (mis. 1 untuk mode "any match"),
+                          None = baca semua halaman
+
+        Mengembalikan:
+            dict: Dictionary yang memetakan keyword ke jumlah kemunculannya
+        """
+        counts = dict.fromkeys(self.keywords, 0)
+        # panjang pattern yang dicari (versi fold kalau case-insensitive)
+        lengths = dict(zip(self.keywords, map(len, self.patterns)))
+        overlap = max(lengths.values(), default=1) - 1
+        folded = not self.caseSensitive
+        carry = ""
+        for page in pages:
+            buffer = carry + (fold(page) if folded else page)
+            for keyword, positions in self.searchMultiple(buffer, folded).items():
+                # yang seluruhnya di dalam carry sudah dihitung di halaman sebelumnya
+                counts[keyword] += sum(1 for pos in positions if pos + lengths[keyword] > len(carry))
+            carry = buffer[-overlap:] if overlap else ""
+            if needed and all(c >= needed for c in counts.values()):
+                break
+        return counts
@@ -0,0 +1,182 @@
+"""
+Corpus Buffer - Semua CV dalam satu buffer bytes
+Tujuan: Setiap keyword cukup dicari sekali di seluruh corpus memakai
+        bytes.find (level C), bukan satu panggilan Python per CV per keyword
+"""
+
+from array import array
+from bisect import bisect_right
+
+from .FoldedText import fold
+from .FuzzyIndex import textFingerprints
+
+
+class CorpusBuffer:
+    """
+    Buffer UTF-8 gabungan semua CV dengan tabel offset batas dokumen
+
+    - data      : teks semua CV (versi fold kalau case-insensitive), dipisah SEPARATOR
+    - starts[i] : offset byte awal CV ke-i di data
+    - paths[i]  : cv_path CV ke-i
+    - fingerprints : cv_path -> fingerprint teks (lihat textFingerprints)
+
+    Match di buffer dipetakan balik ke CV lewat bisect pada starts. UTF-8
+    self-synchronizing, jadi match bytes dari pola yang valid selalu jatuh
+    di batas karakter dan jumlahnya sama dengan pencarian per string.
+    """
+
+    # teks CV sudah dibersihkan dari karakter kontrol, jadi NUL gak mungkin
+    # muncul di teks maupun keyword: match gak bisa nyebrang batas CV
+    SEPARATOR = b'\x00'
+
+    def __init__(self, data=b'', starts=None, paths=None, caseSensitive=False, fingerprints=None):
+        """
+        Argumen:
+            data (bytes): Buffer gabungan (objek apa pun yang punya find, mis. mmap)
+            starts (array): Offset byte awal tiap CV
+            paths (list): cv_path per CV, urutannya sama dengan starts
+            caseSensitive (bool): False kalau data berisi teks yang sudah di-fold
+            fingerprints (dict): cv_path -> fingerprint teks yang ada di buffer
+        """
+        self.data = data
+        self.starts = starts if starts is not None else array('q')
+        self.paths = paths if paths is not None else []
+        self.caseSensitive = caseSensitive
+        self.fingerprints = fingerprints if fingerprints is not None else {}
+
+    @classmethod
+    def build(cls, texts, caseSensitive=False, folded=None):
+        """
+        Gabungkan cache teks CV jadi satu buffer
+
+        Argumen:
+            texts (dict): cv_path -> teks
+            caseSensitive (bool): Mode case buffer ini
+            folded (dict): cv_path -> FoldedText (companion dari preload),
+                           dipakai untuk mode case-insensitive kalau ada
+
+        Mengembalikan:
+            CorpusBuffer: Buffer siap dicari
+        """
+        parts = []
+        starts = array('q')
+        paths = []
+        offset = 0
+        for path, text in texts.items():
+            if not caseSensitive:
+                companion = folded.get(path) if folded else None
+                text = companion.folded if companion is not None else fold(text)
+            encoded = text.encode('utf-8', 'surrogatepass')
+            starts.append(offset)
+            paths.append(path)
+            parts.append(encoded)
+            offset += len(encoded) + len(cls.SEPARATOR)
+        return cls(cls.SEPARATOR.join(parts), starts, paths, caseSensitive, textFingerprints(texts))
+
+    def __len__(self):
+        return len(self.paths)
+
+    def isBuilt(self, texts):
+        """
+        Cek buffer berisi CV yang sama dengan yang sedang di-load
+
+        Dibandingkan per fingerprint (sama kayak FuzzyIndex.isBuilt), jadi
+        teks yang berubah dengan cv_path yang sama tetap bikin buffer dibangun ulang
+        """
+        return self.fingerprints == textFingerprints(texts)
+
+    def locate(self, pos):
+        """
+        Offset di buffer -> (index CV, offset byte di dalam CV)
+        """
+        doc = bisect_right(self.starts, pos) - 1
+        return doc, pos - self.starts[doc]
+
+    def findAll(self, pattern):
+        """
+        Semua offset kemunculan pola di buffer (termasuk yang overlap)
+
+        Argumen:
+            pattern (bytes): Pola UTF-8
+
+        Mengembalikan:
+            list: Offset awal di buffer, terurut
+        """
+        if not pattern:
+            return []
+        find = self.data.find
+        positions = []
+        i = find(pattern)
+        while i != -1:
+            positions.append(i)
+            i = find(pattern, i + 1)
+        return positions
+
+    def docEnd(self, doc):
+        """Offset byte akhir (eksklusif) CV ke-doc di buffer"""
+        if doc + 1 < len(self.starts):
+            return self.starts[doc + 1] - len(self.SEPARATOR)
+        return len(self.data)
+
+    @staticmethod
+    def hasBorder(pattern):
+        """True kalau pola punya border (prefix = suffix), artinya match-nya bisa overlap"""
+        return any(pattern[:k] == pattern[-k:] for k in range(1, len(pattern)))
+
+    def count(self, keyword) -> dict:
+        """
+        Jumlah kemunculan satu keyword per CV (overlap ikut dihitung, sama kayak KMP)
+
+        Buffer di-scan pakai find untuk lompat ke CV berikutnya yang ada
+        match-nya, lalu jumlah di dalam CV itu dihitung sekaligus pakai
+        bytes.count (level C). Kalau pola bisa overlap, bytes.count yang
+        non-overlap diganti loop find di dalam CV tersebut.
+
+        Argumen:
+            keyword (str): Keyword (di-fold otomatis kalau buffer case-insensitive)
+
+        Mengembalikan:
+            dict: cv_path -> jumlah kemunculan (hanya yang > 0)
+        """
+        if not self.caseSensitive:
+            keyword = fold(keyword)
+        pattern = keyword.encode('utf-8', 'surrogatepass')
+        if not pattern:
+            return {}
+        data = self.data
+        find = data.find
+        countIn = getattr(data, 'count', None)
+        if countIn is None or self.hasBorder(pattern):
+            countIn = None  # mmap gak punya count, atau match bisa overlap
+
+        counts = {}
+        pos = find(pattern)
+        while pos != -1:
+            doc = bisect_right(self.starts, pos) - 1
+            end = self.docEnd(doc)
+            if countIn is not None:
+                n = countIn(pattern, pos, end)
+            else:
+                n = 0
+                while pos != -1:
+                    n += 1
+                    pos = find(pattern, pos + 1, end)
+            counts[self.paths[doc]] = n
+            pos = find(pattern, end)
+        return counts
+
+    def searchExact(self, keywords) -> dict:
+        """
+        Pencarian eksak semua keyword, masing-masing satu kali scan buffer
+
+        Argumen:
+            keywords (list): Daftar kata kunci
+
+        Mengembalikan:
+            dict: cv_path -> {keyword: jumlah kemunculan} (hanya yang > 0)
+        """
+        results = {}
+        for keyword in keywords:
+            for path, n in self.count(keyword).items():
+                results.setdefault(path, {})[keyword] = n
+        return results
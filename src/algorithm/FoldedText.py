@@ -0,0 +1,141 @@
+"""
+Teks CV yang Sudah Di-casefold
+Tujuan: Versi case-insensitive (casefold + NFKC) dari setiap CV dihitung sekali
+        waktu preload, jadi search case-insensitive gak perlu text.lower()
+        untuk setiap CV di setiap query
+"""
+
+import re
+import unicodedata
+from array import array
+
+_NON_ASCII_RE = re.compile(r'[^\x00-\x7f]+')
+
+# karakter non-ASCII -> hasil fold (jumlah karakter unik di corpus CV kecil)
+_foldCache = {}
+
+
+def _foldChar(ch):
+    folded = _foldCache.get(ch)
+    if folded is None:
+        folded = _foldCache[ch] = unicodedata.normalize('NFKC', ch.casefold())
+    return folded
+
+
+def fold(text):
+    """Casefold + NFKC per karakter (dipakai juga untuk keyword, biar konsisten dengan corpus)"""
+    if text.isascii():
+        return text.lower()
+    parts = []
+    pos = 0
+    for match in _NON_ASCII_RE.finditer(text):
+        start, end = match.span()
+        if start > pos:
+            parts.append(text[pos:start].lower())
+        parts.extend(_foldChar(ch) for ch in match.group())
+        pos = end
+    parts.append(text[pos:].lower())
+    return ''.join(parts)
+
+
+def foldOffsets(text):
+    """
+    Peta offset teks fold -> teks asli
+
+    Fold dilakukan per karakter supaya setiap karakter hasil bisa ditelusuri
+    balik ke karakter asalnya (mis. 'ß' -> 'ss', dua-duanya menunjuk ke 'ß').
+
+    Argumen:
+        text (str): Teks asli
+
+    Mengembalikan:
+        array: array('i') dengan offsets[i] = posisi karakter asli untuk
+               karakter fold ke-i (plus satu sentinel len(text) di akhir),
+               atau None kalau panjangnya sama persis (posisi fold = posisi asli)
+    """
+    if text.isascii():
+        return None
+    runs = [match.span() for match in _NON_ASCII_RE.finditer(text)]
+    if all(len(_foldChar(text[i])) == 1 for start, end in runs for i in range(start, end)):
+        return None
+
+    # ada karakter yang melebar/menyusut, bangun peta offset-nya
+    offsets = array('i')
+    pos = 0
+    for start, end in runs:
+        offsets.extend(range(pos, start))
+        for i in range(start, end):
+            offsets.extend([i] * len(_foldChar(text[i])))
+        pos = end
+    offsets.extend(range(pos, len(text)))
+    offsets.append(len(text))
+    return offsets
+
+
+def foldText(text):
+    """
+    Casefold + NFKC per karakter, sekalian peta offset ke teks asli
+
+    Mengembalikan:
+        tuple: (teks hasil fold, offsets) -- lihat foldOffsets
+    """
+    return fold(text), foldOffsets(text)
+
+
+class FoldedText:
+    """
+    Pasangan teks fold + peta offset untuk satu CV
+
+    Posisi hasil pencarian di teks fold bisa dipetakan balik ke teks asli
+    lewat toOriginal / originalSpan. Peta offset baru dihitung waktu pertama
+    kali dibutuhkan, jadi companion yang cuma dipakai search gak ikut
+    nyimpan array per karakter.
+    """
+
+    __slots__ = ('folded', 'text', '_offsets')
+
+    def __init__(self, text):
+        self.folded = fold(text)
+        self.text = text # str yang sama dengan di cache teks, gak nambah memori
+        self._offsets = False # False = belum dihitung
+
+    @property
+    def offsets(self):
+        if self._offsets is False:
+            self._offsets = foldOffsets(self.text)
+        return self._offsets
+
+    def toOriginal(self, pos):
+        """Posisi di teks fold -> posisi di teks asli"""
+        offsets = self.offsets
+        return pos if offsets is None else offsets[pos]
+
+    def originalSpan(self, pos, length):
+        """
+        Rentang match di teks fold -> rentang di teks asli
+
+        Mengembalikan:
+            tuple: (start, end) di teks asli
+        """
+        offsets = self.offsets
+        if offsets is None:
+            return pos, pos + length
+        if length == 0:
+            return offsets[pos], offsets[pos]
+        return offsets[pos], offsets[pos + length - 1] + 1
+
+    def __len__(self):
+        return len(self.folded)
+
+
+def foldCorpus(texts):
+    """
+    Bangun companion teks fold untuk semua CV
+
+    Argumen:
+        texts (dict): cv_path -> teks
+
+    Mengembalikan:
+        dict: cv_path -> FoldedText
+    """
+    return {path: FoldedText(text) for path, text in texts.items()}
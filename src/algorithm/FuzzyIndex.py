@@ -0,0 +1,135 @@
+"""
+Fuzzy Index atas kosakata seluruh CV
+Tujuan: Pencarian fuzzy yang biayanya tergantung ukuran kosakata,
+        bukan total panjang teks semua CV
+"""
+
+from .BKTree import BKTree
+from .LevenshteinDistance import LevenshteinDistance
+
+
+def textFingerprints(texts):
+    """
+    Fingerprint per CV buat ngecek index masih sesuai dengan teks yang di-load
+
+    Kalau texts punya fingerprints() sendiri (mis. CorpusTexts), itu yang
+    dipakai supaya teksnya gak perlu dibaca. Kalau gak, pakai (panjang, hash)
+    teksnya: hash str di-cache di objeknya, jadi ngecek dict yang sama
+    berulang kali hampir gratis.
+
+    Argumen:
+        texts (dict): cv_path -> teks
+
+    Mengembalikan:
+        dict: cv_path -> fingerprint
+    """
+    own = getattr(texts, 'fingerprints', None)
+    if own is not None:
+        return own()
+    return {docId: (len(text), hash(text)) for docId, text in texts.items()}
+
+
+class FuzzyIndex:
+    """
+    Index kosakata corpus untuk pencocokan fuzzy
+
+    Untuk setiap mode case (sensitif / tidak) disimpan:
+    - postings[kata] : {cv_path: frekuensi}
+    - tree           : BKTree berisi semua kata unik
+    - lengths        : himpunan panjang kata (buat hitung radius query)
+
+    Tokenisasi sama persis dengan LevenshteinDistance.wordFrequencies,
+    jadi hasil hitungannya sama dengan count_every_word_occurrence per CV.
+    """
+
+    def __init__(self):
+        """Inisialisasi index kosong"""
+        self.levenshtein = LevenshteinDistance()
+        self.modes = {}
+
+    def build(self, texts, caseSensitive=False):
+        """
+        Membangun index untuk satu mode case dari cache teks CV
+
+        Argumen:
+            texts (dict): cv_path -> teks
+            caseSensitive (bool): Mode case yang diindex
+        """
+        postings = {}
+        for docId, text in texts.items():
+            for word, freq in self.levenshtein.wordFrequencies(text, caseSensitive).items():
+                postings.setdefault(word, {})[docId] = freq
+        self.modes[caseSensitive] = {
+            'postings': postings,
+            'tree': BKTree(postings),
+            'lengths': {len(word) for word in postings},
+            'docs': textFingerprints(texts),
+        }
+
+    def isBuilt(self, caseSensitive, texts=None):
+        """
+        Cek index untuk mode ini sudah ada (dan cocok dengan CV yang di-load)
+
+        CV dibandingkan per fingerprint, jadi teks yang berubah dengan
+        cv_path yang sama tetap bikin index dibangun ulang
+        """
+        mode = self.modes.get(caseSensitive)
+        if mode is None:
+            return False
+        return texts is None or mode['docs'] == textFingerprints(texts)
+
+    def _radius(self, keyword, threshold, lengths):
+        """
+        Radius BK-tree terbesar yang masih mungkin lolos threshold
+        untuk panjang kata mana pun yang ada di kosakata
+        """
+        radius = -1
+        for length in lengths:
+            max_len = max(len(keyword), length)
+            if max_len == 0:
+                continue
+            k = self.levenshtein.maxDistanceFor(max_len, threshold)
+            if abs(length - len(keyword)) <= k and k > radius:
+                radius = k
+        return radius
+
+    def similarWords(self, keyword, threshold=0.7, caseSensitive=False):
+        """
+        Kata di kosakata yang similarity-nya terhadap keyword >= threshold
+
+        Mengembalikan:
+            list: Daftar kata yang cocok
+        """
+        mode = self.modes[caseSensitive]
+        if not caseSensitive:
+            keyword = keyword.lower()
+        radius = self._radius(keyword, threshold, mode['lengths'])
+        # kandidat dari BK-tree, lalu dicek threshold-nya per panjang kata
+        return [
+            word for word, _ in mode['tree'].query(keyword, radius)
+            if self.levenshtein.isSimilar(keyword, word, threshold) is not None
+        ]
+
+    def search(self, keywords, threshold=0.7, caseSensitive=False, docs=None) -> dict:
+        """
+        Hitung kemunculan fuzzy semua keyword di semua CV sekaligus
+
+        Argumen:
+            keywords (list): Daftar kata kunci
+            threshold (float): Ambang minimum kemiripan
+            caseSensitive (bool): Apakah pencarian sensitif terhadap huruf besar/kecil
+            docs (set): Batasi ke CV tertentu (None = semua)
+
+        Mengembalikan:
+            dict: cv_path -> {keyword: jumlah kemunculan} (hanya yang > 0)
+        """
+        postings = self.modes[caseSensitive]['postings']
+        results = {}
+        for keyword in keywords:
+            for word in self.similarWords(keyword, threshold, caseSensitive):
+                for docId, freq in postings[word].items():
+                    if docs is not None and docId not in docs:
+                        continue
+                    counts = results.setdefault(docId, {})
+                    counts[keyword] = counts.get(keyword, 0) + freq
+        return results
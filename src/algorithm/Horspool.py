@@ -0,0 +1,95 @@
+"""
+Implementasi Algoritma Boyer-Moore-Horspool
+Tujuan: Versi sederhana Boyer-Moore yang cuma memakai tabel bad-character
+        (tanpa good-suffix), overhead preprocessing kecil untuk keyword pendek
+"""
+
+try:
+    from .FoldedText import fold
+except ImportError:
+    # kalau file ini dijalankan langsung
+    from FoldedText import fold
+
+
+class Horspool:
+    """
+    Pencocokan pola Horspool
+
+    Geseran ditentukan dari karakter teks yang sejajar dengan karakter
+    terakhir pola: shift[c] = jarak kemunculan terakhir c (di luar karakter
+    terakhir pola) ke ujung pola, atau panjang pola kalau c tidak ada.
+    """
+
+    def preprocess(self, pattern) -> dict:
+        """
+        Menghitung tabel shift Horspool
+
+        Argumen:
+            pattern (str): Pola yang akan dicari
+
+        Mengembalikan:
+            dict: karakter -> besar geseran (karakter lain = len(pattern))
+        """
+        m = len(pattern)
+        shift = {}
+        for i in range(m - 1): # karakter terakhir gak ikut
+            shift[pattern[i]] = m - 1 - i
+        return shift
+
+    def searchWithTable(self, text, pattern, shift) -> list:
+        """
+        Pencarian Horspool memakai tabel shift yang sudah dihitung
+
+        Argumen:
+            text (str): Teks yang akan dicari (sudah di-handle case-nya)
+            pattern (str): Pola yang akan dicari
+            shift (dict): Hasil preprocess(pattern)
+
+        Mengembalikan:
+            list: Daftar posisi awal di mana pola ditemukan
+        """
+        n = len(text)
+        m = len(pattern)
+        if m == 0:
+            return []
+        result = []
+        last = pattern[m - 1]
+        s = 0
+        while s <= n - m:
+            c = text[s + m - 1]
+            # cek karakter terakhir dulu, sisanya dibandingkan sekaligus
+            if c == last and text.startswith(pattern, s):
+                result.append(s)
+            s += shift.get(c, m)
+        return result
+
+    def search(self, text, pattern, caseSensitive=True, folded=False) -> list:
+        """
+        Mencari pola dalam teks menggunakan Horspool
+
+        Argumen:
+            text (str): Teks yang akan dicari
+            pattern (str): Pola yang akan dicari
+            caseSensitive (bool): Apakah pencarian sensitif terhadap huruf besar/kecil
+            folded (bool): Teks sudah berupa companion fold (FoldedText.folded)
+
+        Mengembalikan:
+            list: Daftar posisi awal di mana pola ditemukan
+        """
+        if not caseSensitive:
+            if not folded:
+                text = fold(text)
+            pattern = fold(pattern)
+        return self.searchWithTable(text, pattern, self.preprocess(pattern))
+
+    def searchMultiple(self, text, patterns, caseSensitive=True, folded=False) -> dict:
+        """
+        Mencari beberapa pola dalam teks
+
+        Mengembalikan:
+            dict: Dictionary yang memetakan pola ke posisi kemunculannya
+        """
+        if not caseSensitive and not folded:
+            text = fold(text) # cukup sekali untuk semua pola
+            folded = True
+        return {pattern: self.search(text, pattern, caseSensitive, folded) for pattern in patterns}
@@ -0,0 +1,316 @@
+"""
+Inverted Index untuk teks CV
+Tujuan: Lookup keyword lewat postings (term -> CV -> offset) supaya search
+        tidak perlu scan linear semua teks CV setiap kali cari
+"""
+
+import os
+import re
+import pickle
+import hashlib
+import logging
+from array import array
+
+from .FoldedText import fold
+
+# token = satu run karakter word (huruf/angka/underscore)
+TOKEN_PATTERN = re.compile(r'\w+')
+WORD_KEYWORD = re.compile(r'^\w+$')
+
+INDEX_VERSION = 1
+
+# panjang n-gram maksimal di index vocabulary (substring keyword di dalam term)
+GRAM = 3
+
+
+class InvertedIndex:
+    """
+    Inverted index level token dengan posisi
+
+    - postings[term][cv_path] : array offset awal term di teks CV
+    - docs[cv_path]           : fingerprint teks yang sudah diindex
+    - docTerms[cv_path]       : daftar term unik di CV (buat hapus dokumen)
+
+    Keyword yang isinya cuma karakter word dijawab langsung dari postings
+    (termasuk kemunculan di tengah term, misal 'java' di 'javascript', yang
+    dicari lewat index n-gram vocabulary),
+    jadi hasilnya sama dengan scan KMP/BM. Keyword frasa atau yang ada tanda
+    bacanya dipakai buat nyaring kandidat CV dulu, baru diverifikasi KMP/BM.
+    """
+
+    def __init__(self):
+        """Inisialisasi index kosong"""
+        self.logger = logging.getLogger(__name__)
+        self.postings = {}
+        self.docs = {}
+        self.docTerms = {}
+        self._vocab = {} # caseSensitive -> index vocabulary, direset tiap index berubah
+
+    @staticmethod
+    def fingerprint(text):
+        """Fingerprint teks CV buat ngecek index masih valid atau tidak"""
+        return hashlib.sha1(text.encode('utf-8', 'surrogatepass')).hexdigest()
+
+    def addDocument(self, docId, text):
+        """
+        Menambahkan (atau mengganti) satu CV ke index
+
+        Argumen:
+            docId (str): cv_path
+            text (str): Teks hasil PDFExtractForMatch
+        """
+        if docId in self.docs:
+            self.removeDocument(docId)
+
+        terms = {}
+        for match in TOKEN_PATTERN.finditer(text):
+            offsets = terms.get(match.group())
+            if offsets is None:
+                offsets = terms[match.group()] = array('I')
+            offsets.append(match.start())
+
+        for term, offsets in terms.items():
+            self.postings.setdefault(term, {})[docId] = offsets
+        self.docs[docId] = self.fingerprint(text)
+        self.docTerms[docId] = list(terms)
+        self._vocab = {}
+
+    def removeDocument(self, docId):
+        """Menghapus satu CV dari index"""
+        for term in self.docTerms.pop(docId, []):
+            plist = self.postings.get(term)
+            if plist is None:
+                continue
+            plist.pop(docId, None)
+            if not plist:
+                del self.postings[term]
+        self.docs.pop(docId, None)
+        self._vocab = {}
+
+    def sync(self, texts) -> bool:
+        """
+        Menyamakan index dengan cache teks CV
+
+        CV yang belum ada atau teksnya berubah diindex ulang. CV yang ada di
+        index tapi tidak di-load tetap disimpan (cuma tidak ikut dicari).
+
+        Argumen:
+            texts (dict): cv_path -> teks
+
+        Mengembalikan:
+            bool: True kalau ada perubahan (index perlu disimpan ulang)
+        """
+        changed = False
+        for docId, text in texts.items():
+            if self.docs.get(docId) != self.fingerprint(text):
+                self.addDocument(docId, text)
+                changed = True
+        return changed
+
+    def _vocabulary(self, caseSensitive):
+        """
+        Index vocabulary sesuai mode case (dibangun sekali, direset tiap index berubah)
+
+        Mengembalikan:
+            tuple: (byCmp, cmps, grams)
+                   byCmp : term_pembanding -> list term asli
+                   cmps  : list term_pembanding (id term = posisi di list)
+                   grams : n-gram (panjang 1..GRAM) -> array id term yang mengandungnya
+        """
+        vocab = self._vocab.get(caseSensitive)
+        if vocab is not None:
+            return vocab
+        byCmp = {}
+        for term in self.postings:
+            byCmp.setdefault(term if caseSensitive else fold(term), []).append(term)
+        cmps = list(byCmp)
+        grams = {}
+        for tid, cmp in enumerate(cmps):
+            seen = {cmp[i:i + n] for n in range(1, GRAM + 1) for i in range(len(cmp) - n + 1)}
+            for gram in seen:
+                ids = grams.get(gram)
+                if ids is None:
+                    ids = grams[gram] = array('I')
+                ids.append(tid)
+        vocab = self._vocab[caseSensitive] = (byCmp, cmps, grams)
+        return vocab
+
+    def _partialTerms(self, keyword, caseSensitive):
+        """
+        Term_pembanding yang mengandung keyword di tengahnya (bukan sama persis)
+
+        Keyword sepanjang <= GRAM langsung dijawab dari index n-gram. Keyword
+        yang lebih panjang dicari irisan id term dari semua trigram-nya, lalu
+        diverifikasi pakai find, jadi yang discan cuma kandidat, bukan
+        seluruh vocabulary.
+        """
+        _, cmps, grams = self._vocabulary(caseSensitive)
+        if len(keyword) <= GRAM:
+            ids = grams.get(keyword, ())
+        else:
+            lists = []
+            for i in range(len(keyword) - GRAM + 1):
+                ids = grams.get(keyword[i:i + GRAM])
+                if ids is None:
+                    return []
+                lists.append(ids)
+            lists.sort(key=len)
+            ids = set(lists[0])
+            for other in lists[1:]:
+                ids.intersection_update(other)
+                if not ids:
+                    return []
+        return [cmps[tid] for tid in ids if cmps[tid] != keyword and keyword in cmps[tid]]
+
+    def _matchingTerms(self, keyword, caseSensitive):
+        """
+        Semua term asli yang mengandung keyword, plus posisi keyword di dalamnya
+
+        Mengembalikan:
+            list: (term asli, list posisi di term) -- posisi boleh overlap, sama kayak KMP
+        """
+        byCmp = self._vocabulary(caseSensitive)[0]
+        # term yang sama persis: langsung dari postings, posisinya pasti 0
+        matches = [(term, [0]) for term in byCmp.get(keyword, ())]
+        for cmp in self._partialTerms(keyword, caseSensitive):
+            inner = []
+            i = cmp.find(keyword)
+            while i != -1:
+                inner.append(i)
+                i = cmp.find(keyword, i + 1)
+            matches.extend((term, inner) for term in byCmp[cmp])
+        return matches
+
+    def lookup(self, keyword, caseSensitive=True, docs=None) -> dict:
+        """
+        Mencari keyword (hanya karakter word) langsung dari postings
+
+        Term yang sama persis dengan keyword diambil langsung dari postings.
+        Kemunculan di tengah term lain (misal 'java' di 'javascript') dicari
+        lewat index n-gram vocabulary, jadi hasilnya tetap sama dengan scan KMP/BM.
+
+        Argumen:
+            keyword (str): Keyword tanpa spasi/tanda baca
+            caseSensitive (bool): Apakah pencarian sensitif terhadap huruf besar/kecil
+            docs (set): Batasi hasil ke CV tertentu (None = semua)
+
+        Mengembalikan:
+            dict: cv_path -> list posisi kemunculan (terurut)
+        """
+        if not caseSensitive:
+            keyword = fold(keyword)
+        if not keyword:
+            return {}
+        results = {}
+        for term, inner in self._matchingTerms(keyword, caseSensitive):
+            for docId, offsets in self.postings[term].items():
+                if docs is not None and docId not in docs:
+                    continue
+                positions = results.setdefault(docId, [])
+                for off in offsets:
+                    positions.extend(off + k for k in inner)
+        for positions in results.values():
+            positions.sort()
+        return results
+
+    def candidates(self, keyword, caseSensitive=True, docs=None) -> set:
+        """
+        Kandidat CV yang mungkin mengandung keyword frasa/bertanda baca
+
+        Setiap token keyword harus muncul sebagai substring dari suatu term
+        di CV, jadi hasilnya superset dari CV yang benar-benar cocok.
+        """
+        tokens = TOKEN_PATTERN.findall(keyword if caseSensitive else fold(keyword))
+        result = set(self.docs) if docs is None else set(docs)
+        if not tokens:
+            return result # tanda baca doang, gak bisa disaring
+        for token in tokens:
+            found = set()
+            for term, _ in self._matchingTerms(token, caseSensitive):
+                found.update(self.postings[term])
+            result &= found
+            if not result:
+                break
+        return result
+
+    def searchExact(self, keywords, texts, matcher, algorithm='KMP', caseSensitive=True, folded=None) -> dict:
+        """
+        Pencarian eksak semua keyword pada CV yang sedang di-load
+
+        Argumen:
+            keywords (list): Daftar kata kunci
+            texts (dict): cv_path -> teks (cache CV yang sedang di-load)
+            matcher (PatternMatcher): Dipakai untuk verifikasi keyword frasa
+            algorithm (str): Algoritma verifikasi ('KMP', 'BM', atau 'AC')
+            caseSensitive (bool): Apakah pencarian sensitif terhadap huruf besar/kecil
+            folded (dict): cv_path -> FoldedText (companion fold dari preload),
+                           dipakai untuk verifikasi frasa case-insensitive
+
+        Mengembalikan:
+            dict: cv_path -> {keyword: jumlah kemunculan} (hanya yang > 0)
+        """
+        docs = set(texts)
+        results = {}
+        phrases = []
+        for kw in keywords:
+            if WORD_KEYWORD.match(kw):
+                for docId, positions in self.lookup(kw, caseSensitive, docs).items():
+                    results.setdefault(docId, {})[kw] = len(positions)
+            else:
+                phrases.append(kw)
+
+        if phrases:
+            # CV kandidat per keyword, diverifikasi sekali jalan per CV
+            pending = {}
+            for kw in phrases:
+                for docId in self.candidates(kw, caseSensitive, docs):
+                    pending.setdefault(docId, []).append(kw)
+            for docId, kws in pending.items():
+                companion = folded.get(docId) if folded and not caseSensitive else None
+                if companion is not None:
+                    ex = matcher.exactMatch(companion.folded, phrases, algorithm, caseSensitive, folded=True)
+                else:
+                    ex = matcher.exactMatch(texts[docId], phrases, algorithm, caseSensitive)
+                for kw in kws:
+                    if ex['matches'][kw]['count'] > 0:
+                        results.setdefault(docId, {})[kw] = ex['matches'][kw]['count']
+        return results
+
+    def save(self, path):
+        """Menyimpan index ke disk (ditulis ke file sementara dulu biar atomic)"""
+        path = str(path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + '.tmp'
+        with open(tmp, 'wb') as f:
+            pickle.dump(
+                {'version': INDEX_VERSION, 'postings': self.postings,
+                 'docs': self.docs, 'docTerms': self.docTerms},
+                f, protocol=pickle.HIGHEST_PROTOCOL
+            )
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Memuat index dari disk
+
+        Mengembalikan:
+            InvertedIndex: Index dari file, atau index kosong kalau file
+                           tidak ada / rusak / beda versi
+        """
+        index = cls()
+        try:
+            with open(path, 'rb') as f:
+                data = pickle.load(f)
+            if data.get('version') != INDEX_VERSION:
+                index.logger.info("Versi index beda, index dibangun ulang.")
+                return index
+            index.postings = data['postings']
+            index.docs = data['docs']
+            index.docTerms = data['docTerms']
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            index.logger.warning(f"Gagal memuat index {path}: {e}")
+            index = cls()
+        return index
@@ -3,6 +3,12 @@ Implementasi Algoritma Knuth-Morris-Pratt
 Tujuan: Pencocokan pola string secara efisien menggunakan algoritma KMP
 """
 
+try:
+    from .FoldedText import fold
+except ImportError:
+    # kalau file ini dijalankan langsung
+    from FoldedText import fold
+
 class KnuthMorrisPratt:
     """
     Implementasi algoritma pencocokan pola KMP
@@ -49,7 +55,7 @@ class KnuthMorrisPratt:
                     i += 1
         return lps
 
-    def search(self, text, pattern, caseSensitive=True) -> list:
+    def search(self, text, pattern, caseSensitive=True, folded=False) -> list:
         """
         Mencari pola dalam teks menggunakan algoritma KMP
         
@@ -57,6 +63,8 @@ class KnuthMorrisPratt:
             text (str): Teks yang akan dicari
             pattern (str): Pola yang akan dicari
             caseSensitive (bool): Apakah pencarian sensitif terhadap huruf besar/kecil
+            folded (bool): Teks sudah berupa companion fold (FoldedText.folded),
+                           jadi cuma pattern yang di-fold
             
         Mengembalikan:
             list: Daftar posisi awal di mana pola ditemukan
@@ -67,10 +75,27 @@ class KnuthMorrisPratt:
         - Menangani sensitivitas huruf besar/kecil
         - Mengembalikan semua posisi kemunculan
         """
-        if not caseSensitive: # kalo mau disamain huruf besar kecilnya, lowerin semua
-            text = text.lower() 
-            pattern = pattern.lower()
+        if not caseSensitive: # kalo mau disamain huruf besar kecilnya, fold semua
+            if not folded:
+                text = fold(text)
+            pattern = fold(pattern)
         lps = self.computeFailureFunction(pattern) # panggil lpsny
+        return self.searchWithFailure(text, pattern, lps)
+
+    def searchWithFailure(self, text, pattern, lps) -> list:
+        """
+        Pencarian KMP memakai array LPS yang sudah dihitung sebelumnya
+
+        Argumen:
+            text (str): Teks yang akan dicari (sudah di-handle case-nya)
+            pattern (str): Pola yang akan dicari
+            lps (list): Hasil computeFailureFunction(pattern)
+
+        Mengembalikan:
+            list: Daftar posisi awal di mana pola ditemukan
+        """
+        if not pattern:
+            return []
         result = []
         i = 0  # index untuk text
         j = 0  # index untuk pattern
@@ -88,7 +113,14 @@ class KnuthMorrisPratt:
                     i += 1 
         return result
 
-    def searchMultiple(self, text, patterns, caseSensitive=True) -> dict:
+    # antarmuka seragam dengan engine lain (dipakai CompiledQuery)
+    def preprocess(self, pattern) -> list:
+        return self.computeFailureFunction(pattern)
+
+    def searchWithTable(self, text, pattern, lps) -> list:
+        return self.searchWithFailure(text, pattern, lps)
+
+    def searchMultiple(self, text, patterns, caseSensitive=True, folded=False) -> dict:
         """
         Mencari beberapa pola dalam teks
         
@@ -104,7 +136,10 @@ class KnuthMorrisPratt:
         - Implementasi pencarian banyak pola
         - Optimasi untuk banyak pola
         """
+        if not caseSensitive and not folded:
+            text = fold(text) # cukup sekali untuk semua pola
+            folded = True
         results = {} # dictionary untuk menyimpan hasil
         for pattern in patterns:
-            results[pattern] = self.search(text, pattern, caseSensitive)
+            results[pattern] = self.search(text, pattern, caseSensitive, folded)
         return results
\ No newline at end of file
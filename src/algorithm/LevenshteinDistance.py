@@ -3,9 +3,10 @@ Implementasi Algoritma Levenshtein Distance
 Tujuan: Menghitung jarak edit antar string untuk pencocokan fuzzy
 """
 import re
+from collections import Counter
 try:
     # Try relative import first (when used as module)
-    from ..pdfprocessor.regexExtractor import RegexExtractor
+    from ..pdfprocessor.regexExtractor import sharedRegexExtractor
 except ImportError:
     # Fallback for direct execution
     import sys
@@ -14,7 +15,7 @@ except ImportError:
     parent_dir = os.path.dirname(current_dir)
     sys.path.insert(0, parent_dir)
     
-    from pdfprocessor.regexExtractor import RegexExtractor
+    from pdfprocessor.regexExtractor import sharedRegexExtractor
 
 class LevenshteinDistance:
     """
@@ -43,31 +44,141 @@ class LevenshteinDistance:
         Mengembalikan:
             int: Jarak Levenshtein
         """
+        # batas = panjang string terpanjang, jadi gak pernah kepotong
+        return self.boundedDistance(str1, str2, max(len(str1), len(str2)))
+
+
+    def boundedDistance(self, str1, str2, maxDist):
+        """
+        Hitung jarak Levenshtein, tapi berhenti begitu jaraknya pasti > maxDist
+
+        Argumen:
+            str1 (str): String pertama
+            str2 (str): String kedua
+            maxDist (int): Jarak maksimum yang masih dianggap
+
+        Mengembalikan:
+            int: Jarak Levenshtein kalau <= maxDist, selain itu maxDist + 1
+        """
+        if maxDist < 0:
+            return 0 if str1 == str2 else maxDist + 1
+        # yang pendek jadi "pattern"
+        if len(str1) > len(str2):
+            str1, str2 = str2, str1
+        # selisih panjang = batas bawah jarak
+        if len(str2) - len(str1) > maxDist:
+            return maxDist + 1
+        if not str1:
+            return len(str2)
+        if len(str1) <= 64:
+            return self._myers(str1, str2, maxDist)
+        return self._banded(str1, str2, maxDist)
+
+
+    def _myers(self, pattern, text, maxDist):
+        """
+        Algoritma bit-parallel Myers (versi global edit distance, Hyyro)
+        Satu kolom DP dihitung dengan beberapa operasi bit, pattern <= 64 karakter
+        """
+        m = len(pattern)
+        n = len(text)
+        full = (1 << m) - 1
+        last = 1 << (m - 1)
+
+        # bitmask posisi tiap karakter di pattern
+        peq = {}
+        for i, ch in enumerate(pattern):
+            peq[ch] = peq.get(ch, 0) | (1 << i)
+
+        pv = full # vertical delta +1
+        mv = 0    # vertical delta -1
+        score = m
+        for j, ch in enumerate(text):
+            eq = peq.get(ch, 0)
+            xv = eq | mv
+            xh = (((eq & pv) + pv) ^ pv) | eq
+            ph = (mv | ~(xh | pv)) & full
+            mh = pv & xh
+            if ph & last:
+                score += 1
+            elif mh & last:
+                score -= 1
+            # tiap kolom sisa paling banyak ngurangin 1
+            if score - (n - j - 1) > maxDist:
+                return maxDist + 1
+            ph = ((ph << 1) | 1) & full
+            mh = (mh << 1) & full
+            pv = (mh | ~(xv | ph)) & full
+            mv = ph & xv
+        return score if score <= maxDist else maxDist + 1
+
+
+    def _banded(self, str1, str2, maxDist):
+        """
+        DP Ukkonen: cuma diagonal |i - j| <= maxDist yang dihitung,
+        pakai dua baris yang dipakai bergantian
+        """
         m = len(str1)
         n = len(str2)
+        inf = maxDist + 1
+        prev = [j if j <= maxDist else inf for j in range(n + 1)]
+        cur = [inf] * (n + 1)
 
-        # create DP table
-        dp = [[0] * (n + 1) for _ in range(m + 1)] 
-        
-        # fill all base problems
-        for j in range(0, n + 1): # fill columns
-            dp[0][j] = j
-            
-        for i in range(0, m + 1): # fill rows
-            dp[i][0] = i
-        
-        # fill dp table to get final distance using lev dist algo
         for i in range(1, m + 1):
-            for j in range(1, n + 1):
-                if str1[i-1] == str2[j-1]:
-                    dp[i][j] = dp[i-1][j-1]
-                else:
-                    dp[i][j] = 1 + min(
-                        dp[i-1][j-1], # replace
-                        dp[i][j-1], # insert
-                        dp[i-1][j] # delete
-                    )
-        return dp[m][n] # return distance
+            lo = max(1, i - maxDist)
+            hi = min(n, i + maxDist)
+            cur[0] = i if i <= maxDist else inf
+            if lo > 1:
+                cur[lo - 1] = inf
+            row_min = cur[0]
+            a = str1[i - 1]
+            for j in range(lo, hi + 1):
+                v = prev[j - 1] if a == str2[j - 1] else prev[j - 1] + 1 # replace
+                if prev[j] + 1 < v:
+                    v = prev[j] + 1 # delete
+                if cur[j - 1] + 1 < v:
+                    v = cur[j - 1] + 1 # insert
+                if v > inf:
+                    v = inf
+                cur[j] = v
+                if v < row_min:
+                    row_min = v
+            if row_min > maxDist: # semua sel di band udah lewat batas
+                return inf
+            prev, cur = cur, prev
+        return prev[n] if prev[n] <= maxDist else inf
+
+
+    def maxDistanceFor(self, maxLen, threshold):
+        """
+        Jarak maksimum supaya 1 - jarak/maxLen >= threshold
+        (dihitung pakai perbandingan yang sama persis dengan similarity)
+        """
+        k = int((1 - threshold) * maxLen)
+        while k + 1 <= maxLen and 1 - (k + 1) / maxLen >= threshold:
+            k += 1
+        while k >= 0 and 1 - k / maxLen < threshold:
+            k -= 1
+        return k
+
+
+    def isSimilar(self, str1, str2, threshold=0.7):
+        """
+        Cek apakah similarity(str1, str2) >= threshold tanpa menghitung jarak penuh
+
+        Mengembalikan:
+            float: Rasio kemiripan kalau lolos threshold, selain itu None
+        """
+        max_len = max(len(str1), len(str2))
+        if max_len == 0:
+            return 1.0 if threshold <= 1.0 else None
+        k = self.maxDistanceFor(max_len, threshold)
+        if k < 0:
+            return None
+        LD = self.boundedDistance(str1, str2, k)
+        if LD > k:
+            return None
+        return 1 - LD/max_len
 
 
     def similarity(self, str1, str2):
@@ -110,8 +221,8 @@ class LevenshteinDistance:
         """
         results = []
         for candidate in candidates:
-            sim_ratio = self.similarity(target, candidate)
-            if sim_ratio >= threshold:
+            sim_ratio = self.isSimilar(target, candidate, threshold)
+            if sim_ratio is not None:
                 result = (candidate, sim_ratio)
                 results.append(result)
         # sort results
@@ -125,8 +236,7 @@ class LevenshteinDistance:
             text = text.lower()  # lower text if not case sensitive
             keyword = keyword.lower()
 
-        regex = RegexExtractor()
-        processed_text = regex.seperatePunctuations(text) # seperate punctuations
+        processed_text = sharedRegexExtractor.seperatePunctuations(text) # seperate punctuations
         words = processed_text.split() # split words in string
 
         result = self.findBestMatches(keyword, words, threshold)
@@ -140,48 +250,70 @@ class LevenshteinDistance:
         return results
     
 
-    def count_every_word_occurrence(self, text, keywords, threshold=0.7, caseSensitive=True) -> dict:
+    def wordFrequencies(self, text, caseSensitive=True) -> Counter:
+        """
+        Tabel frekuensi kata dalam teks (kata = hasil seperatePunctuations().split())
+
+        Argumen:
+            text (str): Teks input
+            caseSensitive (bool): Kalau False, kata di-lower dulu
+
+        Mengembalikan:
+            Counter: kata -> jumlah kemunculan
+        """
+        words = sharedRegexExtractor.seperatePunctuations(text).split()
+        if not caseSensitive:
+            words = [w.lower() for w in words]
+        return Counter(words)
+
+
+    def count_every_word_occurrence(self, text, keywords, threshold=0.7, caseSensitive=True, memo=None) -> dict:
         """
         Menghitung setiap kemunculan fuzzy dari kata kunci dalam teks.
 
+        Setiap kata unik cukup dibandingkan sekali per keyword, lalu hasilnya
+        dikali frekuensi kata tersebut.
+
         Argumen:
             text (str): Teks input yang akan dicari.
             keywords (list): Daftar kata kunci yang akan dihitung.
             threshold (float): Ambang minimum kemiripan untuk dipertimbangkan sebagai kecocokan.
             caseSensitive (bool): Jika True, pencocokan akan peka huruf besar/kecil.
+            memo (dict): Cache hasil (keyword, kata) -> cocok/tidak yang bisa dipakai
+                  bareng antar CV dalam satu pencarian (threshold harus sama).
+                  Dipakai ParallelSearch.searchShard untuk semua CV di shard-nya;
+                  engine index gak butuh ini karena FuzzyIndex sudah menilai
+                  setiap kata kosakata sekali per keyword.
 
         Mengembalikan:
             dict: Sebuah kamus di mana kunci adalah kata kunci dan nilai adalah 
                   jumlah kemunculan fuzzy dalam teks.
         """
-        occurrence_counts = {keyword: 0 for keyword in keywords}
-        
-        regex = RegexExtractor()
-        # Preprocess the text once
-        processed_text = regex.seperatePunctuations(text)
-        words = processed_text.split()
-
-        # Adjust keywords and words if not case sensitive
-        if not caseSensitive:
-            keywords_lower = [k.lower() for k in keywords]
-            words_lower = [w.lower() for w in words]
-        else:
-            keywords_lower = keywords # Use original keywords for comparison
-            words_lower = words      # Use original words for comparison
+        freqs = self.wordFrequencies(text, caseSensitive)
+        return self.count_from_frequencies(freqs, keywords, threshold, caseSensitive, memo)
 
 
-        for i, text_word_original in enumerate(words):
-            text_word = words_lower[i] # Use lowercased word for comparison if not case sensitive
-            
-            for j, keyword_original in enumerate(keywords):
-                keyword = keywords_lower[j] # Use lowercased keyword for comparison if not case sensitive
+    def count_from_frequencies(self, freqs, keywords, threshold=0.7, caseSensitive=True, memo=None) -> dict:
+        """
+        Sama seperti count_every_word_occurrence, tapi dari tabel frekuensi kata
+        yang sudah dihitung (lihat wordFrequencies)
+        """
+        if memo is None:
+            memo = {}
+        occurrence_counts = {keyword: 0 for keyword in keywords}
 
-                sim_ratio = self.similarity(keyword, text_word)
-                if sim_ratio >= threshold:
-                    occurrence_counts[keyword_original] += 1
+        for keyword_original in keywords:
+            keyword = keyword_original if caseSensitive else keyword_original.lower()
+            for text_word, freq in freqs.items():
+                key = (keyword, text_word)
+                similar = memo.get(key)
+                if similar is None:
+                    similar = self.isSimilar(keyword, text_word, threshold) is not None
+                    memo[key] = similar
+                if similar:
+                    occurrence_counts[keyword_original] += freq
         
         for keyword in keywords:
-            if occurrence_counts[keyword] == 0:
+            if occurrence_counts.get(keyword) == 0:
                 occurrence_counts.pop(keyword)  # Remove keywords with no occurrences
         return occurrence_counts
-        
\ No newline at end of file
@@ -0,0 +1,210 @@
+"""
+Pencarian Corpus Paralel
+Tujuan: Membagi cache CV ke beberapa proses worker (masing-masing menyimpan
+        shard teksnya sendiri) supaya exact + fuzzy matching jalan di semua core
+"""
+
+import os
+import time
+import logging
+import threading
+import multiprocessing
+from multiprocessing.connection import wait
+
+from .PatternMatcher import PatternMatcher
+from .FoldedText import foldCorpus
+
+logger = logging.getLogger(__name__)
+
+
+def searchShard(texts, matcher, keywords, algorithm='KMP', threshold=0.7, caseSensitive=True, folded=None):
+    """
+    Pipeline pencarian untuk sekumpulan CV: exact dulu, fuzzy kalau gak ada exact
+
+    Argumen:
+        texts (dict): cv_path -> teks
+        matcher (PatternMatcher): Matcher (query terkompilasi ikut ke-cache di sini)
+        keywords (list): Daftar kata kunci
+        algorithm (str): 'KMP', 'BM', atau 'AC'
+        threshold (float): Ambang kemiripan fuzzy
+        caseSensitive (bool): Apakah pencarian sensitif terhadap huruf besar/kecil
+        folded (dict): cv_path -> FoldedText, dipakai langsung untuk exact match
+                       case-insensitive (None = teks di-fold saat itu juga)
+
+    Mengembalikan:
+        tuple: ({cv_path: ('exact' | 'fuzzy', {keyword: jumlah})}, waktu_exact_ms, waktu_fuzzy_ms)
+    """
+    query = matcher.compileQuery(keywords, algorithm, caseSensitive)
+    memo = {}
+    results = {}
+    exact_ms = fuzzy_ms = 0.0
+    for path, text in texts.items():
+        start = time.perf_counter()
+        companion = folded.get(path) if folded and not caseSensitive else None
+        if companion is not None:
+            matches = query.searchMultiple(companion.folded, folded=True)
+        else:
+            matches = query.searchMultiple(text)
+        exact_map = {k: len(v) for k, v in matches.items() if v}
+        exact_ms += (time.perf_counter() - start) * 1000
+        if exact_map:
+            results[path] = ('exact', exact_map)
+            continue
+
+        start = time.perf_counter()
+        fuzzy_map = matcher.levenshtein.count_every_word_occurrence(
+            text, keywords, threshold, caseSensitive, memo
+        )
+        fuzzy_ms += (time.perf_counter() - start) * 1000
+        if fuzzy_map:
+            results[path] = ('fuzzy', fuzzy_map)
+    return results, exact_ms, fuzzy_ms
+
+
+def _workerMain(conn):
+    """Loop proses worker: shard teks disimpan di memori proses ini"""
+    matcher = PatternMatcher()
+    texts = {}
+    folded = {}
+    while True:
+        try:
+            msg = conn.recv()
+        except EOFError:
+            break
+        cmd = msg[0]
+        if cmd == 'load':
+            texts = msg[1]
+            # companion fold dihitung sekali per load di tiap worker
+            folded = foldCorpus(texts)
+            conn.send(len(texts))
+        elif cmd == 'search':
+            try:
+                conn.send(searchShard(texts, matcher, *msg[1:], folded=folded))
+            except Exception as e:
+                conn.send(e)
+        elif cmd == 'stop':
+            break
+    conn.close()
+
+
+class ParallelSearchExecutor:
+    """
+    Executor pencarian dengan worker yang tetap hidup
+
+    Setiap worker punya shard CV sendiri (dikirim sekali waktu load),
+    jadi saat search yang dikirim cuma parameter query dan yang balik cuma
+    peta jumlah keyword per CV.
+    """
+
+    def __init__(self, workers=None):
+        """
+        Argumen:
+            workers (int): Jumlah proses worker (default: jumlah core)
+        """
+        self.workerCount = workers or os.cpu_count() or 1
+        self.workers = [] # list (process, conn)
+        self.texts = {}
+        # pipe worker gak boleh dipakai dua thread sekaligus (request/reply bisa ketuker)
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def makeShards(texts, count):
+        """Bagi CV ke beberapa shard dengan total panjang teks yang kira-kira sama"""
+        shards = [{} for _ in range(count)]
+        sizes = [0] * count
+        for path, text in sorted(texts.items(), key=lambda item: len(item[1]), reverse=True):
+            i = sizes.index(min(sizes))
+            shards[i][path] = text
+            sizes[i] += len(text)
+        return shards
+
+    def _start(self, count):
+        # spawn, bukan fork: worker dibuat dari thread preload GUI, fork dari
+        # proses yang sudah punya banyak thread bisa deadlock
+        ctx = multiprocessing.get_context('spawn')
+        while len(self.workers) < count:
+            parent, child = ctx.Pipe()
+            proc = ctx.Process(target=_workerMain, args=(child,), daemon=True)
+            proc.start()
+            child.close()
+            self.workers.append((proc, parent))
+
+    def load(self, texts):
+        """
+        Kirim shard CV ke worker (menggantikan shard sebelumnya)
+
+        Argumen:
+            texts (dict): cv_path -> teks
+        """
+        with self.lock:
+            self.texts = texts
+            count = max(1, min(self.workerCount, len(texts)))
+            self._start(count)
+            shards = self.makeShards(texts, len(self.workers))
+            for (_, conn), shard in zip(self.workers, shards):
+                conn.send(('load', shard))
+            for _, conn in self.workers:
+                conn.recv()
+
+    def search(self, keywords, algorithm='KMP', threshold=0.7, caseSensitive=True, onShard=None):
+        """
+        Jalankan pencarian di semua shard lalu gabungkan hasilnya
+
+        Argumen:
+            onShard (callable): Dipanggil tiap kali satu worker selesai dengan
+                                hasil gabungan sementara (buat streaming ke GUI)
+
+        Mengembalikan:
+            tuple: ({cv_path: ('exact' | 'fuzzy', {keyword: jumlah})}, waktu_exact_ms, waktu_fuzzy_ms)
+                   waktu = waktu terlama di antara worker
+        """
+        with self.lock:
+            if not self.workers:
+                return searchShard(self.texts, PatternMatcher(), keywords, algorithm, threshold, caseSensitive)
+
+            results = {}
+            exact_ms = fuzzy_ms = 0.0
+            error = None
+            try:
+                for _, conn in self.workers:
+                    conn.send(('search', keywords, algorithm, threshold, caseSensitive))
+                # semua reply tetap dibaca (walaupun ada yang error) biar pipe gak ketinggalan reply
+                pending = [conn for _, conn in self.workers]
+                while pending:
+                    for conn in wait(pending):
+                        pending.remove(conn)
+                        reply = conn.recv()
+                        if isinstance(reply, Exception):
+                            error = reply
+                            continue
+                        shard_results, ex, fu = reply
+                        results.update(shard_results)
+                        exact_ms = max(exact_ms, ex)
+                        fuzzy_ms = max(fuzzy_ms, fu)
+                        if onShard is not None and error is None:
+                            onShard(results)
+            except (EOFError, OSError) as e:
+                logger.error(f"Worker search mati, fallback ke pencarian serial: {e}")
+                self._shutdown()
+                return searchShard(self.texts, PatternMatcher(), keywords, algorithm, threshold, caseSensitive)
+
+        if error is not None:
+            raise error
+        return results, exact_ms, fuzzy_ms
+
+    def shutdown(self):
+        """Hentikan semua worker"""
+        with self.lock:
+            self._shutdown()
+
+    def _shutdown(self):
+        for proc, conn in self.workers:
+            try:
+                conn.send(('stop',))
+                conn.close()
+            except (OSError, BrokenPipeError):
+                pass
+            proc.join(timeout=1)
+            if proc.is_alive():
+                proc.terminate()
+        self.workers = []
@@ -6,6 +6,11 @@ Tujuan: Antarmuka terpadu untuk operasi pencocokan pola
 from .BoyerMoore import BoyerMoore
 from .KnuthMorrisPratt import KnuthMorrisPratt
 from .LevenshteinDistance import LevenshteinDistance
+from .AhoCorasick import AhoCorasick
+from .CompiledQuery import CompiledQuery
+from collections import OrderedDict
+from threading import Lock
+from config import COMPILED_QUERY_CACHE_SIZE
 import time
 
 class PatternMatcher:
@@ -24,30 +29,55 @@ class PatternMatcher:
         self.boyerMoore = BoyerMoore()
         self.kmp = KnuthMorrisPratt()
         self.levenshtein = LevenshteinDistance()
-        # self.ac = AhoCorasick() # ntar kalo implement Aho-Corasick
+        self.ac = AhoCorasick()
+        # LRU cache query yang sudah dikompilasi
+        self.compiledCache = OrderedDict()
+        self.compiledCacheSize = COMPILED_QUERY_CACHE_SIZE
+        self.compiledLock = Lock() # matcher dipakai juga dari thread job search
+
+    def compileQuery(self, keywords, algorithm='KMP', caseSensitive=True) -> CompiledQuery:
+        """
+        Mengkompilasi keyword (tabel LPS / BM / automaton AC) dengan LRU cache
+
+        Argumen:
+            keywords (list): Daftar kata kunci
+            algorithm (str): Algoritma yang digunakan ('KMP', 'BM', 'AC', 'AUTO', dst. -- lihat CompiledQuery.ALGORITHMS)
+            caseSensitive (bool): Apakah pencarian sensitif terhadap huruf besar/kecil
+
+        Mengembalikan:
+            CompiledQuery: Query yang siap dipakai untuk banyak teks
+        """
+        key = (tuple(keywords), algorithm.upper(), caseSensitive)
+        with self.compiledLock:
+            compiled = self.compiledCache.get(key)
+            if compiled is not None:
+                self.compiledCache.move_to_end(key)
+                return compiled
+
+        compiled = CompiledQuery(keywords, algorithm, caseSensitive)
+        with self.compiledLock:
+            self.compiledCache[key] = compiled
+            if len(self.compiledCache) > self.compiledCacheSize:
+                self.compiledCache.popitem(last=False) # buang yang paling lama gak dipakai
+        return compiled
         
-    def exactMatch(self, text, keywords, algorithm='KMP') -> dict:
+    def exactMatch(self, text, keywords, algorithm='KMP', caseSensitive=True, folded=False) -> dict:
         """
         Melakukan pencocokan pola secara eksak
         
         Argumen:
             text (str): Teks yang akan dicari
             keywords (list): Daftar kata kunci yang akan dicari
-            algorithm (str): Algoritma yang digunakan ('KMP' atau 'BM')
+            algorithm (str): Algoritma yang digunakan ('KMP', 'BM', 'AC', 'AUTO', dst. -- lihat CompiledQuery.ALGORITHMS)
+            caseSensitive (bool): Apakah pencarian sensitif terhadap huruf besar/kecil
+            folded (bool): Teks sudah berupa companion fold (FoldedText.folded)
         
         Mengembalikan:
             dict: Hasil yang berisi kecocokan dan info waktu eksekusi
         """
         start = time.perf_counter()
-        # Pilih algoritma
-        if algorithm.upper() == 'KMP':
-            matches = self.kmp.searchMultiple(text, keywords)
-        elif algorithm.upper() == 'BM':
-            matches = self.boyerMoore.searchMultiple(text, keywords)
-        else:
-            raise ValueError(
-                "Algoritma tidak dikenali. Pilih 'KMP' atau 'BM' (atau 'AC')."
-            )
+        # Ambil query terkompilasi (tabel dihitung sekali per query, bukan per CV)
+        matches = self.compileQuery(keywords, algorithm, caseSensitive).searchMultiple(text, folded)
         # Siapkan hasil
         result = {}
         for kw in keywords:
@@ -65,6 +95,23 @@ class PatternMatcher:
             'execution_time_ms': f"{exec_ms:.2f}ms"
         }
 
+    def exactMatchPages(self, pages, keywords, algorithm='KMP', caseSensitive=True, needed=None) -> dict:
+        """
+        Pencocokan eksak dari halaman-halaman PDF yang dibaca secara lazy
+
+        Argumen:
+            pages (iterable): Teks per halaman (mis. PDFExtractor.iterMatchPages)
+            keywords (list): Daftar kata kunci yang akan dicari
+            algorithm (str): Algoritma yang digunakan ('KMP', 'BM', atau 'AC')
+            caseSensitive (bool): Apakah pencarian sensitif terhadap huruf besar/kecil
+            needed (int): Berhenti membaca halaman begitu semua keyword sudah
+                          muncul sebanyak ini (None = baca semua)
+
+        Mengembalikan:
+            dict: Dictionary yang memetakan keyword ke jumlah kemunculannya
+        """
+        return self.compileQuery(keywords, algorithm, caseSensitive).searchPages(pages, needed)
+
     def fuzzyMatch(self, text, keywords, threshold=0.7, caseSensitive=True) -> dict:
         """
         Melakukan pencocokan pola fuzzy menggunakan jarak Levenshtein
@@ -0,0 +1,55 @@
+"""
+Baseline str.find
+Tujuan: Pembanding untuk algoritma buatan sendiri, pencarian dikerjakan
+        str.find bawaan CPython (level C)
+"""
+
+try:
+    from .FoldedText import fold
+except ImportError:
+    # kalau file ini dijalankan langsung
+    from FoldedText import fold
+
+
+class StringFind:
+    """
+    Pencarian semua kemunculan (termasuk yang overlap) lewat str.find
+
+    Dipakai sebagai baseline di benchmark, bukan pilihan mode AUTO.
+    """
+
+    def preprocess(self, pattern):
+        """str.find gak butuh tabel"""
+        return None
+
+    def searchWithTable(self, text, pattern, table=None) -> list:
+        """
+        Argumen:
+            text (str): Teks yang akan dicari (sudah di-handle case-nya)
+            pattern (str): Pola yang akan dicari
+            table: Tidak dipakai (biar seragam dengan engine lain)
+
+        Mengembalikan:
+            list: Daftar posisi awal di mana pola ditemukan
+        """
+        if not pattern:
+            return []
+        result = []
+        i = text.find(pattern)
+        while i != -1:
+            result.append(i)
+            i = text.find(pattern, i + 1)
+        return result
+
+    def search(self, text, pattern, caseSensitive=True, folded=False) -> list:
+        if not caseSensitive:
+            if not folded:
+                text = fold(text)
+            pattern = fold(pattern)
+        return self.searchWithTable(text, pattern)
+
+    def searchMultiple(self, text, patterns, caseSensitive=True, folded=False) -> dict:
+        if not caseSensitive and not folded:
+            text = fold(text) # cukup sekali untuk semua pola
+            folded = True
+        return {pattern: self.search(text, pattern, caseSensitive, folded) for pattern in patterns}
@@ -0,0 +1,95 @@
+"""
+Implementasi Algoritma Sunday (Quick Search)
+Tujuan: Varian Boyer-Moore yang geserannya ditentukan dari karakter teks
+        tepat setelah jendela, jadi geseran maksimalnya len(pola) + 1
+"""
+
+try:
+    from .FoldedText import fold
+except ImportError:
+    # kalau file ini dijalankan langsung
+    from FoldedText import fold
+
+
+class Sunday:
+    """
+    Pencocokan pola Sunday / Quick Search
+
+    Setelah setiap percobaan, jendela digeser berdasarkan karakter teks
+    di posisi s + m: shift[c] = m - posisi terakhir c di pola, atau m + 1
+    kalau c tidak ada di pola.
+    """
+
+    def preprocess(self, pattern) -> dict:
+        """
+        Menghitung tabel shift Quick Search
+
+        Argumen:
+            pattern (str): Pola yang akan dicari
+
+        Mengembalikan:
+            dict: karakter -> besar geseran (karakter lain = len(pattern) + 1)
+        """
+        m = len(pattern)
+        shift = {}
+        for i, c in enumerate(pattern):
+            shift[c] = m - i # kemunculan terakhir yang menang
+        return shift
+
+    def searchWithTable(self, text, pattern, shift) -> list:
+        """
+        Pencarian Sunday memakai tabel shift yang sudah dihitung
+
+        Argumen:
+            text (str): Teks yang akan dicari (sudah di-handle case-nya)
+            pattern (str): Pola yang akan dicari
+            shift (dict): Hasil preprocess(pattern)
+
+        Mengembalikan:
+            list: Daftar posisi awal di mana pola ditemukan
+        """
+        n = len(text)
+        m = len(pattern)
+        if m == 0:
+            return []
+        result = []
+        first = pattern[0]
+        s = 0
+        while s <= n - m:
+            if text[s] == first and text.startswith(pattern, s):
+                result.append(s)
+            if s + m >= n: # gak ada karakter setelah jendela
+                break
+            s += shift.get(text[s + m], m + 1)
+        return result
+
+    def search(self, text, pattern, caseSensitive=True, folded=False) -> list:
+        """
+        Mencari pola dalam teks menggunakan Quick Search
+
+        Argumen:
+            text (str): Teks yang akan dicari
+            pattern (str): Pola yang akan dicari
+            caseSensitive (bool): Apakah pencarian sensitif terhadap huruf besar/kecil
+            folded (bool): Teks sudah berupa companion fold (FoldedText.folded)
+
+        Mengembalikan:
+            list: Daftar posisi awal di mana pola ditemukan
+        """
+        if not caseSensitive:
+            if not folded:
+                text = fold(text)
+            pattern = fold(pattern)
+        return self.searchWithTable(text, pattern, self.preprocess(pattern))
+
+    def searchMultiple(self, text, patterns, caseSensitive=True, folded=False) -> dict:
+        """
+        Mencari beberapa pola dalam teks
+
+        Mengembalikan:
+            dict: Dictionary yang memetakan pola ke posisi kemunculannya
+        """
+        if not caseSensitive and not folded:
+            text = fold(text) # cukup sekali untuk semua pola
+            folded = True
+        return {pattern: self.search(text, pattern, caseSensitive, folded) for pattern in patterns}
@@ -0,0 +1,145 @@
+"""
+Implementasi Algoritma Two-Way (Crochemore-Perrin)
+Tujuan: Pencocokan pola dengan memori tambahan konstan dan waktu linear,
+        berdasarkan faktorisasi kritis pola
+"""
+
+try:
+    from .FoldedText import fold
+except ImportError:
+    # kalau file ini dijalankan langsung
+    from FoldedText import fold
+
+
+class TwoWay:
+    """
+    Pencocokan pola Two-Way
+
+    Pola dibagi jadi x = u v di posisi kritis (ell). Bagian kanan v
+    dicocokkan kiri ke kanan, lalu bagian kiri u kanan ke kiri. Kalau pola
+    periodik, panjang prefix yang sudah pasti cocok diingat (memory) supaya
+    total perbandingan tetap linear.
+    """
+
+    def maximalSuffix(self, pattern, reverse=False):
+        """
+        Suffix maksimal secara leksikografis (atau urutan terbalik kalau reverse)
+
+        Mengembalikan:
+            tuple: (posisi sebelum suffix, periode suffix)
+        """
+        m = len(pattern)
+        ms = -1 # suffix maksimal mulai di ms + 1
+        j = 0
+        k = p = 1
+        while j + k < m:
+            a = pattern[j + k]
+            b = pattern[ms + k]
+            if (a > b) if reverse else (a < b):
+                j += k
+                k = 1
+                p = j - ms
+            elif a == b:
+                if k != p:
+                    k += 1
+                else:
+                    j += p
+                    k = 1
+            else:
+                ms = j
+                j = ms + 1
+                k = p = 1
+        return ms, p
+
+    def preprocess(self, pattern) -> tuple:
+        """
+        Menghitung faktorisasi kritis pola
+
+        Argumen:
+            pattern (str): Pola yang akan dicari
+
+        Mengembalikan:
+            tuple: (ell, periode, periodik)
+        """
+        m = len(pattern)
+        if m == 0:
+            return -1, 1, False
+        i, p = self.maximalSuffix(pattern)
+        j, q = self.maximalSuffix(pattern, reverse=True)
+        ell, per = (i, p) if i > j else (j, q)
+        # periodik kalau u adalah suffix dari v[:per]
+        periodic = per + ell + 1 <= m and pattern[:ell + 1] == pattern[per:per + ell + 1]
+        if not periodic:
+            per = max(ell + 1, m - ell - 1) + 1
+        return ell, per, periodic
+
+    def searchWithTable(self, text, pattern, table) -> list:
+        """
+        Pencarian Two-Way memakai faktorisasi yang sudah dihitung
+
+        Argumen:
+            text (str): Teks yang akan dicari (sudah di-handle case-nya)
+            pattern (str): Pola yang akan dicari
+            table (tuple): Hasil preprocess(pattern)
+
+        Mengembalikan:
+            list: Daftar posisi awal di mana pola ditemukan
+        """
+        n = len(text)
+        m = len(pattern)
+        if m == 0:
+            return []
+        ell, per, periodic = table
+        result = []
+        j = 0
+        memory = -1
+        while j <= n - m:
+            # bagian kanan, kiri ke kanan
+            i = max(ell, memory) + 1
+            while i < m and pattern[i] == text[i + j]:
+                i += 1
+            if i < m:
+                j += i - ell
+                memory = -1
+                continue
+            # bagian kiri, kanan ke kiri (yang sudah diingat gak dicek ulang)
+            i = ell
+            while i > memory and pattern[i] == text[i + j]:
+                i -= 1
+            if i <= memory:
+                result.append(j)
+            j += per
+            if periodic:
+                memory = m - per - 1
+        return result
+
+    def search(self, text, pattern, caseSensitive=True, folded=False) -> list:
+        """
+        Mencari pola dalam teks menggunakan Two-Way
+
+        Argumen:
+            text (str): Teks yang akan dicari
+            pattern (str): Pola yang akan dicari
+            caseSensitive (bool): Apakah pencarian sensitif terhadap huruf besar/kecil
+            folded (bool): Teks sudah berupa companion fold (FoldedText.folded)
+
+        Mengembalikan:
+            list: Daftar posisi awal di mana pola ditemukan
+        """
+        if not caseSensitive:
+            if not folded:
+                text = fold(text)
+            pattern = fold(pattern)
+        return self.searchWithTable(text, pattern, self.preprocess(pattern))
+
+    def searchMultiple(self, text, patterns, caseSensitive=True, folded=False) -> dict:
+        """
+        Mencari beberapa pola dalam teks
+
+        Mengembalikan:
+            dict: Dictionary yang memetakan pola ke posisi kemunculannya
+        """
+        if not caseSensitive and not folded:
+            text = fold(text) # cukup sekali untuk semua pola
+            folded = True
+        return {pattern: self.search(text, pattern, caseSensitive, folded) for pattern in patterns}
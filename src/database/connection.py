@@ -1,7 +1,9 @@
 
 import mysql.connector
-from mysql.connector import Error
+from mysql.connector import Error, pooling
 import logging
+import threading
+from contextlib import contextmanager
 from config import DATABASE_CONFIG
 from .models import DatabaseSchema 
 
@@ -14,6 +16,157 @@ if not logger.handlers:
     logger.setLevel(logging.INFO)
 
 
+def _serverConfig(withDatabase=True):
+    """Parameter koneksi MySQL dari DATABASE_CONFIG"""
+    cfg = {
+        'host':     DATABASE_CONFIG['host'],
+        'user':     DATABASE_CONFIG['user'],
+        'password': DATABASE_CONFIG['password'],
+        'port':     DATABASE_CONFIG['port'],
+    }
+    if withDatabase:
+        cfg['database'] = DATABASE_CONFIG['database']
+    return cfg
+
+
+class _PooledCursor:
+    """
+    Cursor dari pool: saat close(), koneksinya juga dikembalikan ke pool.
+    Jadi helper di queries.py (conn.cursor() ... cursor.close()) bisa
+    langsung dipakai dengan ConnectionPool sebagai conn.
+    """
+
+    def __init__(self, pool, conn, cursor):
+        self._pool = pool
+        self._conn = conn
+        self._cursor = cursor
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self._conn is None:
+            return
+        try:
+            self._cursor.close()
+        finally:
+            conn, self._conn = self._conn, None
+            self._pool.release(conn)
+
+
+class ConnectionPool:
+    """
+    Connection pool MySQL yang thread-safe
+
+    Setiap checkout di-ping dulu (reconnect kalau koneksinya putus), dan
+    kalau semua koneksi sedang dipakai, checkout menunggu sampai ada yang
+    dikembalikan (maksimal pool_timeout detik).
+
+    Pemakaian:
+        with pool.connection() as conn: ...
+        with pool.transaction() as cur: ...
+        with pool.cursor() as cur: ...
+        get_all_cv_paths(pool)   # helper queries.py menerima pool sebagai conn
+    """
+
+    def __init__(self, size=None, timeout=None, name="ats_pool"):
+        self.size = size or DATABASE_CONFIG.get('pool_size', 5)
+        self.timeout = timeout or DATABASE_CONFIG.get('pool_timeout', 30)
+        self.name = name
+        self.pool = None
+        self.lock = threading.Lock()
+        # pooling bawaan langsung error kalau pool habis, jadi dibatasi semaphore
+        self.slots = threading.BoundedSemaphore(self.size)
+
+    def _getPool(self):
+        with self.lock:
+            if self.pool is None:
+                self.pool = pooling.MySQLConnectionPool(
+                    pool_name=self.name,
+                    pool_size=self.size,
+                    pool_reset_session=True,
+                    **_serverConfig()
+                )
+                logger.info(f"Connection pool '{self.name}' dibuat ({self.size} koneksi).")
+            return self.pool
+
+    def acquire(self):
+        """Ambil koneksi sehat dari pool (wajib dikembalikan lewat release)"""
+        if not self.slots.acquire(timeout=self.timeout):
+            raise Error(msg=f"Timeout menunggu koneksi dari pool '{self.name}'")
+        try:
+            conn = self._getPool().get_connection()
+        except Exception:
+            self.slots.release()
+            raise
+        try:
+            # health check: koneksi yang lama nganggur bisa sudah diputus server
+            conn.ping(reconnect=True, attempts=3, delay=1)
+        except Exception:
+            self.release(conn)
+            raise
+        return conn
+
+    def release(self, conn):
+        """Kembalikan koneksi ke pool"""
+        try:
+            conn.close()
+        except Error as e:
+            logger.error(f"Gagal mengembalikan koneksi ke pool: {e}")
+        finally:
+            self.slots.release()
+
+    @contextmanager
+    def connection(self):
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    @contextmanager
+    def transaction(self):
+        """Cursor dalam satu transaksi: commit kalau sukses, rollback kalau error"""
+        with self.connection() as conn:
+            cur = conn.cursor(buffered=True)
+            try:
+                yield cur
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                cur.close()
+
+    def cursor(self):
+        """Cursor yang mengembalikan koneksinya ke pool saat close()"""
+        conn = self.acquire()
+        try:
+            return _PooledCursor(self, conn, conn.cursor(buffered=True))
+        except Exception:
+            self.release(conn)
+            raise
+
+
+_pool = None
+_poolLock = threading.Lock()
+
+
+def getPool():
+    """Connection pool bersama untuk seluruh aplikasi"""
+    global _pool
+    with _poolLock:
+        if _pool is None:
+            _pool = ConnectionPool()
+        return _pool
+
+
 class DatabaseConnection:
     def __init__(self):
         """Inisialisasi koneksi database"""
@@ -21,18 +174,16 @@ class DatabaseConnection:
         self.cursor = None
 
     def connect(self):
+        if self.connection is not None:
+            self.disconnect() # jangan sampai koneksi lama nyangkut di luar pool
         try:
-            self.connection = mysql.connector.connect(
-                host     = DATABASE_CONFIG['host'],
-                user     = DATABASE_CONFIG['user'],
-                password = DATABASE_CONFIG['password'],
-                database = DATABASE_CONFIG['database'],
-                port     = DATABASE_CONFIG['port']
-            )
+            # koneksi diambil dari pool bersama, disconnect() mengembalikannya
+            self.connection = getPool().acquire()
             self.cursor = self.connection.cursor(buffered=True)
             logger.info("Koneksi ke database berhasil.")
             return True
         except Error as e:
+            self.connection = None
             logger.error(f"Gagal terkoneksi ke MySQL: {e}")
             return False
 
@@ -41,11 +192,14 @@ class DatabaseConnection:
             if self.cursor:
                 self.cursor.close()
                 logger.info("Cursor ditutup.")
-            if self.connection:
-                self.connection.close()
-                logger.info("Koneksi database ditutup.")
         except Error as e:
             logger.error(f"Error saat menutup koneksi: {e}")
+        finally:
+            if self.connection:
+                getPool().release(self.connection)
+                logger.info("Koneksi database dikembalikan ke pool.")
+            self.connection = None
+            self.cursor = None
 
     def execute(self, query, params=None):
         if self.connection is None or self.cursor is None:
@@ -99,7 +253,8 @@ class DatabaseConnection:
         # ambil perintah create tabel dari DatabaseSchema
         statements = [
             DatabaseSchema.CREATE_APPLICANT_PROFILE,
-            DatabaseSchema.CREATE_APPLICATION_DETAIL
+            DatabaseSchema.CREATE_APPLICATION_DETAIL,
+            DatabaseSchema.CREATE_DATA_VERSION
         ]
 
         # ini pastiin koneksi dibuka
@@ -119,17 +274,62 @@ class DatabaseConnection:
         except Error as e:
             logger.error(f"Gagal commit setelah createTables: {e}")
         finally:
+            self.migrate()
             self.disconnect()
+
+    def migrate(self) -> bool:
+        """
+        Jalankan migrasi skema yang belum diterapkan (aman dipanggil berulang)
+
+        Mengembalikan:
+            bool: False kalau ada migrasi yang gagal (mis. index cv_path_hash
+                  belum ada, jadi lookup cv_path masih full table scan)
+        """
+        if self.connection is None or self.cursor is None:
+            if not self.connect():
+                return False
+        ok = True
+        for table, name, stmt in DatabaseSchema.MIGRATIONS:
+            try:
+                # kolom atau index dengan nama ini sudah ada -> migrasi sudah jalan
+                self.cursor.execute(
+                    "SELECT "
+                    "(SELECT COUNT(*) FROM information_schema.COLUMNS "
+                    " WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = %s) + "
+                    "(SELECT COUNT(*) FROM information_schema.STATISTICS "
+                    " WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND INDEX_NAME = %s);",
+                    (table, name, table, name)
+                )
+                if self.cursor.fetchone()[0]:
+                    continue
+                self.cursor.execute(stmt)
+                self.connection.commit()
+                logger.info(f"Migrasi {table}.{name} diterapkan.")
+            except Error as e:
+                logger.error(f"Migrasi {table}.{name} gagal (dicoba lagi di startup berikutnya): {e}")
+                ok = False
+        for table, name in DatabaseSchema.DROPPED_INDEXES:
+            try:
+                self.cursor.execute(
+                    "SELECT COUNT(*) FROM information_schema.STATISTICS "
+                    "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND INDEX_NAME = %s;",
+                    (table, name)
+                )
+                if not self.cursor.fetchone()[0]:
+                    continue
+                self.cursor.execute(f"ALTER TABLE {table} DROP INDEX {name};")
+                self.connection.commit()
+                logger.info(f"Index lama {table}.{name} dihapus.")
+            except Error as e:
+                logger.error(f"Gagal menghapus index {table}.{name}: {e}")
+                ok = False
+        return ok
     
     def createDatabase(self, db_name: str) -> bool:
         # koneksi tanpa database dulu
         try:
-            tmp_conn = mysql.connector.connect(
-                host     = DATABASE_CONFIG['host'],
-                user     = DATABASE_CONFIG['user'],
-                password = DATABASE_CONFIG['password'],
-                port     = DATABASE_CONFIG['port'],
-            )
+            # database mungkin belum ada, jadi pakai koneksi server di luar pool
+            tmp_conn = mysql.connector.connect(**_serverConfig(withDatabase=False))
             tmp_cursor = tmp_conn.cursor()
             tmp_cursor.execute(f"CREATE DATABASE IF NOT EXISTS `{db_name}` CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci;")
             tmp_conn.commit()
@@ -154,16 +354,9 @@ class DatabaseConnection:
             return False
     
     def dropDatabase(self, db_name: str) -> bool:
-        from mysql.connector import connect, Error
-
         try:
             # koneksi sementara tanpa pilih database
-            tmp = connect(
-                host     = DATABASE_CONFIG['host'],
-                user     = DATABASE_CONFIG['user'],
-                password = DATABASE_CONFIG['password'],
-                port     = DATABASE_CONFIG['port']
-            )
+            tmp = mysql.connector.connect(**_serverConfig(withDatabase=False))
             cur = tmp.cursor()
             cur.execute(f"DROP DATABASE IF EXISTS `{db_name}`;")
             tmp.commit()
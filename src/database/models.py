@@ -90,9 +90,49 @@ class DatabaseSchema:
         applicant_id      INT              NOT NULL,
         application_role  VARCHAR(100)     DEFAULT NULL,
         cv_path           TEXT             NOT NULL,
+        cv_path_hash      CHAR(40)         AS (SHA1(cv_path)) STORED,
         PRIMARY KEY (application_id),
+        KEY idx_cv_path_hash (cv_path_hash),
+        KEY idx_applicant_id (applicant_id),
         FOREIGN KEY (applicant_id)
             REFERENCES ApplicantProfile(applicant_id)
             ON DELETE CASCADE
     ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
     """
+
+    # Penanda versi data pelamar: seeder menaikkan generation setiap kali
+    # menulis, aplikasi cukup baca satu baris ini (lihat queries._table_state)
+    CREATE_DATA_VERSION = """
+    CREATE TABLE IF NOT EXISTS DataVersion (
+        id          TINYINT          NOT NULL,
+        generation  BIGINT           NOT NULL DEFAULT 0,
+        PRIMARY KEY (id)
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+    """
+
+    BUMP_DATA_VERSION = (
+        "INSERT INTO DataVersion (id, generation) VALUES (1, 1) "
+        "ON DUPLICATE KEY UPDATE generation = generation + 1;"
+    )
+
+    # Migrasi untuk database yang dibuat sebelum ada kolom/index di atas.
+    # cv_path TEXT gak bisa di-index langsung, jadi lookup lewat SHA1(cv_path)
+    # yang fixed-width: WHERE cv_path_hash = SHA1(%s)
+    # format: (tabel, nama kolom/index, statement)
+    MIGRATIONS = [
+        ("ApplicationDetail", "cv_path_hash",
+         "ALTER TABLE ApplicationDetail "
+         "ADD COLUMN cv_path_hash CHAR(40) AS (SHA1(cv_path)) STORED;"),
+        # bukan UNIQUE: satu CV boleh dipakai di beberapa lamaran (seeding.sql
+        # punya cv_path yang sama untuk beberapa baris)
+        ("ApplicationDetail", "idx_cv_path_hash",
+         "ALTER TABLE ApplicationDetail ADD KEY idx_cv_path_hash (cv_path_hash);"),
+        ("ApplicationDetail", "idx_applicant_id",
+         "ALTER TABLE ApplicationDetail ADD KEY idx_applicant_id (applicant_id);"),
+        ("DataVersion", "generation", CREATE_DATA_VERSION),
+    ]
+
+    # Index lama yang dibuang kalau masih ada: (tabel, nama index)
+    DROPPED_INDEXES = [
+        ("ApplicationDetail", "uq_cv_path_hash"),
+    ]
@@ -1,236 +1,308 @@
 from .connection import DatabaseConnection
 from .models import ApplicantProfile, ApplicationDetail
+import time
 import logging
 from src.models.ResultCard import ResultCard
 from src.models.SummaryCard import SummaryData
+from src.pdfprocessor.pdfExtractor import sharedPDFExtractor
+from src.pdfprocessor.regexExtractor import sharedRegexExtractor
 
-def get_applicant_id_by_cv_path(conn, cv_path):
+# Kolom satu baris profil lengkap (ApplicantProfile + ApplicationDetail)
+PROFILE_COLUMNS = (
+    "applicant_id", "first_name", "last_name", "date_of_birth", "address",
+    "phone_number", "application_id", "application_role", "cv_path",
+)
+_COL = {name: i for i, name in enumerate(PROFILE_COLUMNS)}
+
+# primary key ApplicationDetail: application_id (DatabaseSchema) atau
+# detail_id (dump seeding.sql / ats_database.sql), di-alias jadi application_id
+_PROFILE_SELECT = (
+    "SELECT ap.applicant_id, ap.first_name, ap.last_name, ap.date_of_birth, "
+    "ap.address, ap.phone_number, ad.{id_column} AS application_id, ad.application_role, ad.cv_path "
+    "FROM ApplicantProfile ap "
+    "JOIN ApplicationDetail ad ON ap.applicant_id = ad.applicant_id"
+)
+
+# versi data pelamar dicek ulang (lihat _table_state) paling sering tiap sekian detik
+PROFILE_CACHE_CHECK_SECONDS = 5.0
+
+# cv_path -> tuple baris (urutan PROFILE_COLUMNS); None = belum di-load
+_profile_cache = None
+# versi data waktu cache di-load, dan kapan terakhir dicek
+_profile_state = None
+_profile_checked = 0.0
+# nama kolom primary key ApplicationDetail, dicari sekali
+_id_column = None
+
+
+def _profile_select(conn):
+    """Query profil lengkap sesuai skema ApplicationDetail yang ada di database"""
+    global _id_column
+    if _id_column is None:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(
+                "SELECT COUNT(*) FROM information_schema.COLUMNS "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'ApplicationDetail' "
+                "AND COLUMN_NAME = 'application_id';"
+            )
+            _id_column = "application_id" if cursor.fetchone()[0] else "detail_id"
+        finally:
+            cursor.close()
+    return _PROFILE_SELECT.format(id_column=_id_column)
+
+
+def _table_state(conn):
+    """
+    Penanda versi data pelamar yang murah (semua lookup lewat primary key, gak scan tabel)
+
+    DataVersion.generation dinaikkan seeder setiap kali menulis (termasuk
+    TRUNCATE + isi ulang dengan jumlah yang sama), MAX id menangkap insert
+    dari luar seeder.
+
+    Mengembalikan:
+        tuple: (generation, MAX applicant_id, MAX id ApplicationDetail), atau
+               None kalau gagal dibaca (mis. tabel DataVersion belum ada)
+    """
+    _profile_select(conn) # pastikan _id_column sudah diketahui
     cursor = conn.cursor()
     try:
-        query = (
-            "SELECT ap.applicant_id "
-            "FROM ApplicantProfile ap "
-            "JOIN ApplicationDetail ad ON ap.applicant_id = ad.applicant_id "
-            "WHERE ad.cv_path = %s;"
+        cursor.execute(
+            "SELECT (SELECT generation FROM DataVersion WHERE id = 1), "
+            "(SELECT MAX(applicant_id) FROM ApplicantProfile), "
+            f"(SELECT MAX({_id_column}) FROM ApplicationDetail);"
         )
-        cursor.execute(query, (cv_path,))
-        row = cursor.fetchone()
-        cursor.fetchall()  # Consume any remaining results
-        return row[0] if row else None
+        return tuple(cursor.fetchone())
     except Exception as e:
-        print(f"Error in get_applicant_id_by_cv_path: {e}")
+        print(f"Error in _table_state: {e}")
         return None
     finally:
         cursor.close()
 
 
-def get_first_name_by_cv_path(conn, cv_path):
-    cursor = conn.cursor()
+def load_profile_cache(conn):
+    """
+    Ambil semua profil pelamar sekaligus (satu query) ke cache di memori
+
+    Mengembalikan:
+        int: Jumlah baris yang di-cache
+    """
+    global _profile_cache, _profile_state, _profile_checked, _id_column
+    _id_column = None # skema bisa berubah (migrasi / import dump), dicek ulang
+    cursor = None
     try:
-        query = (
-            "SELECT ap.first_name "
-            "FROM ApplicantProfile ap "
-            "JOIN ApplicationDetail ad ON ap.applicant_id = ad.applicant_id "
-            "WHERE ad.cv_path = %s;"
-        )
-        cursor.execute(query, (cv_path,))
-        row = cursor.fetchone()
-        cursor.fetchall()  # Consume any remaining results
-        return row[0] if row else None
+        select = _profile_select(conn)
+        # versi diambil sebelum SELECT, jadi tulisan di antaranya ketahuan di cek berikutnya
+        state = _table_state(conn)
+        cursor = conn.cursor()
+        cursor.execute(select + ";")
+        cache = {}
+        for row in cursor.fetchall():
+            cache.setdefault(row[_COL["cv_path"]], tuple(row))
+        _profile_cache = cache
+        _profile_state = state
+        _profile_checked = time.monotonic()
+        return len(cache)
     except Exception as e:
-        print(f"Error in get_first_name_by_cv_path: {e}")
-        return None
+        print(f"Error in load_profile_cache: {e}")
+        return 0
     finally:
-        cursor.close()
+        if cursor is not None:
+            cursor.close()
 
 
-def get_last_name_by_cv_path(conn, cv_path):
-    cursor = conn.cursor()
+def _refresh_profile_cache(conn):
+    """
+    Load ulang cache profil kalau isi tabel sudah berubah sejak di-load
+
+    Seeder jalan di proses lain, jadi perubahan dideteksi dari penanda
+    versi di database (_table_state), bukan dari sinyal di memori.
+    """
+    global _profile_checked
+    if _profile_cache is None or time.monotonic() - _profile_checked < PROFILE_CACHE_CHECK_SECONDS:
+        return
+    _profile_checked = time.monotonic()
     try:
-        query = (
-            "SELECT ap.last_name "
-            "FROM ApplicantProfile ap "
-            "JOIN ApplicationDetail ad ON ap.applicant_id = ad.applicant_id "
-            "WHERE ad.cv_path = %s;"
-        )
-        cursor.execute(query, (cv_path,))
-        row = cursor.fetchone()
-        cursor.fetchall()  # Consume any remaining results
-        return row[0] if row else None
+        state = _table_state(conn)
     except Exception as e:
-        print(f"Error in get_last_name_by_cv_path: {e}")
-        return None
-    finally:
-        cursor.close()
+        print(f"Error in _refresh_profile_cache: {e}")
+        return
+    # None = versi gak bisa dibaca, cache lama tetap dipakai (gak reload tiap cek)
+    if state is not None and state != _profile_state:
+        load_profile_cache(conn)
 
 
-def get_date_of_birth_by_cv_path(conn, cv_path):
-    cursor = conn.cursor()
+def _get_profile_row(conn, cv_path):
+    """Baris profil lengkap untuk satu cv_path: dari cache, kalau gak ada baru query"""
+    _refresh_profile_cache(conn)
+    if _profile_cache is not None and cv_path in _profile_cache:
+        return _profile_cache[cv_path]
+    cursor = None
     try:
-        query = (
-            "SELECT ap.date_of_birth "
-            "FROM ApplicantProfile ap "
-            "JOIN ApplicationDetail ad ON ap.applicant_id = ad.applicant_id "
-            "WHERE ad.cv_path = %s;"
-        )
-        cursor.execute(query, (cv_path,))
+        select = _profile_select(conn)
+        cursor = conn.cursor()
+        cursor.execute(select + " WHERE ad.cv_path_hash = SHA1(%s);", (cv_path,))
         row = cursor.fetchone()
         cursor.fetchall()  # Consume any remaining results
-        return row[0] if row else None
+        if not row:
+            return None
+        row = tuple(row)
+        if _profile_cache is not None:
+            _profile_cache[cv_path] = row
+        return row
     except Exception as e:
-        print(f"Error in get_date_of_birth_by_cv_path: {e}")
+        print(f"Error in _get_profile_row: {e}")
         return None
     finally:
-        cursor.close()
+        if cursor is not None:
+            cursor.close()
 
 
-def get_address_by_cv_path(conn, cv_path):
-    cursor = conn.cursor()
-    try:
-        query = (
-            "SELECT ap.address "
-            "FROM ApplicantProfile ap "
-            "JOIN ApplicationDetail ad ON ap.applicant_id = ad.applicant_id "
-            "WHERE ad.cv_path = %s;"
-        )
-        cursor.execute(query, (cv_path,))
-        row = cursor.fetchone()
-        cursor.fetchall()  # Consume any remaining results
-        return row[0] if row else None
-    except Exception as e:
-        print(f"Error in get_address_by_cv_path: {e}")
+def get_profile_by_cv_path(conn, cv_path):
+    """
+    Profil lengkap pelamar untuk satu CV
+
+    Mengembalikan:
+        tuple: (ApplicantProfile, ApplicationDetail), atau None kalau gak ada
+    """
+    row = _get_profile_row(conn, cv_path)
+    if row is None:
         return None
-    finally:
-        cursor.close()
+    profile = ApplicantProfile(
+        applicant_id=row[_COL["applicant_id"]],
+        first_name=row[_COL["first_name"]],
+        last_name=row[_COL["last_name"]],
+        date_of_birth=row[_COL["date_of_birth"]],
+        address=row[_COL["address"]] or "",
+        phone_number=row[_COL["phone_number"]] or "",
+    )
+    detail = ApplicationDetail(
+        application_id=row[_COL["application_id"]],
+        applicant_id=row[_COL["applicant_id"]],
+        application_role=row[_COL["application_role"]] or "",
+        cv_path=row[_COL["cv_path"]],
+    )
+    return profile, detail
+
+
+def _get_profile_field(conn, cv_path, column):
+    row = _get_profile_row(conn, cv_path)
+    return row[_COL[column]] if row else None
+
+
+def get_applicant_id_by_cv_path(conn, cv_path):
+    return _get_profile_field(conn, cv_path, "applicant_id")
+
+
+def get_first_name_by_cv_path(conn, cv_path):
+    return _get_profile_field(conn, cv_path, "first_name")
+
+
+def get_last_name_by_cv_path(conn, cv_path):
+    return _get_profile_field(conn, cv_path, "last_name")
+
+
+def get_date_of_birth_by_cv_path(conn, cv_path):
+    return _get_profile_field(conn, cv_path, "date_of_birth")
+
+
+def get_address_by_cv_path(conn, cv_path):
+    return _get_profile_field(conn, cv_path, "address")
 
 
 def get_phone_number_by_cv_path(conn, cv_path):
-    cursor = conn.cursor()
-    try:
-        query = (
-            "SELECT ap.phone_number "
-            "FROM ApplicantProfile ap "
-            "JOIN ApplicationDetail ad ON ap.applicant_id = ad.applicant_id "
-            "WHERE ad.cv_path = %s;"
-        )
-        cursor.execute(query, (cv_path,))
-        row = cursor.fetchone()
-        cursor.fetchall()  # Consume any remaining results
-        return row[0] if row else None
-    except Exception as e:
-        print(f"Error in get_phone_number_by_cv_path: {e}")
-        return None
-    finally:
-        cursor.close()
+    return _get_profile_field(conn, cv_path, "phone_number")
 
 
 def get_application_id_by_cv_path(conn, cv_path):
-    cursor = conn.cursor()
-    try:
-        query = (
-            "SELECT ad.application_id "
-            "FROM ApplicationDetail ad "
-            "WHERE ad.cv_path = %s;"
-        )
-        cursor.execute(query, (cv_path,))
-        row = cursor.fetchone()
-        cursor.fetchall()  # Consume any remaining results
-        return row[0] if row else None
-    except Exception as e:
-        print(f"Error in get_application_id_by_cv_path: {e}")
-        return None
-    finally:
-        cursor.close()
+    return _get_profile_field(conn, cv_path, "application_id")
 
 
 def get_application_role_by_cv_path(conn, cv_path):
-    cursor = conn.cursor()
-    try:
-        query = (
-            "SELECT ad.application_role "
-            "FROM ApplicationDetail ad "
-            "WHERE ad.cv_path = %s;"
-        )
-        cursor.execute(query, (cv_path,))
-        row = cursor.fetchone()
-        cursor.fetchall()  # Consume any remaining results
-        return row[0] if row else None
-    except Exception as e:
-        print(f"Error in get_application_role_by_cv_path: {e}")
-        return None
-    finally:
-        cursor.close()
+    return _get_profile_field(conn, cv_path, "application_role")
+
+
+def _full_name(row):
+    # nama yang NULL dilewati (sama dengan CONCAT_WS), bukan jadi "None"
+    return " ".join(part for part in (row[_COL["first_name"]], row[_COL["last_name"]]) if part)
 
 
 def get_result_card_by_cv_path(conn, cv_path):
+    row = _get_profile_row(conn, cv_path)
+    if not row:
+        return None
+    return ResultCard(full_name=_full_name(row), cv_path=row[_COL["cv_path"]])
+
+
+def get_result_cards_by_cv_paths(conn, cv_paths, batch_size=500):
+    """
+    Ambil ResultCard (nama lengkap) banyak CV sekaligus, satu query per batch
+
+    Mengembalikan:
+        dict: cv_path -> ResultCard (cv_path yang gak ada di database gak ikut)
+    """
+    _refresh_profile_cache(conn)
+    cards = {}
+    paths = []
+    for path in dict.fromkeys(cv_paths):
+        if _profile_cache is not None and path in _profile_cache:
+            cards[path] = ResultCard(full_name=_full_name(_profile_cache[path]), cv_path=path)
+        else:
+            paths.append(path)
+    if not paths:
+        return cards
     cursor = conn.cursor()
     try:
-        cursor.execute(
-            "SELECT CONCAT(ap.first_name, ' ', ap.last_name) AS full_name, ad.cv_path "
-            "FROM ApplicantProfile ap "
-            "JOIN ApplicationDetail ad ON ap.applicant_id = ad.applicant_id "
-            "WHERE ad.cv_path = %s;", (cv_path,)
-        )
-        row = cursor.fetchone()
-        # Consume any remaining results
-        cursor.fetchall()
-        if not row:
-            return None
-        full_name, path = row
-        return ResultCard(full_name=full_name, cv_path=path)
+        for i in range(0, len(paths), batch_size):
+            batch = paths[i:i + batch_size]
+            placeholders = ", ".join(["SHA1(%s)"] * len(batch))
+            cursor.execute(
+                "SELECT CONCAT_WS(' ', ap.first_name, ap.last_name) AS full_name, ad.cv_path "
+                "FROM ApplicantProfile ap "
+                "JOIN ApplicationDetail ad ON ap.applicant_id = ad.applicant_id "
+                f"WHERE ad.cv_path_hash IN ({placeholders});", tuple(batch)
+            )
+            for full_name, path in cursor.fetchall():
+                cards.setdefault(path, ResultCard(full_name=full_name, cv_path=path))
+        return cards
     except Exception as e:
-        print(f"Error in get_result_card_by_cv_path: {e}")
-        return None
+        print(f"Error in get_result_cards_by_cv_paths: {e}")
+        return cards
     finally:
         cursor.close()
 
 
-def get_summary_data_by_cv_path(conn, cv_path):
-    from src.pdfprocessor.pdfExtractor import PDFExtractor
-    from src.pdfprocessor.regexExtractor import RegexExtractor
-    
-    cursor = conn.cursor()
-    
+def get_summary_data_by_cv_path(conn, cv_path, text_cache=None):
     # Initialize extracted data variables
     skills_list = []
     work_experience_list = []
     education_list = []
     
     try:
-        cursor.execute(
-            "SELECT CONCAT(ap.first_name, ' ', ap.last_name) AS full_name, "
-            "ap.date_of_birth, ap.phone_number, ad.cv_path "
-            "FROM ApplicantProfile ap "
-            "JOIN ApplicationDetail ad ON ap.applicant_id = ad.applicant_id "
-            "WHERE ad.cv_path = %s;", (cv_path,)
-        )
-        row = cursor.fetchone()
-        # Consume any remaining results
-        cursor.fetchall()
+        row = _get_profile_row(conn, cv_path)
         if not row:
             return None
-        full_name, dob, phone, path = row
+        full_name = _full_name(row)
+        dob = row[_COL["date_of_birth"]]
+        phone = row[_COL["phone_number"]]
+        path = row[_COL["cv_path"]]
         dob_str = dob.isoformat() if dob else ""
-          # Extract CV data
+        # Extract CV data
         try:
-            print("Attempting to extract CV data...")
-            pdf_extractor = PDFExtractor()
-            regex_extractor = RegexExtractor()
-            
             # Create full path for PDF extraction
             pdf_full_path = f"src/archive/data/{cv_path}"
-            print(f"PDF path: {pdf_full_path}")
-            
-            # Extract text from PDF
-            extracted_text = pdf_extractor.PDFExtractForMatch(pdf_full_path)
-            if extracted_text:
-                print(f"PDF extracted successfully, {len(extracted_text)} characters")
-                # Extract CV sections
-                cv_sections = regex_extractor.extract_cv_sections(extracted_text)
+
+            if text_cache is not None:
+                # sections sudah dihitung waktu preload, tinggal baca dari TextCache
+                cv_sections = text_cache.getOrExtractSections(cv_path, pdf_full_path, sharedPDFExtractor)
+            else:
+                extracted_text = sharedPDFExtractor.PDFExtractForMatch(pdf_full_path)
+                cv_sections = sharedRegexExtractor.extract_cv_sections(extracted_text) if extracted_text else None
+            if cv_sections:
                 skills_list = cv_sections['skills']
                 work_experience_list = cv_sections['work_experience']
                 education_list = cv_sections['education']
-                print(f"CV sections extracted: {len(skills_list)} skills, {len(work_experience_list)} experience, {len(education_list)} education")
+                print(f"CV sections loaded: {len(skills_list)} skills, {len(work_experience_list)} experience, {len(education_list)} education")
             else:
                 print("No text extracted from PDF")
         except Exception as cv_error:
@@ -249,8 +321,6 @@ def get_summary_data_by_cv_path(conn, cv_path):
     except Exception as e:
         print(f"Error in get_summary_data_by_cv_path: {e}")
         return None
-    finally:
-        cursor.close()
 
 def get_all_cv_paths(conn):
     cursor = conn.cursor()
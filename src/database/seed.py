@@ -1,12 +1,18 @@
 import csv
 import os
-import logging
+import sys
+import time
 import random
+import argparse
+import logging
 from pathlib import Path
 from faker import Faker
-from config import DATABASE_CONFIG
+from mysql.connector import Error
+from config import DATABASE_CONFIG, SEED_COUNT, SEED_BATCH_SIZE
 
 from .connection import DatabaseConnection
+from .models import DatabaseSchema
+from src.utils.DataDirIndex import getDataDirIndex
 from config import RESUME_CSV_PATH, DATA_DIR
 
 
@@ -21,6 +27,11 @@ class DataSeeder:
             self.logger.addHandler(h)
             self.logger.setLevel(logging.INFO)
 
+    def bumpDataVersion(self):
+        """Naikkan DataVersion.generation supaya cache profil di aplikasi tahu datanya berubah"""
+        if not self.db.execute(DatabaseSchema.BUMP_DATA_VERSION):
+            self.logger.warning("bumpDataVersion: Gagal update DataVersion, cache profil aplikasi bisa telat diperbarui.")
+
     def clearAllData(self):
         if not self.db.connect():
             self.logger.error("clearAllData: Gagal koneksi.")
@@ -31,6 +42,7 @@ class DataSeeder:
             self.db.execute("TRUNCATE TABLE ApplicationDetail;")
             self.db.execute("TRUNCATE TABLE ApplicantProfile;")
             self.db.execute("SET FOREIGN_KEY_CHECKS=1;")
+            self.bumpDataVersion()
             self.logger.info("clearAllData: Semua tabel ditruncate.")
         except Exception as e:
             self.logger.error(f"clearAllData: {e}")
@@ -43,16 +55,16 @@ class DataSeeder:
         if not self.db.connect():
             self.logger.error("generateSampleApplicants: Gagal koneksi.")
             return
-        used_cv_paths = set()
-
         fake = Faker()
-        base_data_dir = Path(DATA_DIR)
+        data_index = getDataDirIndex(DATA_DIR)
 
-        role_dirs = [d for d in base_data_dir.iterdir() if d.is_dir()]
-        if not role_dirs:
-            self.logger.error(f"generateSampleApplicants: Tidak ada subfolder di {base_data_dir}")
+        # folder data di-scan sekali, tiap CV diambil dari pool teracak per role
+        roles = data_index.roleNames()
+        if not roles:
+            self.logger.error(f"generateSampleApplicants: Tidak ada subfolder di {DATA_DIR}")
             self.db.disconnect()
             return
+        cv_pool = data_index.pool()
 
         for _ in range(count):
             # dummy si AP
@@ -82,38 +94,21 @@ class DataSeeder:
             )
 
             # pilih 1 folder dari folder data
-            chosen_role_dir = random.choice(role_dirs)
-            application_role = chosen_role_dir.name
+            application_role = random.choice(roles)
 
-            # milih pdf dari folder itu
-            pdf_files = list(chosen_role_dir.glob("*.pdf"))
-            if not pdf_files:
+            # ambil pdf yang belum dipakai di batch ini dari folder itu, O(1)
+            chosen_pdf = cv_pool.pop(application_role)
+            if chosen_pdf is None:
                 self.logger.warning(
-                    f"generateSampleApplicants: Folder '{application_role}' kosong (tidak ada PDF), "
+                    f"Semua CV di folder '{application_role}' sudah dipakai (atau folder kosong), "
                     f"skipping ApplicationDetail untuk applicant_id={new_applicant_id}"
                 )
                 continue
-
-            # hanya ambil pdf yang belum dipakai di batch ini
-            available = [p for p in pdf_files if str(p) not in used_cv_paths]
-            if not available:
-                self.logger.warning(
-                    f"Semua CV di folder '{application_role}' sudah dipakai, "
-                    "lanjut ke kandidat berikutnya"
-                )
-                continue
-            chosen_pdf = random.choice(available)
             cv_path = str(chosen_pdf)
 
-            # skip kalo udah used in this batch
-            if cv_path in used_cv_paths:
-                self.logger.info(f"Skipping duplicate CV in batch: {cv_path}")
-                continue
-            used_cv_paths.add(cv_path)
-
             # skip kalo cv_path udah exists di DB
             self.db.cursor.execute(
-                "SELECT 1 FROM ApplicationDetail WHERE cv_path = %s", (cv_path,)
+                "SELECT 1 FROM ApplicationDetail WHERE cv_path_hash = SHA1(%s)", (cv_path,)
             )
             if self.db.cursor.fetchone():
                 self.logger.info(f"Skipping, CV already in DB: {cv_path}")
@@ -137,29 +132,133 @@ class DataSeeder:
                     f"generateSampleApplicants: Gagal insert ApplicationDetail untuk applicant_id={new_applicant_id}"
                 )
 
+        # data pelamar berubah, aplikasi yang lagi jalan load ulang cache profilnya
+        self.bumpDataVersion()
+
         # trus tutup
         self.db.disconnect()
 
+    def generateBulkApplicants(self, count=None, batchSize=None):
+        """
+        Mode bulk untuk load testing: data disiapkan di memori lalu ditulis
+        pakai executemany, satu transaksi per batch
+
+        - cv_path yang sudah ada di DB diambil sekali jadi set (gak ada SELECT per applicant)
+        - applicant_id diisi langsung dari MAX(applicant_id) + 1, jadi gak perlu lastrowid
+        - sama seperti generateSampleApplicants, kalau CV sudah habis applicant
+          tetap dibuat tapi tanpa ApplicationDetail
+
+        Argumen:
+            count (int): Jumlah applicant (default: SEED_COUNT)
+            batchSize (int): Baris per batch / transaksi (default: SEED_BATCH_SIZE)
+
+        Mengembalikan:
+            int: Jumlah applicant yang berhasil ditulis
+        """
+        count = count or SEED_COUNT
+        batchSize = batchSize or SEED_BATCH_SIZE
+        if not self.db.connect():
+            self.logger.error("generateBulkApplicants: Gagal koneksi.")
+            return 0
+
+        start = time.perf_counter()
+        fake = Faker()
+        data_index = getDataDirIndex(DATA_DIR)
+
+        # CV yang sudah ada di DB diambil sekali, sisanya jadi pool teracak per role
+        used_cv_paths = {row[0] for row in self.db.fetchAll("SELECT cv_path FROM ApplicationDetail")}
+        cv_pool = data_index.pool(exclude=used_cv_paths)
+
+        row = self.db.fetchOne("SELECT COALESCE(MAX(applicant_id), 0) FROM ApplicantProfile")
+        next_id = (row[0] if row else 0) + 1
+
+        insert_profile = """
+            INSERT INTO ApplicantProfile
+              (applicant_id, first_name, last_name, date_of_birth, address, phone_number)
+            VALUES (%s, %s, %s, %s, %s, %s)
+        """
+        insert_detail = """
+            INSERT INTO ApplicationDetail
+              (applicant_id, application_role, cv_path)
+            VALUES (%s, %s, %s)
+        """
+
+        written = 0
+        details_written = 0
+        cursor = self.db.connection.cursor()
+        try:
+            for batch_start in range(0, count, batchSize):
+                profiles = []
+                details = []
+                for applicant_id in range(next_id + batch_start, next_id + min(batch_start + batchSize, count)):
+                    profiles.append((
+                        applicant_id,
+                        fake.first_name(),
+                        fake.last_name(),
+                        fake.date_of_birth(minimum_age=18, maximum_age=60),
+                        fake.address().replace("\n", ", "),
+                        f"0812{random.randint(10_000_000, 99_999_999)}",
+                    ))
+                    chosen_pdf = cv_pool.pop()
+                    if chosen_pdf is not None:
+                        # format cv_path sama dengan yang dipakai aplikasi
+                        details.append((applicant_id, chosen_pdf.parent.name, data_index.cvPath(chosen_pdf)))
+
+                try:
+                    cursor.executemany(insert_profile, profiles)
+                    if details:
+                        cursor.executemany(insert_detail, details)
+                    self.db.connection.commit()
+                except Error as e:
+                    self.db.connection.rollback()
+                    self.logger.error(f"generateBulkApplicants: Batch mulai applicant_id={next_id + batch_start} gagal: {e}")
+                    break
+                written += len(profiles)
+                details_written += len(details)
+                self.logger.info(f"generateBulkApplicants: {written}/{count} applicant ditulis")
+        finally:
+            cursor.close()
+            # data pelamar berubah, aplikasi yang lagi jalan load ulang cache profilnya
+            self.bumpDataVersion()
+            self.db.disconnect()
+
+        elapsed = time.perf_counter() - start
+        self.logger.info(
+            f"generateBulkApplicants: {written} ApplicantProfile + {details_written} ApplicationDetail "
+            f"dalam {elapsed:.2f}s"
+        )
+        if details_written < written:
+            self.logger.warning(
+                f"generateBulkApplicants: CV unik habis, {written - details_written} applicant tanpa ApplicationDetail"
+            )
+        return written
+
     def seedTestData(self):
         self.logger.info("seedTestData: Mulai seeding.")
         self.clearAllData()
         self.generateSampleApplicants(20)
         self.logger.info("seedTestData: Selesai seeding.")
 
-def main():
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Reset database lalu isi data applicant dummy")
+    parser.add_argument("--count", type=int, default=SEED_COUNT, help="jumlah applicant")
+    parser.add_argument("--bulk", action="store_true", help="mode bulk (executemany + transaksi per batch)")
+    parser.add_argument("--batch-size", type=int, default=SEED_BATCH_SIZE, help="baris per batch di mode bulk")
+    args = parser.parse_args(argv)
+
     db_name = DATABASE_CONFIG['database']
     db = DatabaseConnection()
 
     if not db.dropDatabase(db_name):
-        return
+        return 1
 
     if not db.createDatabase(db_name):
-        return
+        return 1
 
     if not db.connect():
-        return
+        return 1
     if not db.useDatabase(db_name):
-        return
+        return 1
 
     db.createTables()
 
@@ -167,9 +266,13 @@ def main():
     seeder.db = db
 
     seeder.clearAllData()
-    seeder.generateSampleApplicants(30)
+    if args.bulk:
+        seeder.generateBulkApplicants(args.count, args.batch_size)
+    else:
+        seeder.generateSampleApplicants(args.count)
 
     db.disconnect()
+    return 0
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
@@ -0,0 +1,328 @@
+# ===== src/pdfprocessor/batchExtractor.py =====
+"""
+Ekstraksi PDF Paralel
+Tujuan: Ekstraksi banyak CV sekaligus memakai process pool (pypdf murni
+        Python dan CPU-bound, jadi thread cuma antri di GIL)
+
+Bisa dipakai tanpa GUI:
+    python -m src.pdfprocessor.batchExtractor --workers 8 --limit 500
+    python -m src.pdfprocessor.batchExtractor --match "python,sql" --need 1
+"""
+
+import os
+import sys
+import time
+import argparse
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+from config import DATA_DIR, EXTRACT_MODE, EXTRACT_WORKERS, EXTRACT_CHUNK_SIZE
+from src.utils.DataDirIndex import getDataDirIndex
+from src.algorithm.CompiledQuery import ALGORITHMS
+
+logger = logging.getLogger(__name__)
+
+# satu matcher per proses worker, dibuat pas pertama dipakai
+_matcher = None
+
+
+def _getExtractor():
+    from .pdfExtractor import sharedPDFExtractor
+    return sharedPDFExtractor
+
+
+def _extractChunk(chunk):
+    """
+    Worker: ekstrak satu chunk PDF, sekalian hitung sections-nya
+    (extract_cv_sections + email + telepon) supaya Summary tinggal baca cache
+
+    Argumen:
+        chunk (list): List tuple (key, path PDF)
+
+    Mengembalikan:
+        list: List tuple (key, text, text_n, sections, waktu_ms, error)
+    """
+    extractor = _getExtractor()
+    results = []
+    for key, pdfPath in chunk:
+        start = time.perf_counter()
+        try:
+            text, textN = extractor.PDFExtractBoth(pdfPath)
+            sections = extractor.regex.extractAllInformation(text)
+            error = None
+        except Exception as e:
+            text, textN, sections, error = "", "", None, str(e)
+        results.append((key, text, textN, sections, (time.perf_counter() - start) * 1000, error))
+    return results
+
+
+def _sectionsChunk(chunk):
+    """
+    Worker: hitung sections dari teks yang sudah diekstrak (cache lama yang
+    belum punya kolom sections)
+
+    Argumen:
+        chunk (list): List tuple (key, text)
+
+    Mengembalikan:
+        list: List tuple (key, sections, waktu_ms, error)
+    """
+    from .regexExtractor import sharedRegexExtractor as regex
+    results = []
+    for key, text in chunk:
+        start = time.perf_counter()
+        try:
+            sections = regex.extractAllInformation(text)
+            error = None
+        except Exception as e:
+            sections, error = None, str(e)
+        results.append((key, sections, (time.perf_counter() - start) * 1000, error))
+    return results
+
+
+def _getMatcher():
+    global _matcher
+    if _matcher is None:
+        from src.algorithm.PatternMatcher import PatternMatcher
+        _matcher = PatternMatcher()
+    return _matcher
+
+
+def _matchChunk(task):
+    """
+    Worker: exact match langsung dari PDF, halaman dibaca lazy dan
+    berhenti begitu semua keyword sudah cukup
+
+    Argumen:
+        task (tuple): (chunk, keywords, algorithm, caseSensitive, needed)
+
+    Mengembalikan:
+        list: List tuple (key, {keyword: jumlah}, waktu_ms, error)
+    """
+    chunk, keywords, algorithm, caseSensitive, needed = task
+    extractor = _getExtractor()
+    matcher = _getMatcher()
+    results = []
+    for key, pdfPath in chunk:
+        start = time.perf_counter()
+        try:
+            counts = matcher.exactMatchPages(
+                extractor.iterMatchPages(pdfPath), keywords, algorithm, caseSensitive, needed
+            )
+            error = None
+        except Exception as e:
+            counts, error = {}, str(e)
+        results.append((key, counts, (time.perf_counter() - start) * 1000, error))
+    return results
+
+
+def defaultWorkers():
+    """Jumlah worker default = jumlah core"""
+    return EXTRACT_WORKERS or os.cpu_count() or 1
+
+
+def extractMany(pdfPaths, workers=None, mode=None, chunkSize=None):
+    """
+    Ekstrak banyak PDF secara paralel, hasil di-yield begitu chunk selesai
+
+    Argumen:
+        pdfPaths (dict): key (cv_path) -> path lengkap file PDF
+        workers (int): Jumlah worker (default: jumlah core)
+        mode (str): 'process' atau 'thread' (default: EXTRACT_MODE)
+        chunkSize (int): Jumlah PDF per task (default: EXTRACT_CHUNK_SIZE,
+                         0 = otomatis dari jumlah file dan worker)
+
+    Yields:
+        tuple: (key, text, text_n, sections, waktu_ms, error)
+    """
+    yield from _runChunks(_extractChunk, pdfPaths, workers, mode, chunkSize)
+
+
+def extractSectionsMany(texts, workers=None, mode=None, chunkSize=None):
+    """
+    Hitung sections (skills, work_experience, education, email, phones)
+    untuk banyak teks CV secara paralel
+
+    Argumen:
+        texts (dict): key (cv_path) -> teks CV (hasil cleanseText)
+        workers, mode, chunkSize: Sama dengan extractMany
+
+    Yields:
+        tuple: (key, sections, waktu_ms, error)
+    """
+    yield from _runChunks(_sectionsChunk, texts, workers, mode, chunkSize)
+
+
+def matchMany(pdfPaths, keywords, algorithm='KMP', caseSensitive=False, needed=None,
+              workers=None, mode=None, chunkSize=None):
+    """
+    Exact match langsung dari PDF tanpa menyimpan teksnya (mode match-only)
+
+    Argumen:
+        pdfPaths (dict): key (cv_path) -> path lengkap file PDF
+        keywords (list): Daftar kata kunci
+        algorithm (str): Salah satu ALGORITHMS ('KMP', 'BM', 'AC', 'AUTO', ...)
+        caseSensitive (bool): Apakah pencarian sensitif terhadap huruf besar/kecil
+        needed (int): Berhenti baca PDF begitu semua keyword muncul sebanyak ini
+                      (1 = mode "any match"), None = hitung semua kemunculan
+        workers, mode, chunkSize: Sama dengan extractMany
+
+    Yields:
+        tuple: (key, {keyword: jumlah}, waktu_ms, error)
+    """
+    def makeTask(chunk):
+        return (chunk, list(keywords), algorithm, caseSensitive, needed)
+    yield from _runChunks(_matchChunk, pdfPaths, workers, mode, chunkSize, makeTask)
+
+
+def backfillSections(cache, pdfPaths, texts=None, workers=None, mode=None, chunkSize=None):
+    """
+    Hitung sections untuk CV yang teksnya sudah ada di TextCache tapi
+    sections-nya belum (cache dari versi lama), lalu simpan ke cache
+
+    Argumen:
+        cache (TextCache): Cache teks CV
+        pdfPaths (dict): cv_path -> path lengkap file PDF
+        texts (dict): cv_path -> teks yang sudah di-load (opsional, kalau
+                      tidak ada dibaca dari cache)
+        workers, mode, chunkSize: Sama dengan extractMany
+
+    Mengembalikan:
+        int: Jumlah CV yang sections-nya baru dihitung
+    """
+    missing = cache.missingSections(pdfPaths)
+    if not missing:
+        return 0
+    if texts is None:
+        texts, _ = cache.getMany({key: pdfPaths[key] for key in missing})
+    todo = {key: texts[key] for key in missing if texts.get(key)}
+    entries = []
+    for key, sections, ms, error in extractSectionsMany(todo, workers, mode, chunkSize):
+        if error:
+            logger.warning(f"Sections {key} gagal: {error}")
+            continue
+        entries.append((key, sections))
+    cache.putSections(entries)
+    return len(entries)
+
+
+def _runChunks(func, pdfPaths, workers=None, mode=None, chunkSize=None, makeTask=None):
+    """Bagi PDF ke chunk lalu jalankan func per chunk di pool, hasil di-yield per chunk"""
+    items = list(pdfPaths.items())
+    if not items:
+        return
+    workers = workers or defaultWorkers()
+    mode = mode or EXTRACT_MODE
+    if chunkSize is None:
+        chunkSize = EXTRACT_CHUNK_SIZE
+    if not chunkSize:
+        # kira-kira 4 task per worker biar load tetap rata
+        chunkSize = max(1, min(32, len(items) // (workers * 4)))
+
+    chunks = [items[i:i + chunkSize] for i in range(0, len(items), chunkSize)]
+    if mode == 'process':
+        # spawn, bukan fork: dipanggil dari thread job GUI, fork dari proses
+        # yang sudah punya banyak thread bisa deadlock
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+    else:
+        pool = ThreadPoolExecutor(max_workers=workers)
+    with pool:
+        futures = [pool.submit(func, makeTask(chunk) if makeTask else chunk) for chunk in chunks]
+        for fut in as_completed(futures):
+            for result in fut.result():
+                yield result
+
+
+def _scanDataDir(limit=None):
+    """Semua PDF di DATA_DIR dengan key format cv_path database ('data/ROLE/x.pdf')"""
+    return getDataDirIndex(DATA_DIR).cvPaths(limit)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ekstraksi CV ke text cache tanpa GUI")
+    parser.add_argument("--workers", type=int, default=None, help="jumlah worker (default: jumlah core)")
+    parser.add_argument("--mode", choices=["process", "thread"], default=None)
+    parser.add_argument("--chunk-size", type=int, default=None, help="PDF per task (0 = otomatis)")
+    parser.add_argument("--limit", type=int, default=None, help="maksimal jumlah PDF")
+    parser.add_argument("--force", action="store_true", help="ekstrak ulang walaupun sudah ada di cache")
+    parser.add_argument("--quiet", action="store_true", help="jangan print waktu per file")
+    parser.add_argument("--match", default=None,
+                        help="mode match-only: keyword dipisah koma, PDF dibaca per halaman tanpa disimpan ke cache")
+    parser.add_argument("--need", type=int, default=None,
+                        help="berhenti baca PDF begitu semua keyword muncul sebanyak ini (1 = any match)")
+    parser.add_argument("--algorithm", type=str.upper, choices=ALGORITHMS, default="KMP")
+    parser.add_argument("--case-sensitive", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.match:
+        return _matchMain(args)
+
+    from .textCache import TextCache
+
+    cache = TextCache()
+    pdfPaths = _scanDataDir(args.limit)
+    if args.force:
+        missing = list(pdfPaths)
+    else:
+        _, missing = cache.getMany(pdfPaths)
+    todo = {key: pdfPaths[key] for key in missing}
+    workers = args.workers or defaultWorkers()
+    print(f"[INFO] {len(pdfPaths)} PDFs, {len(todo)} to extract "
+          f"({args.mode or EXTRACT_MODE}, {workers} workers)")
+
+    start = time.perf_counter()
+    entries = []
+    timings = []
+    for key, text, textN, sections, ms, error in extractMany(todo, workers, args.mode, args.chunk_size):
+        timings.append(ms)
+        if error:
+            print(f"[ERROR] {key}: {error}")
+            continue
+        entries.append((key, todo[key], text, textN, sections))
+        if not args.quiet:
+            print(f"{ms:9.1f} ms  {key}")
+    cache.putMany(entries)
+    backfilled = backfillSections(cache, pdfPaths, None, workers, args.mode, args.chunk_size)
+    if backfilled:
+        print(f"[INFO] Computed sections for {backfilled} cached CVs")
+    elapsed = time.perf_counter() - start
+
+    if timings:
+        print(f"[INFO] Extracted {len(entries)} PDFs in {elapsed:.2f}s "
+              f"(avg {sum(timings)/len(timings):.1f} ms/file, max {max(timings):.1f} ms)")
+    cache.close()
+    return 0
+
+
+def _matchMain(args):
+    keywords = [k.strip() for k in args.match.split(",") if k.strip()]
+    pdfPaths = _scanDataDir(args.limit)
+    workers = args.workers or defaultWorkers()
+    print(f"[INFO] Matching {keywords} in {len(pdfPaths)} PDFs "
+          f"({args.algorithm}, need={args.need}, {workers} workers)")
+
+    start = time.perf_counter()
+    matched = 0
+    timings = []
+    for key, counts, ms, error in matchMany(pdfPaths, keywords, args.algorithm, args.case_sensitive,
+                                            args.need, workers, args.mode, args.chunk_size):
+        timings.append(ms)
+        if error:
+            print(f"[ERROR] {key}: {error}")
+            continue
+        if any(counts.values()):
+            matched += 1
+            if not args.quiet:
+                found = ", ".join(f"{k} ({v})" for k, v in counts.items() if v)
+                print(f"{ms:9.1f} ms  {key}: {found}")
+    elapsed = time.perf_counter() - start
+
+    if timings:
+        print(f"[INFO] {matched}/{len(timings)} PDFs matched in {elapsed:.2f}s "
+              f"(avg {sum(timings)/len(timings):.1f} ms/file, max {max(timings):.1f} ms)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,209 @@
+"""
+Corpus Store - Teks semua CV dalam file yang di-mmap
+Tujuan: Menyimpan corpus sebagai blob UTF-8 + index offset di disk, lalu
+        dibuka pakai mmap supaya teks CV ada di page cache (bisa dipakai
+        bareng banyak proses), bukan jadi str di heap Python
+"""
+
+import os
+import mmap
+import pickle
+import logging
+from array import array
+from collections.abc import Mapping
+
+from config import CORPUS_DIR
+from src.algorithm.FoldedText import fold
+from src.algorithm.CorpusBuffer import CorpusBuffer
+
+STORE_VERSION = 1
+
+
+class CorpusTexts(Mapping):
+    """
+    Mapping cv_path -> teks yang dibaca lazy dari CorpusStore
+
+    Bisa dipakai di tempat dict cache teks CV biasa: iterasi cuma
+    menghasilkan cv_path, teks baru di-decode dari mmap waktu diakses.
+    """
+
+    def __init__(self, store):
+        self.store = store
+
+    def __getitem__(self, path):
+        return self.store.text(path)
+
+    def __iter__(self):
+        return iter(self.store.paths)
+
+    def __len__(self):
+        return len(self.store.paths)
+
+    def __contains__(self, path):
+        return path in self.store.docIndex
+
+    def fingerprints(self):
+        """Fingerprint per CV dari index store (teksnya gak perlu dibaca)"""
+        return dict(zip(self.store.paths, self.store.fingerprints))
+
+
+class CorpusStore:
+    """
+    Corpus CV di disk: dua blob (teks asli dan teks fold) + satu file index
+
+    - corpus.bin        : teks asli semua CV (UTF-8), dipisah CorpusBuffer.SEPARATOR
+    - corpus_folded.bin : teks fold (casefold + NFKC) dengan layout yang sama
+    - corpus.idx        : versi, cv_path, offset awal tiap CV di kedua blob,
+                          dan fingerprint per CV (SHA-1 PDF dari TextCache, atau
+                          penanda CV yang gagal diekstrak)
+
+    Store dianggap valid kalau daftar cv_path dan fingerprint-nya sama
+    persis dengan yang diminta, jadi startup berikutnya tinggal mmap.
+    """
+
+    BLOBS = {True: 'corpus.bin', False: 'corpus_folded.bin'}
+    INDEX = 'corpus.idx'
+
+    def __init__(self, directory=CORPUS_DIR):
+        """
+        Argumen:
+            directory (str): Folder file corpus (default: CORPUS_DIR)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.directory = str(directory)
+        self._reset()
+
+    def _reset(self):
+        self.paths = []
+        self.fingerprints = []
+        self.docIndex = {}
+        self.starts = {}
+        self.maps = {}
+
+    def _path(self, name):
+        return os.path.join(self.directory, name)
+
+    def isOpen(self):
+        return bool(self.maps)
+
+    def write(self, texts, fingerprints):
+        """
+        Tulis ulang corpus dari cache teks (blob ditulis streaming per CV)
+
+        Argumen:
+            texts (Mapping): cv_path -> teks, urutannya dipertahankan
+            fingerprints (dict): cv_path -> fingerprint (mis. SHA-1 PDF)
+        """
+        # map lama harus ditutup dulu, di Windows file yang di-mmap gak bisa diganti
+        self.close()
+        os.makedirs(self.directory, exist_ok=True)
+        paths = list(texts)
+        starts = {True: array('q'), False: array('q')}
+        sep = CorpusBuffer.SEPARATOR
+        files = {cs: open(self._path(name) + '.tmp', 'wb') for cs, name in self.BLOBS.items()}
+        try:
+            offsets = dict.fromkeys(files, 0)
+            for i, path in enumerate(paths):
+                text = texts[path]
+                for cs, f in files.items():
+                    encoded = (text if cs else fold(text)).encode('utf-8', 'surrogatepass')
+                    if i:
+                        f.write(sep)
+                        offsets[cs] += len(sep)
+                    starts[cs].append(offsets[cs])
+                    f.write(encoded)
+                    offsets[cs] += len(encoded)
+        finally:
+            for f in files.values():
+                f.close()
+
+        tmp = self._path(self.INDEX) + '.tmp'
+        with open(tmp, 'wb') as f:
+            pickle.dump({
+                'version': STORE_VERSION,
+                'paths': paths,
+                'starts': {cs: table.tobytes() for cs, table in starts.items()},
+                'fingerprints': [fingerprints.get(path) for path in paths],
+            }, f, protocol=pickle.HIGHEST_PROTOCOL)
+        for name in self.BLOBS.values():
+            os.replace(self._path(name) + '.tmp', self._path(name))
+        os.replace(tmp, self._path(self.INDEX))
+
+    def open(self, fingerprints=None):
+        """
+        Buka corpus dari disk pakai mmap
+
+        Argumen:
+            fingerprints (dict): cv_path -> fingerprint yang diharapkan
+                                 (urutan ikut dicek), None = terima apa adanya
+
+        Mengembalikan:
+            bool: True kalau store ada, versinya cocok, dan isinya sesuai
+        """
+        try:
+            with open(self._path(self.INDEX), 'rb') as f:
+                data = pickle.load(f)
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            self.logger.warning(f"Gagal membaca index corpus: {e}")
+            return False
+        if data.get('version') != STORE_VERSION:
+            return False
+        if fingerprints is not None and (
+                data['paths'] != list(fingerprints)
+                or data['fingerprints'] != list(fingerprints.values())):
+            return False
+
+        maps = {}
+        try:
+            for cs, name in self.BLOBS.items():
+                with open(self._path(name), 'rb') as f:
+                    size = os.fstat(f.fileno()).st_size
+                    # mmap gak bisa untuk file kosong (corpus tanpa CV)
+                    maps[cs] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+        except OSError as e:
+            self.logger.warning(f"Gagal membuka blob corpus: {e}")
+            return False
+
+        # map lama gak ditutup di sini: buffer yang masih dipegang search job tetap valid
+        self.paths = data['paths']
+        self.fingerprints = data['fingerprints']
+        self.docIndex = {path: i for i, path in enumerate(self.paths)}
+        self.starts = {cs: array('q', raw) for cs, raw in data['starts'].items()}
+        self.maps = maps
+        return True
+
+    def close(self):
+        for m in self.maps.values():
+            if isinstance(m, mmap.mmap):
+                try:
+                    m.close()
+                except BufferError:
+                    # masih ada buffer export yang dipegang, map ditutup sendiri waktu di-GC
+                    pass
+        self._reset()
+
+    def _span(self, doc, caseSensitive):
+        starts = self.starts[caseSensitive]
+        end = starts[doc + 1] - len(CorpusBuffer.SEPARATOR) if doc + 1 < len(starts) else len(self.maps[caseSensitive])
+        return starts[doc], end
+
+    def text(self, path, caseSensitive=True):
+        """Teks satu CV (di-decode dari mmap, cuma CV ini yang di-copy)"""
+        start, end = self._span(self.docIndex[path], caseSensitive)
+        return self.maps[caseSensitive][start:end].decode('utf-8', 'surrogatepass')
+
+    def texts(self):
+        """Mapping lazy cv_path -> teks, pengganti dict cache teks"""
+        return CorpusTexts(self)
+
+    def buffer(self, caseSensitive=False):
+        """
+        CorpusBuffer yang langsung membaca mmap (gak ada copy ke heap)
+
+        Mengembalikan:
+            CorpusBuffer: Buffer siap dicari
+        """
+        return CorpusBuffer(self.maps[caseSensitive], self.starts[caseSensitive],
+                            self.paths, caseSensitive, self.texts().fingerprints())
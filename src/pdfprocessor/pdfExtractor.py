@@ -5,11 +5,10 @@ Tujuan: Ekstraksi teks dari file PDF CV
 """
 
 import pypdf
-from .regexExtractor import RegexExtractor
 import logging
 import os
 from pathlib import Path
-from src.pdfprocessor.regexExtractor import RegexExtractor
+from .regexExtractor import sharedRegexExtractor
 
 class PDFExtractor:
     """
@@ -19,6 +18,7 @@ class PDFExtractor:
     def __init__(self):
         """Inisialisasi PDF extractor"""
         self.logger = logging.getLogger(__name__)
+        self.regex = sharedRegexExtractor
     
     
     def cleanText(self, text):
@@ -31,32 +31,50 @@ class PDFExtractor:
         Mengembalikan:
             str: Teks yang sudah dibersihkan
         """
-        regex = RegexExtractor()    
-        full_text = regex.cleanseTextN(text)
+        full_text = self.regex.cleanseTextN(text)
         return full_text
 
+    def iterPages(self, pdfPath):
+        """
+        Generator teks per halaman PDF (sudah di-strip, halaman tanpa teks dilewati)
+
+        Halaman baru dibaca saat diminta, jadi pemanggil bisa berhenti
+        di tengah dokumen tanpa mengekstrak sisa halamannya.
+        """
+        if not os.path.exists(pdfPath):
+            print(f"Error: File PDF tidak ditemukan pada: {pdfPath}")
+
+        with open(pdfPath, 'rb') as file:
+            # Create object reader
+            reader = pypdf.PdfReader(file)
+            for page in reader.pages:
+                page_text = page.extract_text()
+                if page_text:
+                    yield page_text.strip()
+
+    def iterMatchPages(self, pdfPath):
+        """
+        Generator halaman yang sudah dibersihkan untuk exact match (cleanseText
+        per halaman). Kalau disambung, hasilnya sama dengan PDFExtractForMatch
+        kecuali di kasus pinggir (spasi/karakter kontrol tepat di batas halaman).
+        Error baca PDF dianggap sebagai dokumen tanpa halaman.
+        """
+        try:
+            for page in self.iterPages(pdfPath):
+                yield self.regex.cleanseText(page)
+        except pypdf.errors.PdfReadError:
+            print(f"Error: Gagal membaca file PDF {pdfPath}. Mungkin terenkripsi atau rusak.")
+        except Exception as e:
+            print(f"Terjadi error tak terduga saat memproses {pdfPath}: {e}")
+
     # Versi mahesa
     def PDFtoText(self, pdfPath):
         """
         Extract pdf text into string (still include newlines)
         """
         try:
-            if not os.path.exists(pdfPath):
-                print(f"Error: File PDF tidak ditemukan pada: {pdfPath}")
-
-            full_text = ""
-            with open(pdfPath, 'rb') as file:
-                # Create object reader
-                reader = pypdf.PdfReader(file)
-                # Extract pages
-                pageTotal = len(reader.pages)
-
-                for page_num in range(pageTotal):
-                    page = reader.pages[page_num]
-                    page_text = page.extract_text()
-                    if page_text:
-                        cleaned_text = page_text.strip()
-                        full_text += cleaned_text + "\n"
+            # halaman dikumpulkan ke list lalu di-join sekali (bukan += per halaman)
+            full_text = "\n".join(self.iterPages(pdfPath))
         except pypdf.errors.PdfReadError:
             print(f"Error: Gagal membaca file PDF {pdfPath}. Mungkin terenkripsi atau rusak.")
             return ""
@@ -70,8 +88,18 @@ class PDFExtractor:
         """
         Extract pdf text into string (remove newline) for summary
         """
-        regex = RegexExtractor()
         # result string with all newline removed
-        result = regex.cleanseText(self.PDFtoText(pdfPath))
+        result = self.regex.cleanseText(self.PDFtoText(pdfPath))
         return result
 
+    def PDFExtractBoth(self, pdfPath):
+        """
+        Extract pdf sekali, kembalikan versi match (cleanseText) dan versi
+        dengan newline (cleanseTextN) sekaligus, buat disimpan di TextCache
+        """
+        raw = self.PDFtoText(pdfPath)
+        return self.regex.cleanseText(raw), self.regex.cleanseTextN(raw)
+
+
+# Instance bersama untuk seluruh proses (PDFExtractor stateless, aman antar thread)
+sharedPDFExtractor = PDFExtractor()
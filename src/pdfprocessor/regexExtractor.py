@@ -9,6 +9,37 @@ from datetime import datetime
 import logging
 import unicodedata
 
+# ===== Normalisasi teks: pola dikompilasi sekali di level modul =====
+# (str.translate lebih lambat dari char class regex begitu teksnya ada karakter non-ASCII)
+_BULLETS = '•▪●◦\uf0b7\u2022\u25cf'
+_CONTROL_RE = re.compile('[\x00-\x1F\x7F' + _BULLETS + ']+')              # termasuk newline
+_CONTROL_KEEP_NL_RE = re.compile('[\x00-\x09\x0B-\x1F\x7F' + _BULLETS + ']+')
+_MULTI_SPACE_RE = re.compile(r' {2,}')
+_MULTI_NEWLINE_RE = re.compile(r'\n{3,}')
+_SPACE_BEFORE_PUNCT_RE = re.compile(r'\s+(?=[,.;:!?])')
+_PUNCTS = ',.;:!?'
+_PUNCT_RE = re.compile(r'([^\w\s])')
+
+# Pola informasi CV, dikompilasi sekali dan dipakai bareng semua instance
+# (objek Pattern immutable, aman dipakai dari banyak thread)
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_PHONE_RES = (
+    re.compile(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'),  # Format US
+    re.compile(r'\+?1?[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'),  # US dengan kode negara
+    re.compile(r'\+\d{1,3}[-.\s]?\d{1,14}'),  # Format internasional
+)
+_DATE_RES = (
+    re.compile(r'\b\d{1,2}[/-]\d{1,2}[/-]\d{4}\b'),  # MM/DD/YYYY
+    re.compile(r'\b\d{4}[/-]\d{1,2}[/-]\d{1,2}\b'),  # YYYY/MM/DD
+    re.compile(r'\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{4}\b'),  # Bulan Tahun
+)
+
+
+def _nfkc(text):
+    # teks ASCII murni sudah pasti bentuk NFKC
+    return text if text.isascii() else unicodedata.normalize('NFKC', text)
+
+
 class RegexExtractor:
     """
     Kelas untuk ekstraksi informasi menggunakan regex
@@ -37,22 +68,15 @@ class RegexExtractor:
         - Pola pendidikan
         - Pola keterampilan
         """
+        # Pola sudah dikompilasi di level modul, di sini cuma referensi
         # Pola email
-        self.emailPattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+        self.emailPattern = _EMAIL_RE
         
         # Pola nomor telepon (berbagai format)
-        self.phonePatterns = [
-            r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',  # Format US
-            r'\+?1?[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',  # US dengan kode negara
-            r'\+\d{1,3}[-.\s]?\d{1,14}',  # Format internasional
-        ]
+        self.phonePatterns = _PHONE_RES
         
         # Pola tanggal
-        self.datePatterns = [
-            r'\b\d{1,2}[/-]\d{1,2}[/-]\d{4}\b',  # MM/DD/YYYY
-            r'\b\d{4}[/-]\d{1,2}[/-]\d{1,2}\b',  # YYYY/MM/DD
-            r'\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{4}\b',  # Bulan Tahun
-        ]
+        self.datePatterns = _DATE_RES
     
     def extractEmail(self, text):
         """
@@ -64,7 +88,10 @@ class RegexExtractor:
         Mengembalikan:
             list: Daftar alamat email yang ditemukan
         """
-        pass
+        if not text:
+            return []
+        # urutan kemunculan dipertahankan, duplikat dibuang
+        return list(dict.fromkeys(self.emailPattern.findall(text)))
     
     def extractPhone(self, text):
         """
@@ -76,7 +103,21 @@ class RegexExtractor:
         Mengembalikan:
             list: Daftar nomor telepon yang ditemukan
         """
-        pass
+        if not text:
+            return []
+        phones = {}
+        for pattern in self.phonePatterns:
+            for match in pattern.finditer(text):
+                phone = match.group().strip()
+                digits = re.sub(r'\D', '', phone)
+                # pola saling tumpang tindih, nomor yang sama cukup sekali
+                if len(digits) >= 7 and digits not in phones:
+                    phones[digits] = phone
+        # buang potongan dari nomor yang lebih panjang (mis. pola US di dalam nomor internasional)
+        return [
+            phone for digits, phone in phones.items()
+            if not any(digits != other and digits in other for other in phones)
+        ]
     
     def extractSummary(self, text):
         """
@@ -154,13 +195,17 @@ class RegexExtractor:
             text (str): Teks CV
             
         Mengembalikan:
-            dict: Dictionary dengan semua informasi yang diekstrak
-            
-        TODO:        - Panggil semua metode ekstraksi
-        - Gabungkan hasil dalam format standar
-        - Tangani error dari masing-masing ekstraktor
+            dict: skills, work_experience, education (dari extract_cv_sections),
+                  email, dan phones
         """
-        pass
+        info = {'skills': [], 'work_experience': [], 'education': []}
+        try:
+            info.update(self.extract_cv_sections(text))
+        except Exception as e:
+            self.logger.warning(f"extract_cv_sections gagal: {e}")
+        info['email'] = self.extractEmail(text)
+        info['phones'] = self.extractPhone(text)
+        return info
 
     def extract_cv_sections(self, text):
         """
@@ -623,25 +668,21 @@ class RegexExtractor:
         }
 
     def cleanseText(self, text):
-        
-        # 1. Normalize unicode
-        cleaned_text = unicodedata.normalize('NFKC', text)
-
-        # 2. Remove non-visual characters
-        cleaned_text = re.sub(r'[\x00-\x1F\x7F]', '', cleaned_text)
-
-        # 3. Remove bullet and other unneccessary symbols
-        cleaned_text = re.sub(r'[•▪●◦\uf0b7\u2022\u25cf]', '', cleaned_text)
-
-        # 4. Remove extra whitspace
-        cleaned_text = re.sub(r'\s+', ' ', cleaned_text)
+        """
+        Bersihkan teks untuk matching: normalisasi NFKC, buang karakter kontrol
+        (termasuk newline) dan bullet, rapikan whitespace, hapus spasi sebelum
+        tanda baca
+        """
+        # 1-3. Normalize unicode, buang karakter kontrol + bullet dalam satu pass
+        cleaned_text = _CONTROL_RE.sub('', _nfkc(text))
 
-        # 5. Remove extra white space and beginning and end of string
-        cleaned_text = cleaned_text.strip()
+        # 4-5. Whitespace berurutan jadi satu spasi + strip (split() pakai definisi \s yang sama)
+        cleaned_text = ' '.join(cleaned_text.split())
 
-        # 6. Clean up spacing around punctuation
-        cleaned_text = re.sub(r'\s+([,.;:!?])', r'\1', cleaned_text)  # Remove space before punctuation
-        
+        # 6. Sisa whitespace tinggal spasi tunggal, jadi cukup replace biasa
+        for punct in _PUNCTS:
+            if ' ' + punct in cleaned_text:
+                cleaned_text = cleaned_text.replace(' ' + punct, punct)
         return cleaned_text
     
 
@@ -649,27 +690,18 @@ class RegexExtractor:
         """
         cleanse text but keep the newlines
         """
-        # 1. Normalize unicode
-        cleaned_text = unicodedata.normalize('NFKC', text)
-
-        # 2. Remove non-visual characters
-        cleaned_text = re.sub(r'[\x00-\x09\x0B-\x1F\x7F]', '', cleaned_text)
-
-        # 3. Remove bullet and other unneccessary symbols
-        cleaned_text = re.sub(r'[•▪●◦\uf0b7\u2022\u25cf]', '', cleaned_text)
+        # 1-3. Normalize unicode, buang karakter kontrol (kecuali newline) + bullet
+        cleaned_text = _CONTROL_KEEP_NL_RE.sub('', _nfkc(text))
 
-        # 4. Remove extra whitspace
-        # 4. Clean multiple spaces/tabs but keep single newlines
-        cleaned_text = re.sub(r'[ \t]+', ' ', cleaned_text)  # Multiple spaces/tabs -> single space
-        cleaned_text = re.sub(r'\n{3,}', '\n\n', cleaned_text)  # Multiple newlines -> double newline max
+        # 4. Clean multiple spaces (tab sudah terbuang) tapi newline tetap, maksimal dua
+        cleaned_text = _MULTI_SPACE_RE.sub(' ', cleaned_text)
+        cleaned_text = _MULTI_NEWLINE_RE.sub('\n\n', cleaned_text)
 
         # 5. Remove extra white space and beginning and end of string
         cleaned_text = cleaned_text.strip()
 
         # 6. Clean up spacing around punctuation
-        cleaned_text = re.sub(r'\s+([,.;:!?])', r'\1', cleaned_text)  # Remove space before punctuation
-        
-        return cleaned_text
+        return _SPACE_BEFORE_PUNCT_RE.sub('', cleaned_text)
     
     def seperatePunctuations(self, text):
         """
@@ -687,13 +719,10 @@ class RegexExtractor:
         """
         if not text:
             return ""
-        # 1. Add whitespace sebelum punctuation
-        text = re.sub(r'(\S)([^\w\s])', r'\1 \2', text)
-
-        # 2. Add whitespace setelah punctuation
-        text = re.sub(r'([^\w\s])(\S)', r'\1 \2', text)
+        # spasi di kiri-kanan setiap tanda baca, lalu whitespace dirapikan lewat split/join
+        return ' '.join(_PUNCT_RE.sub(r' \1 ', text).split())
 
-        # 3. Remove every extra whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
 
-        return text
\ No newline at end of file
+# Instance bersama: RegexExtractor gak punya state per pemanggilan, jadi
+# cukup satu untuk seluruh proses (dipakai PDFExtractor, Levenshtein, queries)
+sharedRegexExtractor = RegexExtractor()
@@ -0,0 +1,307 @@
+# ===== src/pdfprocessor/textCache.py =====
+"""
+Cache Teks Hasil Ekstraksi PDF
+Tujuan: Menyimpan teks CV yang sudah diekstrak ke disk supaya PDF tidak
+        di-parse ulang setiap aplikasi dibuka
+"""
+
+import os
+import json
+import sqlite3
+import hashlib
+import logging
+import threading
+from config import TEXT_CACHE_PATH
+
+
+def fileDigest(pdfPath):
+    """SHA-1 dari isi file PDF"""
+    h = hashlib.sha1()
+    with open(pdfPath, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class TextCache:
+    """
+    Cache teks CV di SQLite lokal, key-nya cv_path
+
+    Setiap baris menyimpan mtime, ukuran, dan SHA-1 file PDF. Entry dianggap
+    valid kalau mtime+size sama; kalau beda, hash isi file dicek dulu sebelum
+    PDF diekstrak ulang (file yang cuma di-touch tidak perlu di-parse lagi).
+
+    Kolom yang disimpan:
+    - text   : hasil cleanseText (dipakai untuk matching)
+    - text_n : hasil cleanseTextN (newline dipertahankan)
+    - sections : JSON hasil RegexExtractor.extractAllInformation (skills,
+                 work_experience, education, email, phones), NULL = belum dihitung
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS cv_text (
+        cv_path  TEXT    PRIMARY KEY,
+        mtime    REAL    NOT NULL,
+        size     INTEGER NOT NULL,
+        sha1     TEXT    NOT NULL,
+        text     TEXT    NOT NULL,
+        text_n   TEXT    NOT NULL,
+        sections TEXT
+    )
+    """
+
+    # kolom yang ditambahkan setelah versi awal: (nama, definisi)
+    MIGRATIONS = (
+        ("sections", "TEXT"),
+    )
+
+    # batas jumlah parameter per query SQLite
+    BATCH_SIZE = 500
+
+    def __init__(self, path=TEXT_CACHE_PATH):
+        """Inisialisasi cache (file SQLite dibuat kalau belum ada)"""
+        self.logger = logging.getLogger(__name__)
+        self.path = str(path)
+        self.lock = threading.Lock()
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.execute(self.SCHEMA)
+        self._migrate()
+        self.conn.commit()
+
+    def _migrate(self):
+        """Tambah kolom yang belum ada di file cache lama"""
+        existing = {row[1] for row in self.conn.execute("PRAGMA table_info(cv_text)")}
+        for name, definition in self.MIGRATIONS:
+            if name not in existing:
+                self.conn.execute(f"ALTER TABLE cv_text ADD COLUMN {name} {definition}")
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+    def _isFresh(self, cvPath, row, pdfPath):
+        """
+        Cek apakah baris cache masih sesuai dengan file PDF
+
+        Mengembalikan:
+            bool: True kalau masih valid
+        """
+        mtime, size, sha1 = row
+        try:
+            st = os.stat(pdfPath)
+        except OSError:
+            return False
+        if st.st_mtime == mtime and st.st_size == size:
+            return True
+        if st.st_size != size:
+            return False
+        # mtime berubah tapi ukuran sama: pastikan lewat isi file
+        try:
+            if fileDigest(pdfPath) != sha1:
+                return False
+        except OSError:
+            return False
+        with self.lock:
+            self.conn.execute("UPDATE cv_text SET mtime = ? WHERE cv_path = ?",
+                              (st.st_mtime, cvPath))
+            self.conn.commit()
+        return True
+
+    def getMany(self, pdfPaths, variant='text'):
+        """
+        Membaca banyak teks sekaligus dari cache
+
+        Argumen:
+            pdfPaths (dict): cv_path -> path lengkap file PDF
+            variant (str): 'text' (cleanseText) atau 'text_n' (cleanseTextN)
+
+        Mengembalikan:
+            tuple: (dict cv_path -> teks yang valid, list cv_path yang perlu diekstrak)
+        """
+        column = 'text_n' if variant == 'text_n' else 'text'
+        return self._getColumn(pdfPaths, column)
+
+    def _getColumn(self, pdfPaths, column):
+        """Baca satu kolom untuk banyak cv_path, baris kadaluarsa atau NULL = miss"""
+        keys = list(pdfPaths)
+        rows = {}
+        with self.lock:
+            for i in range(0, len(keys), self.BATCH_SIZE):
+                batch = keys[i:i + self.BATCH_SIZE]
+                marks = ",".join("?" * len(batch))
+                cur = self.conn.execute(
+                    f"SELECT cv_path, mtime, size, sha1, {column} FROM cv_text "
+                    f"WHERE cv_path IN ({marks})", batch
+                )
+                for cv_path, mtime, size, sha1, text in cur:
+                    rows[cv_path] = ((mtime, size, sha1), text)
+
+        hits = {}
+        misses = []
+        for key in keys:
+            row = rows.get(key)
+            if row is not None and row[1] is not None and self._isFresh(key, row[0], pdfPaths[key]):
+                hits[key] = row[1]
+            else:
+                misses.append(key)
+        return hits, misses
+
+    def get(self, cvPath, pdfPath, variant='text'):
+        """
+        Membaca satu teks dari cache
+
+        Mengembalikan:
+            str: Teks, atau None kalau belum ada / sudah kadaluarsa
+        """
+        hits, _ = self.getMany({cvPath: pdfPath}, variant)
+        return hits.get(cvPath)
+
+    def fingerprints(self, pdfPaths):
+        """
+        SHA-1 file PDF untuk CV yang teksnya masih valid di cache
+        (dipakai untuk ngecek corpus store tanpa membaca teksnya)
+
+        Argumen:
+            pdfPaths (dict): cv_path -> path lengkap file PDF
+
+        Mengembalikan:
+            tuple: (dict cv_path -> sha1 dengan urutan pdfPaths, list cv_path yang belum ada / kadaluarsa)
+        """
+        hits, misses = self._getColumn(pdfPaths, 'sha1')
+        return {key: hits[key] for key in pdfPaths if key in hits}, misses
+
+    def getSectionsMany(self, pdfPaths):
+        """
+        Membaca hasil ekstraksi section (skills, pengalaman, dll) dari cache
+
+        Argumen:
+            pdfPaths (dict): cv_path -> path lengkap file PDF
+
+        Mengembalikan:
+            tuple: (dict cv_path -> dict sections, list cv_path yang belum ada / kadaluarsa)
+        """
+        hits, misses = self._getColumn(pdfPaths, 'sections')
+        return {key: json.loads(value) for key, value in hits.items()}, misses
+
+    def missingSections(self, cvPaths):
+        """
+        cv_path yang teksnya sudah di cache tapi sections-nya masih NULL.
+        Cuma baca kolom cv_path: gak parse JSON dan gak cek ulang file PDF
+
+        Argumen:
+            cvPaths (iterable): cv_path yang mau dicek
+
+        Mengembalikan:
+            list: cv_path dengan sections NULL, urutan sama dengan cvPaths
+        """
+        keys = list(cvPaths)
+        found = set()
+        with self.lock:
+            for i in range(0, len(keys), self.BATCH_SIZE):
+                batch = keys[i:i + self.BATCH_SIZE]
+                marks = ",".join("?" * len(batch))
+                cur = self.conn.execute(
+                    f"SELECT cv_path FROM cv_text WHERE sections IS NULL AND cv_path IN ({marks})",
+                    batch
+                )
+                found.update(row[0] for row in cur)
+        return [key for key in keys if key in found]
+
+    def getSections(self, cvPath, pdfPath):
+        """
+        Membaca sections satu CV dari cache
+
+        Mengembalikan:
+            dict: Sections, atau None kalau belum ada / sudah kadaluarsa
+        """
+        hits, _ = self.getSectionsMany({cvPath: pdfPath})
+        return hits.get(cvPath)
+
+    def putSections(self, entries):
+        """
+        Menyimpan sections untuk CV yang teksnya sudah ada di cache
+
+        Argumen:
+            entries (list): List tuple (cv_path, dict sections)
+        """
+        rows = [(json.dumps(sections), cvPath) for cvPath, sections in entries]
+        if not rows:
+            return
+        with self.lock:
+            self.conn.executemany("UPDATE cv_text SET sections = ? WHERE cv_path = ?", rows)
+            self.conn.commit()
+
+    def putMany(self, entries):
+        """
+        Menyimpan banyak hasil ekstraksi dalam satu transaksi
+
+        Argumen:
+            entries (list): List tuple (cv_path, path PDF, text, text_n) atau
+                            (cv_path, path PDF, text, text_n, sections)
+        """
+        rows = []
+        for entry in entries:
+            cvPath, pdfPath, text, textN = entry[:4]
+            sections = entry[4] if len(entry) > 4 else None
+            try:
+                st = os.stat(pdfPath)
+                digest = fileDigest(pdfPath)
+            except OSError as e:
+                self.logger.warning(f"Tidak bisa cache {pdfPath}: {e}")
+                continue
+            rows.append((cvPath, st.st_mtime, st.st_size, digest, text, textN,
+                         json.dumps(sections) if sections is not None else None))
+        if not rows:
+            return
+        with self.lock:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO cv_text (cv_path, mtime, size, sha1, text, text_n, sections) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)", rows
+            )
+            self.conn.commit()
+
+    def put(self, cvPath, pdfPath, text, textN, sections=None):
+        """Menyimpan satu hasil ekstraksi"""
+        self.putMany([(cvPath, pdfPath, text, textN, sections)])
+
+    def getOrExtract(self, cvPath, pdfPath, extractor, variant='text'):
+        """
+        Ambil teks dari cache, kalau tidak ada ekstrak PDF-nya lalu simpan
+
+        Argumen:
+            cvPath (str): cv_path (key cache)
+            pdfPath (str): Path lengkap file PDF
+            extractor (PDFExtractor): Dipakai kalau cache miss
+            variant (str): 'text' atau 'text_n'
+
+        Mengembalikan:
+            str: Teks CV
+        """
+        text = self.get(cvPath, pdfPath, variant)
+        if text is not None:
+            return text
+        text, textN = extractor.PDFExtractBoth(pdfPath)
+        self.put(cvPath, pdfPath, text, textN)
+        return textN if variant == 'text_n' else text
+
+    def getOrExtractSections(self, cvPath, pdfPath, extractor):
+        """
+        Ambil sections dari cache, kalau belum ada dihitung dari teks CV
+        (PDF cuma diekstrak kalau teksnya juga belum ada) lalu disimpan
+
+        Argumen:
+            cvPath (str): cv_path (key cache)
+            pdfPath (str): Path lengkap file PDF
+            extractor (PDFExtractor): Dipakai kalau cache miss
+
+        Mengembalikan:
+            dict: skills, work_experience, education, email, phones
+        """
+        sections = self.getSections(cvPath, pdfPath)
+        if sections is not None:
+            return sections
+        text = self.getOrExtract(cvPath, pdfPath, extractor)
+        sections = extractor.regex.extractAllInformation(text)
+        self.putSections([(cvPath, sections)])
+        return sections
@@ -0,0 +1,179 @@
+# ===== src/utils/DataDirIndex.py =====
+"""
+Data Directory Index
+Purpose: Scan folder data CV (DATA_DIR/ROLE/*.pdf) sekali saja, lalu dipakai
+         ulang oleh seeder, FileManager, dan ekstraksi batch
+"""
+
+import os
+import random
+import threading
+from pathlib import Path
+
+from config import DATA_DIR
+
+
+class RolePool:
+    """
+    Pool PDF per role yang sudah diacak, ambil satu file = O(1)
+
+    Dipakai seeder supaya setiap CV cuma dipakai sekali tanpa harus
+    memfilter ulang daftar file setiap iterasi.
+    """
+
+    def __init__(self, roleFiles):
+        """
+        Args:
+            roleFiles (dict): role -> list path PDF (sudah diacak)
+        """
+        self.roleFiles = roleFiles
+        self.available = [role for role, files in roleFiles.items() if files]
+
+    def pop(self, role=None):
+        """
+        Ambil satu PDF yang belum dipakai
+
+        Args:
+            role (str): Role tertentu, None = role acak yang masih punya file
+
+        Returns:
+            Path: Path PDF, atau None kalau role tersebut (atau semua role) sudah habis
+        """
+        if role is None:
+            if not self.available:
+                return None
+            role = random.choice(self.available)
+        files = self.roleFiles.get(role)
+        if not files:
+            return None
+        path = files.pop()
+        if not files:
+            self.available.remove(role) # jumlah role kecil, jadi murah
+        return path
+
+    def remaining(self, role=None):
+        if role is not None:
+            return len(self.roleFiles.get(role, ()))
+        return sum(len(files) for files in self.roleFiles.values())
+
+    def __bool__(self):
+        return bool(self.available)
+
+
+class DataDirIndex:
+    """
+    Index isi folder data: role -> daftar PDF (terurut)
+
+    Folder cuma di-scan sekali (pakai os.scandir), panggil refresh()
+    kalau isi folder berubah.
+    """
+
+    def __init__(self, baseDir=None):
+        """
+        Args:
+            baseDir (str): Folder data (default: DATA_DIR)
+        """
+        self.baseDir = Path(baseDir or DATA_DIR)
+        self.roles = None
+        self.lock = threading.Lock()
+
+    def _scan(self):
+        roles = {}
+        if not self.baseDir.is_dir():
+            return roles
+        with os.scandir(self.baseDir) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                with os.scandir(entry.path) as files:
+                    roles[entry.name] = sorted(
+                        Path(f.path) for f in files
+                        if f.is_file() and f.name.lower().endswith(".pdf")
+                    )
+        return dict(sorted(roles.items()))
+
+    def refresh(self):
+        """Scan ulang folder data"""
+        roles = self._scan()
+        with self.lock:
+            self.roles = roles
+        return self
+
+    def _roles(self):
+        with self.lock:
+            if self.roles is None:
+                self.roles = self._scan()
+            return self.roles
+
+    def roleNames(self):
+        """List nama role (subfolder)"""
+        return list(self._roles())
+
+    def files(self, role=None):
+        """
+        List PDF untuk satu role, atau semua role kalau role None
+
+        Returns:
+            list: List Path file PDF (copy, aman diubah)
+        """
+        roles = self._roles()
+        if role is not None:
+            return list(roles.get(role, ()))
+        return [path for files in roles.values() for path in files]
+
+    def cvPath(self, path):
+        """Path PDF -> format cv_path di database ('data/ROLE/x.pdf')"""
+        path = Path(path)
+        return f"data/{path.parent.name}/{path.name}"
+
+    def cvPaths(self, limit=None):
+        """
+        Semua PDF dengan key format cv_path database
+
+        Args:
+            limit (int): Maksimal jumlah PDF (opsional)
+
+        Returns:
+            dict: cv_path -> path lengkap file PDF
+        """
+        paths = {}
+        for path in self.files():
+            paths[self.cvPath(path)] = str(path.resolve())
+            if limit and len(paths) >= limit:
+                break
+        return paths
+
+    def pool(self, exclude=()):
+        """
+        Pool PDF teracak per role untuk diambil satu per satu
+
+        Args:
+            exclude (set): PDF yang sudah dipakai, boleh berupa path lengkap
+                           atau format cv_path 'data/ROLE/x.pdf'
+
+        Returns:
+            RolePool: Pool siap pakai
+        """
+        roleFiles = {}
+        for role, files in self._roles().items():
+            files = [
+                path for path in files
+                if str(path) not in exclude and self.cvPath(path) not in exclude
+            ]
+            random.shuffle(files)
+            roleFiles[role] = files
+        return RolePool(roleFiles)
+
+
+_indexes = {}
+_indexesLock = threading.Lock()
+
+
+def getDataDirIndex(baseDir=None):
+    """Index bersama per folder data (scan cuma terjadi sekali per proses)"""
+    key = Path(baseDir or DATA_DIR).resolve()
+    with _indexesLock:
+        index = _indexes.get(key)
+        if index is None:
+            index = _indexes[key] = DataDirIndex(baseDir)
+        return index
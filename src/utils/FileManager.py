@@ -9,6 +9,8 @@ import shutil
 from pathlib import Path
 import logging
 
+from config import DATA_DIR
+
 class FileManager:
     """
     Kelas untuk manajemen file dan direktori
@@ -108,4 +110,15 @@ class FileManager:
         Returns:
             list: List path file PDF
         """
-        pass
+        from .DataDirIndex import getDataDirIndex
+
+        path = Path(dirPath).resolve()
+        dataDir = Path(DATA_DIR).resolve()
+        # folder data CV (atau satu folder role di dalamnya) pakai index hasil scan sekali
+        if path == dataDir:
+            return [str(p) for p in getDataDirIndex(DATA_DIR).files()]
+        if path.parent == dataDir:
+            return [str(p) for p in getDataDirIndex(DATA_DIR).files(path.name)]
+        if not path.is_dir():
+            return []
+        return sorted(str(p) for p in path.glob("*.pdf") if p.is_file())
@@ -0,0 +1,134 @@
+# ===== src/utils/JobRunner.py =====
+"""
+Background Job Runner untuk GUI Tkinter
+Tujuan: Menjalankan pekerjaan berat (preload, search) di thread terpisah,
+        progress dan hasil dikirim balik ke event loop Tk lewat queue
+"""
+
+import queue
+import logging
+import threading
+
+
+class JobCancelled(Exception):
+    """Dilempar dari dalam job kalau job sudah dibatalkan"""
+
+
+class Job:
+    """
+    Satu pekerjaan background
+
+    Fungsi job menerima objek ini dan memakai:
+    - job.progress(...) : kirim status progress ke GUI
+    - job.partial(...)  : kirim hasil sebagian ke GUI
+    - job.checkCancelled() : berhenti kalau job sudah dibatalkan
+    """
+
+    def __init__(self, name, events, handlers):
+        self.name = name
+        self.events = events
+        self.handlers = handlers
+        self.cancelEvent = threading.Event()
+
+    def cancel(self):
+        self.cancelEvent.set()
+
+    @property
+    def cancelled(self):
+        return self.cancelEvent.is_set()
+
+    def checkCancelled(self):
+        if self.cancelled:
+            raise JobCancelled(self.name)
+
+    def progress(self, *args):
+        self.events.put((self, 'progress', args))
+
+    def partial(self, *args):
+        self.events.put((self, 'partial', args))
+
+
+class JobRunner:
+    """
+    Menjalankan job di thread daemon dan memanggil handler di thread Tk
+
+    Hanya satu job aktif per nama: submit job baru dengan nama yang sama
+    otomatis membatalkan job sebelumnya, dan event dari job yang sudah
+    dibatalkan dibuang sebelum sampai ke GUI.
+    """
+
+    def __init__(self, root, pollMs=50):
+        """
+        Argumen:
+            root (Tk): Root window, dipakai untuk root.after polling
+            pollMs (int): Interval polling queue dalam ms
+        """
+        self.logger = logging.getLogger(__name__)
+        self.root = root
+        self.pollMs = pollMs
+        self.events = queue.Queue()
+        self.active = {}
+        self.root.after(self.pollMs, self._poll)
+
+    def submit(self, name, func, onProgress=None, onPartial=None, onDone=None, onError=None):
+        """
+        Menjalankan func(job) di background
+
+        Argumen:
+            name (str): Nama job (job lama dengan nama sama dibatalkan)
+            func (callable): Fungsi job, menerima Job, return hasil akhir
+            onProgress, onPartial (callable): Handler job.progress / job.partial
+            onDone (callable): Handler hasil akhir
+            onError (callable): Handler exception (default: di-log)
+
+        Mengembalikan:
+            Job: Job yang baru dibuat
+        """
+        self.cancel(name)
+        job = Job(name, self.events, {
+            'progress': onProgress, 'partial': onPartial,
+            'done': onDone, 'error': onError,
+        })
+        self.active[name] = job
+
+        def run():
+            try:
+                result = func(job)
+            except JobCancelled:
+                return
+            except Exception as e:
+                self.events.put((job, 'error', (e,)))
+                return
+            self.events.put((job, 'done', (result,)))
+
+        threading.Thread(target=run, name=f"job-{name}", daemon=True).start()
+        return job
+
+    def cancel(self, name):
+        """Membatalkan job aktif dengan nama tertentu (kalau ada)"""
+        job = self.active.pop(name, None)
+        if job is not None:
+            job.cancel()
+
+    def isRunning(self, name):
+        return name in self.active
+
+    def _poll(self):
+        """Dipanggil di thread Tk: teruskan event dari queue ke handler"""
+        try:
+            while True:
+                job, kind, args = self.events.get_nowait()
+                if job.cancelled:
+                    continue
+                if kind in ('done', 'error') and self.active.get(job.name) is job:
+                    del self.active[job.name]
+                handler = job.handlers.get(kind)
+                if handler is not None:
+                    handler(*args)
+                elif kind == 'error':
+                    self.logger.error(f"Job {job.name} gagal: {args[0]}")
+        except queue.Empty:
+            pass
+        except Exception as e:
+            self.logger.error(f"Handler job error: {e}")
+        self.root.after(self.pollMs, self._poll)
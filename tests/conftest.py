@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# modul di-import sebagai src.* dan config, sama kayak waktu main.py dijalankan dari root repo
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,59 @@
+"""
+Test jalur bytes Boyer-Moore (tabel array 256 entri + searchBytes)
+dibandingkan dengan tabel dict dan pencarian brute force
+"""
+
+import random
+
+from src.algorithm.BoyerMoore import BoyerMoore
+
+
+def bruteForce(text, pattern):
+    return [i for i in range(len(text) - len(pattern) + 1) if text[i:i + len(pattern)] == pattern]
+
+
+def test_bad_character_bytes_table():
+    bm = BoyerMoore()
+    bad = bm.preprocessBadCharacterBytes(b"abca")
+    assert len(bad) == 256
+    assert bad[ord("a")] == 3 and bad[ord("b")] == 1 and bad[ord("c")] == 2
+    assert bad[ord("z")] == -1
+
+
+def test_search_bytes_matches_dict_tables():
+    bm = BoyerMoore()
+    rng = random.Random(0)
+    for _ in range(2000):
+        text = "".join(rng.choice("abc ") for _ in range(rng.randint(0, 60)))
+        pattern = "".join(rng.choice("abc") for _ in range(rng.randint(1, 5)))
+        strTable, bytesTable, encoded = bm.preprocess(pattern)
+        expected = bruteForce(text, pattern)
+        assert bm.searchWithTables(text, pattern, *strTable) == expected
+        assert bm.searchBytes(text.encode(), encoded, *bytesTable) == expected
+        # teks ASCII lewat searchWithTable juga diarahkan ke searchBytes
+        assert bm.searchWithTable(text, pattern, (strTable, bytesTable, encoded)) == expected
+
+
+def test_search_with_table_non_ascii():
+    bm = BoyerMoore()
+    text = "Straße straße 日本語 日本"
+    # teks str non-ASCII pakai tabel dict, posisinya posisi karakter
+    assert bm.searchWithTable(text, "日本", bm.preprocess("日本")) == bruteForce(text, "日本")
+    assert bm.searchWithTable(text, "ße", bm.preprocess("ße")) == bruteForce(text, "ße")
+    # pola non-ASCII di teks ASCII gak mungkin ketemu
+    assert bm.searchWithTable("plain ascii", "é", bm.preprocess("é")) == []
+
+
+def test_search_bytes_input_uses_byte_offsets():
+    bm = BoyerMoore()
+    data = "é日本 日本".encode("utf-8")
+    table = bm.preprocess("日本")
+    expected = bruteForce(data, "日本".encode("utf-8"))
+    assert bm.searchWithTable(data, "日本", table) == expected
+    assert bm.searchWithTable(memoryview(data), "日本", table) == expected
+
+
+def test_search_case_insensitive():
+    bm = BoyerMoore()
+    assert bm.search("SQL sql Sql", "sql", caseSensitive=False) == [0, 4, 8]
+    assert bm.search("SQL sql Sql", "sql") == [4]
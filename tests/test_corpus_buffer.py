@@ -0,0 +1,90 @@
+"""
+Test CorpusBuffer: jumlah kemunculan per CV harus sama dengan KMP per dokumen
+"""
+
+import random
+
+import pytest
+
+from src.algorithm.CorpusBuffer import CorpusBuffer
+from src.algorithm.KnuthMorrisPratt import KnuthMorrisPratt
+
+
+class FindOnly:
+    """Buffer yang cuma punya find (kayak mmap), jadi count() pakai loop find"""
+
+    def __init__(self, data):
+        self.data = data
+
+    def find(self, *args):
+        return self.data.find(*args)
+
+    def __len__(self):
+        return len(self.data)
+
+
+def makeTexts(seed, count=60):
+    rng = random.Random(seed)
+    words = ["python", "Python", "sql", "aaa", "aba", "Straße", "STRASSE", "日本", "data", "é", ""]
+    return {f"data/X/{i}.pdf": " ".join(rng.choice(words) for _ in range(rng.randint(0, 40)))
+            for i in range(count)}
+
+
+def kmpCounts(texts, keyword, caseSensitive):
+    kmp = KnuthMorrisPratt()
+    counts = {}
+    for path, text in texts.items():
+        n = len(kmp.search(text, keyword, caseSensitive))
+        if n:
+            counts[path] = n
+    return counts
+
+
+KEYWORDS = ["python", "SQL", "aa", "aba", "strasse", "ß", "日本", "a", "ta d", "zz"]
+
+
+@pytest.mark.parametrize("caseSensitive", [True, False])
+def test_counts_match_kmp_per_document(caseSensitive):
+    texts = makeTexts(1)
+    buffer = CorpusBuffer.build(texts, caseSensitive)
+    for keyword in KEYWORDS:
+        assert buffer.count(keyword) == kmpCounts(texts, keyword, caseSensitive), keyword
+
+
+@pytest.mark.parametrize("caseSensitive", [True, False])
+def test_find_only_data_matches_bytes(caseSensitive):
+    texts = makeTexts(2)
+    buffer = CorpusBuffer.build(texts, caseSensitive)
+    findOnly = CorpusBuffer(FindOnly(buffer.data), buffer.starts, buffer.paths, caseSensitive)
+    assert findOnly.searchExact(KEYWORDS) == buffer.searchExact(KEYWORDS)
+
+
+def test_search_exact_groups_by_cv():
+    texts = {"a": "python sql python", "b": "", "c": "SQL"}
+    buffer = CorpusBuffer.build(texts, caseSensitive=False)
+    assert buffer.searchExact(["python", "sql", "java"]) == {
+        "a": {"python": 2, "sql": 1},
+        "c": {"sql": 1},
+    }
+
+
+def test_match_never_crosses_documents():
+    texts = {"a": "pyt", "b": "hon"}
+    buffer = CorpusBuffer.build(texts, caseSensitive=True)
+    assert buffer.count("python") == {}
+    assert buffer.count("pyt") == {"a": 1}
+
+
+def test_locate():
+    texts = {"a": "abc", "b": "", "c": "xyz"}
+    buffer = CorpusBuffer.build(texts, caseSensitive=True)
+    pos = buffer.data.find(b"y")
+    assert buffer.locate(pos) == (2, 1)
+
+
+def test_is_built_detects_changed_text():
+    texts = {"a": "python", "b": "sql"}
+    buffer = CorpusBuffer.build(texts)
+    assert buffer.isBuilt(dict(texts))
+    assert not buffer.isBuilt({"a": "python", "b": "java"})
+    assert not buffer.isBuilt({"a": "python"})
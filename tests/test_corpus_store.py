@@ -0,0 +1,88 @@
+"""
+Test CorpusStore: tulis -> buka (mmap) -> cek kadaluarsa, plus hasil search
+dari mmap harus sama dengan CorpusBuffer yang dibangun di memori
+"""
+
+import pytest
+
+from src.algorithm.CorpusBuffer import CorpusBuffer
+from src.pdfprocessor.corpusStore import CorpusStore
+
+TEXTS = {
+    "data/A/1.pdf": "Python developer, SQL and Java",
+    "data/A/2.pdf": "",  # ekstraksi gagal
+    "data/B/3.pdf": "Straße 日本 python PYTHON",
+}
+FINGERPRINTS = {
+    "data/A/1.pdf": "sha1-1",
+    "data/A/2.pdf": ("failed", 123, 456),
+    "data/B/3.pdf": "sha1-3",
+}
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = CorpusStore(tmp_path)
+    store.write(TEXTS, FINGERPRINTS)
+    yield store
+    store.close()
+
+
+def test_open_missing_store(tmp_path):
+    assert not CorpusStore(tmp_path / "none").open(FINGERPRINTS)
+
+
+def test_round_trip(store):
+    assert store.open(FINGERPRINTS)
+    texts = store.texts()
+    assert list(texts) == list(TEXTS)
+    assert len(texts) == len(TEXTS)
+    assert "data/B/3.pdf" in texts and "data/C/9.pdf" not in texts
+    assert {path: texts[path] for path in texts} == TEXTS
+    assert texts.fingerprints() == FINGERPRINTS
+
+
+@pytest.mark.parametrize("change", ["fingerprint", "order", "missing", "extra"])
+def test_stale_store_is_rejected(store, change):
+    expected = dict(FINGERPRINTS)
+    if change == "fingerprint":
+        expected["data/A/1.pdf"] = "sha1-new"
+    elif change == "order":
+        expected = dict(reversed(list(expected.items())))
+    elif change == "missing":
+        del expected["data/B/3.pdf"]
+    else:
+        expected["data/C/9.pdf"] = "sha1-9"
+    assert not store.open(expected)
+    assert not store.isOpen()
+
+
+def test_failed_cv_keeps_store_valid(store):
+    # CV yang gagal diekstrak tetap punya fingerprint, jadi store gak ditulis ulang tiap startup
+    assert CorpusStore(store.directory).open(dict(FINGERPRINTS))
+
+
+@pytest.mark.parametrize("caseSensitive", [True, False])
+def test_mmap_buffer_matches_in_memory(store, caseSensitive):
+    assert store.open(FINGERPRINTS)
+    keywords = ["python", "SQL", "strasse", "日本", "zz"]
+    expected = CorpusBuffer.build(TEXTS, caseSensitive).searchExact(keywords)
+    buffer = store.buffer(caseSensitive)
+    assert buffer.searchExact(keywords) == expected
+    assert buffer.isBuilt(store.texts())
+
+
+def test_rewrite_replaces_open_store(store):
+    assert store.open(FINGERPRINTS)
+    texts = {"data/A/1.pdf": "only one"}
+    store.write(texts, {"data/A/1.pdf": "sha1-x"})
+    assert store.open({"data/A/1.pdf": "sha1-x"})
+    assert dict(store.texts().items()) == texts
+
+
+def test_empty_corpus(tmp_path):
+    store = CorpusStore(tmp_path)
+    store.write({}, {})
+    assert store.open({})
+    assert store.buffer(False).searchExact(["x"]) == {}
+    store.close()
@@ -0,0 +1,101 @@
+"""
+Test engine exact matching satu-pola (Horspool, Sunday, Two-Way, str.find)
+dan pemilihan engine mode AUTO, dibandingkan dengan pencarian brute force
+"""
+
+import random
+
+import pytest
+
+from src.algorithm.AhoCorasick import AhoCorasick
+from src.algorithm.CompiledQuery import CompiledQuery, ENGINES, autoAlgorithm
+from src.algorithm.FoldedText import fold
+
+
+def bruteForce(text, pattern):
+    """Semua posisi kemunculan pola, termasuk yang overlap"""
+    if not pattern:
+        return []
+    return [i for i in range(len(text) - len(pattern) + 1) if text.startswith(pattern, i)]
+
+
+def randomCases(seed, count=1500, alphabet="ab", maxText=40, maxPattern=6):
+    rng = random.Random(seed)
+    for _ in range(count):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, maxText)))
+        pattern = "".join(rng.choice(alphabet) for _ in range(rng.randint(1, maxPattern)))
+        yield text, pattern
+
+
+@pytest.mark.parametrize("name", sorted(ENGINES))
+def test_engine_matches_brute_force(name):
+    engine = ENGINES[name]()
+    # alfabet kecil = banyak pola periodik dan match overlap (kasus sulit Two-Way)
+    for seed, alphabet in enumerate(("ab", "abc", "aßé日")):
+        for text, pattern in randomCases(seed, alphabet=alphabet):
+            table = engine.preprocess(pattern)
+            assert engine.searchWithTable(text, pattern, table) == bruteForce(text, pattern), (text, pattern)
+
+
+@pytest.mark.parametrize("name", sorted(ENGINES))
+def test_engine_case_insensitive_uses_fold(name):
+    engine = ENGINES[name]()
+    text = "Python, PYTHON, pyThon; Straße STRASSE"
+    assert engine.search(text, "python", caseSensitive=False) == bruteForce(fold(text), "python")
+    assert engine.search(text, "STRASSE", caseSensitive=False) == bruteForce(fold(text), "strasse")
+    assert len(engine.search(text, "python", caseSensitive=True)) == 0
+
+
+@pytest.mark.parametrize("name", sorted(ENGINES))
+def test_engine_edge_cases(name):
+    engine = ENGINES[name]()
+    assert engine.search("", "a") == []
+    assert engine.search("abc", "abcd") == []
+    assert engine.search("aaaa", "aa") == [0, 1, 2]
+    assert engine.search("abc", "abc") == [0]
+
+
+def test_two_way_periodic_patterns():
+    engine = ENGINES['TWOWAY']()
+    for pattern in ("aaaa", "abab", "abaab", "abcabcab", "aabaabaa"):
+        text = (pattern * 4)[1:] + pattern + "x" + pattern * 2
+        assert engine.search(text, pattern) == bruteForce(text, pattern), pattern
+
+
+def test_auto_rules():
+    rules = ((3, 'SUNDAY'), (None, 'HORSPOOL'))
+    assert autoAlgorithm("sql", 1, rules, 6) == 'SUNDAY'
+    assert autoAlgorithm("python", 1, rules, 6) == 'HORSPOOL'
+    assert autoAlgorithm("sql", 6, rules, 6) == 'AC'
+    # acMinKeywords = 0 berarti Aho-Corasick gak pernah dipilih otomatis
+    assert autoAlgorithm("sql", 50, rules, 0) == 'SUNDAY'
+
+
+@pytest.mark.parametrize("caseSensitive", [True, False])
+def test_compiled_query_algorithms_agree(caseSensitive):
+    rng = random.Random(7)
+    words = ["Python", "sql", "Java", "javascript", "Straße", "data", "ab", "aba"]
+    text = " ".join(rng.choice(words) for _ in range(300))
+    keywords = ["java", "SQL", "aba", "strasse", "python", "zz"]
+    expected = CompiledQuery(keywords, 'KMP', caseSensitive).searchMultiple(text)
+    for algorithm in list(ENGINES) + ['AC', 'AUTO']:
+        assert CompiledQuery(keywords, algorithm, caseSensitive).searchMultiple(text) == expected, algorithm
+
+
+def test_compiled_query_bm_ascii_text_encoded_once():
+    # teks ASCII di-encode sekali di searchMultiple, keyword non-ASCII tetap gak ketemu
+    text = "sql python sql java pythonic"
+    keywords = ["sql", "python", "café", "java"]
+    query = CompiledQuery(keywords, 'BM')
+    assert query.usesBytes
+    expected = {k: bruteForce(text, k) for k in keywords}
+    assert query.searchMultiple(text) == expected
+    assert not CompiledQuery(keywords, 'KMP').usesBytes
+
+
+def test_aho_corasick_rebuilds_for_other_case_mode():
+    ac = AhoCorasick()
+    ac.preprocessPatterns(["Python", "SQL"], caseSensitive=True)
+    text = "python PYTHON Python sql"
+    assert ac.search(text, caseSensitive=False) == {"Python": [0, 7, 14], "SQL": [21]}
+    assert ac.search(text, caseSensitive=True) == {"Python": [14], "SQL": []}